@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Load-test the module 6 Learning API
+Drives the app in-process through httpx's ASGI transport and/or as a real
+uvicorn server with a weighted mix of requests, then reports throughput and
+p50/p95/p99 latency per route and saves the results as JSON
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from itertools import count
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+
+import httpx  # noqa: E402
+from rich.console import Console  # noqa: E402
+from rich.table import Table  # noqa: E402
+
+console = Console()
+
+DEFAULT_MIX = (
+    "GET /users/{user_id}=4,"
+    "GET /posts/{post_id}=4,"
+    "GET /users/{user_id}/posts=2,"
+    "GET /posts/=1,"
+    "GET /users/=1,"
+    "POST /posts/=1"
+)
+
+ROUTES = (
+    "GET /users/",
+    "GET /users/{user_id}",
+    "GET /users/{user_id}/posts",
+    "GET /posts/",
+    "GET /posts/{post_id}",
+    "POST /users/",
+    "POST /posts/",
+)
+
+
+def parse_mix(spec: str) -> dict:
+    """``"GET /users/=3,POST /posts/=1"`` -> ``{"GET /users/": 3, ...}``"""
+    mix = {}
+    for part in spec.split(","):
+        route, _, weight = part.strip().rpartition("=")
+        if route not in ROUTES:
+            raise SystemExit(
+                f"Unknown route {route!r}; choose from: {', '.join(ROUTES)}"
+            )
+        mix[route] = float(weight)
+    return mix
+
+
+class Workload:
+    """Builds concrete requests for the routes of a mix"""
+
+    def __init__(self, users: int, posts: int, seed: int = 0):
+        self.users = users
+        self.posts = posts
+        self.random = random.Random(seed)
+        self._serial = count()
+
+    def request(self, route: str) -> tuple:
+        """(method, url, json body) for one request to ``route``"""
+        method, path = route.split(" ")
+        body = None
+        if "{user_id}" in path:
+            path = path.format(user_id=self.random.randint(1, self.users))
+        elif "{post_id}" in path:
+            path = path.format(post_id=self.random.randint(1, self.posts))
+        elif route == "POST /users/":
+            name = f"load{os.getpid()}x{next(self._serial)}"
+            body = {
+                "username": name,
+                "email": f"{name}@example.com",
+                "first_name": "Load",
+                "last_name": "Test",
+            }
+        elif route == "POST /posts/":
+            body = {
+                "title": "Load test",
+                "content": "x" * 200,
+                "author_id": self.random.randint(1, self.users),
+            }
+        return method, path, body
+
+
+async def seed(client: httpx.AsyncClient, users: int, posts: int):
+    """Fill an empty database through the bulk endpoints"""
+    rows = [
+        {
+            "username": f"user{n}",
+            "email": f"user{n}@example.com",
+            "first_name": "Seed",
+            "last_name": str(n),
+        }
+        for n in range(users)
+    ]
+    response = await client.post("/users/bulk", json=rows, timeout=None)
+    response.raise_for_status()
+    lines = (
+        json.dumps(
+            {"title": f"Post {n}", "content": "x" * 200, "author_id": 1 + n % users}
+        )
+        for n in range(posts)
+    )
+    response = await client.post(
+        "/posts/bulk",
+        content="\n".join(lines).encode(),
+        headers={"content-type": "application/x-ndjson"},
+        timeout=None,
+    )
+    response.raise_for_status()
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    workload: Workload,
+    mix: dict,
+    concurrency: int,
+    duration: float,
+) -> dict:
+    """Run ``concurrency`` request loops for ``duration`` seconds"""
+    routes, weights = list(mix), list(mix.values())
+    latencies = {route: [] for route in routes}
+    errors = {route: 0 for route in routes}
+    deadline = time.perf_counter() + duration
+
+    async def loop():
+        while time.perf_counter() < deadline:
+            route = workload.random.choices(routes, weights)[0]
+            method, url, body = workload.request(route)
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, url, json=body)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            latencies[route].append(time.perf_counter() - started)
+            errors[route] += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(loop() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    results = {
+        route: summarize(latencies[route], errors[route], elapsed) for route in routes
+    }
+    every = [latency for route in routes for latency in latencies[route]]
+    results["total"] = summarize(every, sum(errors.values()), elapsed)
+    return results
+
+
+def summarize(latencies: list, errors: int, elapsed: float) -> dict:
+    latencies = sorted(latencies)
+
+    def percentile(p: float) -> float:
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+    }
+
+
+async def run_asgi(args, mix: dict, database: str) -> dict:
+    """Benchmark the app in this process (no network, no server)"""
+    from modules.module_6_fastapi_apis.fastapi_apis import create_app
+
+    app = create_app(f"sqlite:///{database}", fast_json=args.fast_json)
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            await seed(client, args.users, args.posts)
+            workload = Workload(args.users, args.posts)
+            return await drive(client, workload, mix, args.concurrency, args.duration)
+
+
+async def run_uvicorn(args, mix: dict, database: str) -> dict:
+    """Benchmark a uvicorn server in a child process over real sockets"""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    env = dict(
+        os.environ,
+        DATABASE_URL=f"sqlite:///{database}",
+        API_FAST_JSON=str(args.fast_json).lower(),
+    )
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "modules.module_6_fastapi_apis.fastapi_apis:app",
+            "--port",
+            str(port),
+            "--workers",
+            str(args.workers),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        cwd=ROOT,
+        env=env,
+    )
+    limits = httpx.Limits(max_connections=args.concurrency)
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", limits=limits
+        ) as client:
+            for _ in range(100):
+                try:
+                    await client.get("/health")
+                    break
+                except httpx.TransportError:
+                    await asyncio.sleep(0.1)
+            else:
+                raise SystemExit("uvicorn did not start")
+            await seed(client, args.users, args.posts)
+            workload = Workload(args.users, args.posts)
+            return await drive(client, workload, mix, args.concurrency, args.duration)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def render(target: str, results: dict, baseline: dict = None):
+    table = Table(
+        title=f"{target}: {results['total']['requests']} requests (latency in ms)"
+    )
+    table.add_column("Route", no_wrap=True)
+    for column in ("Reqs", "Errs", "Req/s", "p50", "p95", "p99"):
+        table.add_column(column, justify="right")
+    if baseline:
+        table.add_column("Δ Req/s", justify="right")
+        table.add_column("Δ p99", justify="right")
+
+    for route, stats in results.items():
+        row = [
+            f"[bold]{route}[/bold]" if route == "total" else route,
+            str(stats["requests"]),
+            str(stats["errors"]),
+            f"{stats['rps']:.0f}",
+            f"{stats['p50_ms']:.1f}",
+            f"{stats['p95_ms']:.1f}",
+            f"{stats['p99_ms']:.1f}",
+        ]
+        if baseline:
+            base = baseline.get(route)
+            row.extend(
+                [
+                    _ratio(stats["rps"], base["rps"]) if base else "",
+                    _ratio(stats["p99_ms"], base["p99_ms"]) if base else "",
+                ]
+            )
+        table.add_row(*row)
+    console.print(table)
+
+
+def _ratio(value: float, base: float) -> str:
+    if not base:
+        return ""
+    change = (value / base - 1) * 100
+    return f"{change:+.0f}%"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--target", choices=["asgi", "uvicorn", "both"], default="both")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10, help="seconds per target")
+    parser.add_argument(
+        "--mix",
+        default=DEFAULT_MIX,
+        help=f"weighted routes (default: {DEFAULT_MIX})",
+    )
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--posts", type=int, default=20000)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers")
+    parser.add_argument("--fast-json", action="store_true", help="API_FAST_JSON")
+    parser.add_argument(
+        "--output",
+        default=".cache/bench_api.json",
+        help="where to save the results as JSON",
+    )
+    parser.add_argument("--compare", help="earlier results JSON to compare against")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    baseline = {}
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())["results"]
+
+    targets = ["asgi", "uvicorn"] if args.target == "both" else [args.target]
+    runners = {"asgi": run_asgi, "uvicorn": run_uvicorn}
+    results = {}
+    for target in targets:
+        with tempfile.TemporaryDirectory(prefix="bench-api-") as scratch:
+            database = str(Path(scratch) / "bench.db")
+            console.print(
+                f"[blue]{target}: {args.concurrency} concurrent clients "
+                f"for {args.duration:.0f}s[/blue]"
+            )
+            results[target] = asyncio.run(runners[target](args, mix, database))
+        render(target, results[target], baseline.get(target))
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "mix": mix,
+            "users": args.users,
+            "posts": args.posts,
+            "workers": args.workers,
+            "fast_json": args.fast_json,
+        },
+        "results": results,
+    }
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    console.print(f"[dim]Saved results to {output}[/dim]")
+
+
+if __name__ == "__main__":
+    main()
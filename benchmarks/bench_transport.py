@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark LinearAPI transports against the local stand-in server
+Compares requests (HTTP/1.1, one connection per concurrent request) with
+httpx over HTTP/2 (all requests multiplexed on one connection)
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "linear_integration"))
+sys.path.append(str(Path(__file__).resolve().parent))
+
+from rich.console import Console  # noqa: E402
+from rich.table import Table  # noqa: E402
+from standin_server import StandInServer  # noqa: E402
+
+console = Console()
+
+
+def run(api, requests_count: int, concurrency: int) -> dict:
+    """Send ``requests_count`` CreateIssue mutations from ``concurrency`` threads"""
+    from linear_api import CREATE_ISSUE_MUTATION
+
+    def send(n):
+        variables = {
+            "title": f"Issue {n}",
+            "description": "benchmark",
+            "teamId": api.config.team_id,
+            "priority": 2,
+        }
+        started = time.perf_counter()
+        api._make_request(CREATE_ISSUE_MUTATION, variables)
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = sorted(executor.map(send, range(requests_count)))
+    elapsed = time.perf_counter() - started
+    return {
+        "elapsed": elapsed,
+        "throughput": requests_count / elapsed,
+        "p50": latencies[len(latencies) // 2],
+        "p99": latencies[int(len(latencies) * 0.99) - 1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument(
+        "--connect-delay",
+        type=float,
+        default=0.01,
+        help="simulated connection setup (TCP+TLS handshake) cost in seconds",
+    )
+    args = parser.parse_args()
+
+    os.environ.setdefault("LINEAR_API_KEY", "benchmark")
+    os.environ.setdefault("LINEAR_TEAM_ID", "benchmark")
+    os.environ["LINEAR_LOG_MODE"] = "quiet"
+    from linear_api import LinearAPI, LinearConfig
+    from transport import HttpxTransport, RequestsTransport
+
+    server = StandInServer(args.latency, args.connect_delay).start()
+    if server.http2_url is None:
+        console.print("[red]HTTP/2 needs h2: pip install 'httpx[http2]'[/red]")
+        return
+
+    table = Table(title=f"{args.requests} CreateIssue requests")
+    for column in ("Transport", "Concurrency", "Req/s", "p50 ms", "p99 ms", "Conns"):
+        table.add_column(column)
+
+    transports = {
+        "requests HTTP/1.1": (RequestsTransport, server.http1_url, "http1"),
+        "httpx HTTP/2": (
+            lambda: HttpxTransport(prior_knowledge=True),
+            server.http2_url,
+            "http2",
+        ),
+    }
+    for concurrency in args.concurrency:
+        for name, (factory, url, protocol) in transports.items():
+            config = LinearConfig.from_env()
+            config.base_url = url
+            # Benchmark the transport, not the client-side rate limiter
+            config.key_requests_per_hour = 10**9
+            transport = factory()
+            api = LinearAPI(config, transport=transport)
+            before = server.connections[protocol]
+            result = run(api, args.requests, concurrency)
+            if hasattr(transport, "close"):
+                transport.close()
+            table.add_row(
+                name,
+                str(concurrency),
+                f"{result['throughput']:.0f}",
+                f"{result['p50'] * 1000:.1f}",
+                f"{result['p99'] * 1000:.1f}",
+                str(server.connections[protocol] - before),
+            )
+
+    console.print(table)
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
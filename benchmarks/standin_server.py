@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Linear GraphQL API
+Serves canned responses over HTTP/1.1 and cleartext HTTP/2 (h2c) with
+configurable response latency and per-connection setup cost, so transports
+can be benchmarked without credentials or network
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+OPERATION_PATTERN = re.compile(r"\b(?:query|mutation)\s+(\w+)")
+
+LABELS = [
+    {"id": f"label-{n}", "name": f"Label {n}", "color": "#3776ab", "description": ""}
+    for n in range(20)
+]
+
+
+def respond(body: dict) -> dict:
+    """Canned GraphQL response for a request body"""
+    match = OPERATION_PATTERN.search(body.get("query", ""))
+    operation = match.group(1) if match else "anonymous"
+    variables = body.get("variables") or {}
+    if operation == "GetLabels":
+        return {"data": {"team": {"labels": {"nodes": LABELS}}}}
+    if operation == "CreateLabel":
+        label = {"id": f"label-{variables.get('name')}", "name": variables.get("name")}
+        return {"data": {"issueLabelCreate": {"success": True, "issueLabel": label}}}
+    if operation == "CreateIssue":
+        issue = {
+            "id": f"issue-{time.monotonic_ns()}",
+            "identifier": "PY-1",
+            "title": variables.get("title"),
+            "url": "",
+        }
+        return {"data": {"issueCreate": {"success": True, "issue": issue}}}
+    if operation in ("GetIssues", "GetIssuesFlat"):
+        page = {"nodes": [], "pageInfo": {"hasNextPage": False, "endCursor": None}}
+        return {"data": {"team": {"issues": page}}}
+    return {"data": {}}
+
+
+class StandInServer:
+    """Runs the HTTP/1.1 and h2c endpoints on background threads"""
+
+    def __init__(
+        self,
+        latency: float = 0.02,
+        connect_delay: float = 0.0,
+        host: str = "127.0.0.1",
+    ):
+        self.latency = latency
+        self.connect_delay = connect_delay
+        self.host = host
+        self.connections = {"http1": 0, "http2": 0}
+        self.http1_url = None
+        self.http2_url = None
+        self._loop = None
+
+    def start(self) -> "StandInServer":
+        self._start_http1()
+        self._start_http2()
+        return self
+
+    def stop(self):
+        self._http1.shutdown()
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+    # HTTP/1.1: one thread per connection, keep-alive
+
+    def _start_http1(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; without this the
+            # baseline pays a delayed-ACK stall on every response
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                server.connections["http1"] += 1
+                time.sleep(server.connect_delay)
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                time.sleep(server.latency)
+                data = json.dumps(respond(body)).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self._http1 = ThreadingHTTPServer((self.host, 0), Handler)
+        self._http1.daemon_threads = True
+        threading.Thread(target=self._http1.serve_forever, daemon=True).start()
+        self.http1_url = f"http://{self.host}:{self._http1.server_address[1]}/graphql"
+
+    # HTTP/2 (prior knowledge, no TLS): one asyncio connection, many streams
+
+    def _start_http2(self):
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            return
+
+        ready = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            listener = self._loop.run_until_complete(
+                self._loop.create_server(lambda: _H2Protocol(self), self.host, 0)
+            )
+            port = listener.sockets[0].getsockname()[1]
+            self.http2_url = f"http://{self.host}:{port}/graphql"
+            ready.set()
+            self._loop.run_forever()
+
+        threading.Thread(target=run, daemon=True).start()
+        ready.wait()
+
+
+class _H2Protocol(asyncio.Protocol):
+    def __init__(self, server: StandInServer):
+        from h2.config import H2Configuration
+        from h2.connection import H2Connection
+
+        self.server = server
+        self.conn = H2Connection(H2Configuration(client_side=False))
+        self.bodies = {}
+        self.ready = False
+        self.pending = []
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.server.connections["http2"] += 1
+        loop = asyncio.get_running_loop()
+        loop.call_later(self.server.connect_delay, self._initiate)
+
+    def _initiate(self):
+        self.ready = True
+        self.conn.initiate_connection()
+        self.transport.write(self.conn.data_to_send())
+        for data in self.pending:
+            self.data_received(data)
+        self.pending = []
+
+    def data_received(self, data: bytes):
+        from h2 import events
+
+        if not self.ready:
+            self.pending.append(data)
+            return
+        for event in self.conn.receive_data(data):
+            if isinstance(event, events.RequestReceived):
+                self.bodies[event.stream_id] = bytearray()
+            elif isinstance(event, events.DataReceived):
+                self.bodies[event.stream_id] += event.data
+                self.conn.acknowledge_received_data(
+                    event.flow_controlled_length, event.stream_id
+                )
+            elif isinstance(event, events.StreamEnded):
+                body = bytes(self.bodies.pop(event.stream_id))
+                asyncio.ensure_future(self._respond(event.stream_id, body))
+            elif isinstance(event, events.ConnectionTerminated):
+                self.transport.close()
+        self.transport.write(self.conn.data_to_send())
+
+    async def _respond(self, stream_id: int, body: bytes):
+        await asyncio.sleep(self.server.latency)
+        data = json.dumps(respond(json.loads(body))).encode()
+        self.conn.send_headers(
+            stream_id,
+            [
+                (":status", "200"),
+                ("content-type", "application/json"),
+                ("content-length", str(len(data))),
+            ],
+        )
+        # Canned responses fit in the default 64 KiB flow-control window
+        size = self.conn.max_outbound_frame_size
+        for start in range(0, len(data), size):
+            self.conn.send_data(stream_id, data[start : start + size])
+        self.conn.end_stream(stream_id)
+        self.transport.write(self.conn.data_to_send())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds")
+    parser.add_argument("--connect-delay", type=float, default=0.0, help="seconds")
+    args = parser.parse_args()
+
+    server = StandInServer(args.latency, args.connect_delay).start()
+    print(f"HTTP/1.1: {server.http1_url}")
+    print(f"HTTP/2 (h2c): {server.http2_url or 'unavailable (pip install h2)'}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
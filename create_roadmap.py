@@ -40,7 +40,7 @@ def main():
 
         # Ask user if they want to create all modules
         choice = console.input(
-            "\n[bold]Would you like to create all 10 modules with sub-tasks? (y/n): [/bold]"
+            "\n[bold]Would you like to create every module under modules/ with sub-tasks? (y/n): [/bold]"
         )
 
         if choice.lower() == "y":
@@ -0,0 +1,288 @@
+"""
+Roadmap progress analytics
+Loads issue snapshots into pandas frames and keeps per-module and per-label
+completion, throughput and cycle-time aggregates up to date incrementally
+"""
+
+import io
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable
+
+import numpy as np
+import pandas as pd
+from filters import IssueFilter
+from linear_api import LinearAPI, console
+from models import Issue
+from rich.table import Table
+
+COLUMNS = [
+    "identifier",
+    "title",
+    "parent_id",
+    "state",
+    "state_type",
+    "labels",
+    "created_at",
+    "updated_at",
+    "started_at",
+    "completed_at",
+]
+TIMESTAMPS = ["created_at", "updated_at", "started_at", "completed_at"]
+AGGREGATES = ["total", "done", "cycle_days_sum", "cycle_days_count"]
+
+# Bump when the stored layout changes; older stores are rebuilt by a full sync
+STORE_VERSION = 1
+
+
+def issues_frame(issues: Iterable) -> pd.DataFrame:
+    """Build a columnar frame (indexed by issue id) from issues or GraphQL nodes"""
+    records = []
+    for issue in issues:
+        if not isinstance(issue, Issue):
+            issue = Issue.from_node(issue)
+        records.append(
+            (
+                issue.id,
+                issue.identifier,
+                issue.title,
+                issue.parent.id if issue.parent else None,
+                issue.state_name,
+                issue.state.type if issue.state else None,
+                issue.label_names,
+                issue.created_at,
+                issue.updated_at,
+                issue.started_at,
+                issue.completed_at,
+            )
+        )
+    frame = pd.DataFrame.from_records(records, columns=["id"] + COLUMNS)
+    frame = frame.set_index("id")
+    for column in TIMESTAMPS:
+        frame[column] = pd.to_datetime(frame[column], utc=True, errors="coerce")
+    return frame
+
+
+def _derive(frame: pd.DataFrame, known: pd.DataFrame) -> pd.DataFrame:
+    """Add module, done and cycle-time columns to a batch of rows"""
+    frame = frame.copy()
+    frame["done"] = (frame["state_type"] == "completed") | frame["completed_at"].notna()
+
+    started = frame["started_at"].fillna(frame["created_at"])
+    cycle = (frame["completed_at"] - started).dt.total_seconds() / 86400
+    frame["cycle_days"] = cycle.where(frame["done"])
+
+    # Walk parent links (vectorized per level) up to the top-level module
+    parents = pd.concat([known["parent_id"], frame["parent_id"]])
+    parents = parents[~parents.index.duplicated(keep="last")]
+    identifiers = pd.concat([known["identifier"], frame["identifier"]])
+    identifiers = identifiers[~identifiers.index.duplicated(keep="last")]
+    root = pd.Series(frame.index, index=frame.index)
+    for _ in range(10):
+        parent = root.map(parents)
+        has_parent = parent.notna() & parent.isin(parents.index)
+        if not has_parent.any():
+            break
+        root = root.where(~has_parent, parent)
+    frame["module"] = root.map(identifiers)
+    return frame
+
+
+def _contributions(rows: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """Aggregate contributions of a batch of derived rows"""
+    if rows.empty:
+        empty = pd.DataFrame(columns=AGGREGATES, dtype=float)
+        return {"modules": empty, "labels": empty, "weekly": pd.Series(dtype=float)}
+
+    def aggregate(frame, key):
+        return frame.groupby(key).agg(
+            total=("done", "size"),
+            done=("done", "sum"),
+            cycle_days_sum=("cycle_days", "sum"),
+            cycle_days_count=("cycle_days", "count"),
+        )
+
+    labelled = rows.explode("labels").dropna(subset=["labels"])
+    completed = rows.loc[rows["done"] & rows["completed_at"].notna(), "completed_at"]
+    weeks = completed.dt.tz_localize(None).dt.to_period("W").dt.start_time
+    # A module issue tracks its sub-issues; it does not count towards itself
+    children = rows[rows["parent_id"].notna()]
+    return {
+        "modules": aggregate(children, "module").astype(float),
+        "labels": aggregate(labelled, "labels").astype(float),
+        "weekly": weeks.value_counts().astype(float),
+    }
+
+
+def _to_table(data) -> Dict:
+    """``data`` in pandas' JSON table layout, which keeps dtypes and index names"""
+    return json.loads(data.to_json(orient="table", date_format="iso"))
+
+
+def _from_table(stored: Dict) -> pd.DataFrame:
+    return pd.read_json(io.StringIO(json.dumps(stored)), orient="table")
+
+
+class RoadmapAnalytics:
+    """Incrementally maintained roadmap progress aggregates
+
+    ``apply`` upserts changed issues: their previous contribution is
+    subtracted and the new one added, so reports never rescan history.
+    """
+
+    def __init__(self, store_path: str = ".cache/roadmap_analytics.json"):
+        self.store_path = Path(store_path)
+        self.frame = pd.DataFrame(columns=COLUMNS)
+        self.modules = pd.DataFrame(columns=AGGREGATES, dtype=float)
+        self.labels = pd.DataFrame(columns=AGGREGATES, dtype=float)
+        self.weekly = pd.Series(dtype=float)
+        self.watermark = None
+        if self.store_path.exists():
+            self._load()
+
+    def _load(self):
+        """Restore a saved store; an unreadable or older one is ignored"""
+        try:
+            state = json.loads(self.store_path.read_text())
+        except ValueError:
+            return
+        if state.get("version") != STORE_VERSION:
+            return
+        self.frame = _from_table(state["frame"])
+        self.frame["labels"] = self.frame["labels"].map(tuple)
+        self.modules = _from_table(state["modules"])
+        self.labels = _from_table(state["labels"])
+        self.weekly = _from_table(state["weekly"])["values"].rename(None)
+        if state["watermark"]:
+            self.watermark = pd.Timestamp(state["watermark"])
+
+    def save(self):
+        """Persist the snapshot and aggregates as JSON"""
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            key: _to_table(getattr(self, key))
+            for key in ("frame", "modules", "labels", "weekly")
+        }
+        state["version"] = STORE_VERSION
+        state["watermark"] = self.watermark.isoformat() if self.watermark else None
+        self.store_path.write_text(json.dumps(state))
+
+    def _adjust(self, old: Dict, new: Dict = None):
+        """Subtract ``old`` contributions from the aggregates and add ``new``"""
+        for key in ("modules", "labels", "weekly"):
+            updated = getattr(self, key).sub(old[key], fill_value=0)
+            if new is not None:
+                updated = updated.add(new[key], fill_value=0)
+            setattr(self, key, updated)
+
+    def apply(self, snapshot: pd.DataFrame):
+        """Upsert a frame of new or changed issues into the aggregates"""
+        if snapshot.empty:
+            return
+        rows = _derive(snapshot, self.frame)
+        previous = self.frame.loc[self.frame.index.intersection(rows.index)]
+
+        self._adjust(_contributions(previous), _contributions(rows))
+
+        if self.frame.empty:
+            self.frame = rows
+        else:
+            self.frame = pd.concat([self.frame.drop(previous.index), rows])
+        latest = rows["updated_at"].max()
+        if pd.notna(latest) and (self.watermark is None or latest > self.watermark):
+            self.watermark = latest
+
+    def remove(self, ids: Iterable[str]):
+        """Drop issues (e.g. deleted in Linear) and their contribution"""
+        gone = self.frame.loc[self.frame.index.intersection(list(ids))]
+        if gone.empty:
+            return
+        self._adjust(_contributions(gone))
+        self.frame = self.frame.drop(gone.index)
+
+    def refresh(self, api: LinearAPI, full: bool = False):
+        """Fetch issues changed since the last refresh
+
+        The first refresh, or one with ``full``, fetches every issue and drops
+        the ones Linear no longer returns, since deletions never show up as
+        updates.
+        """
+        full = full or self.watermark is None
+        issue_filter = None
+        if not full:
+            issue_filter = IssueFilter().updated(after=self.watermark.isoformat())
+        snapshot = issues_frame(api.iter_issues(as_models=True, filter=issue_filter))
+        if full:
+            self.remove(self.frame.index.difference(snapshot.index))
+        self.apply(snapshot)
+        self.save()
+
+    def module_report(self) -> pd.DataFrame:
+        return self._report(self.modules)
+
+    def label_report(self) -> pd.DataFrame:
+        return self._report(self.labels)
+
+    def throughput(self, weeks: int = 8) -> pd.Series:
+        """Issues completed per week over the last ``weeks`` weeks"""
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        start = pd.Timestamp(now).to_period("W").start_time - pd.Timedelta(
+            weeks=weeks - 1
+        )
+        index = pd.date_range(start, periods=weeks, freq="7D")
+        return self.weekly.reindex(index, fill_value=0).astype(int)
+
+    @staticmethod
+    def _report(aggregates: pd.DataFrame) -> pd.DataFrame:
+        report = aggregates[aggregates["total"] > 0].copy()
+        report["completion"] = report["done"] / report["total"]
+        report["mean_cycle_days"] = report["cycle_days_sum"] / report[
+            "cycle_days_count"
+        ].replace(0, np.nan)
+        report = report[["total", "done", "completion", "mean_cycle_days"]]
+        return report.astype({"total": int, "done": int}).sort_index()
+
+
+def _print_report(title: str, report: pd.DataFrame, key: str):
+    table = Table(title=title)
+    table.add_column(key, style="cyan")
+    table.add_column("Done", style="green")
+    table.add_column("Completion", style="magenta")
+    table.add_column("Mean cycle (days)", style="yellow")
+    for name, row in report.iterrows():
+        cycle = row["mean_cycle_days"]
+        table.add_row(
+            str(name),
+            f"{row['done']}/{row['total']}",
+            f"{row['completion']:.0%}",
+            "-" if pd.isna(cycle) else f"{cycle:.1f}",
+        )
+    console.print(table)
+
+
+def main():
+    """Refresh the analytics snapshot and print progress reports"""
+    try:
+        analytics = RoadmapAnalytics()
+        analytics.refresh(LinearAPI())
+
+        _print_report("Progress by Module", analytics.module_report(), "Module")
+        _print_report("Progress by Label", analytics.label_report(), "Label")
+
+        table = Table(title="Weekly Throughput")
+        table.add_column("Week", style="cyan")
+        table.add_column("Completed", style="green")
+        for week, count in analytics.throughput().items():
+            table.add_row(week.strftime("%Y-%m-%d"), str(count))
+        console.print(table)
+
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        console.print(
+            "[yellow]Make sure your Linear API credentials are correctly set in the .env file.[/yellow]"
+        )
+
+
+if __name__ == "__main__":
+    main()
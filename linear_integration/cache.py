@@ -0,0 +1,188 @@
+"""
+Read-through response cache for Linear API queries
+Bounded LRU storage with per-operation TTLs, in memory or on disk (SQLite)
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+# Read operations whose cached responses each mutation makes stale
+INVALIDATIONS = {
+    "CreateLabel": ("GetLabels",),
+    "CreateIssue": ("GetIssues", "GetIssuesFlat"),
+    "UpdateIssue": ("GetIssues", "GetIssuesFlat"),
+    "DeleteIssue": ("GetIssues", "GetIssuesFlat"),
+    "OutboxBatch": ("GetLabels", "GetIssues", "GetIssuesFlat"),
+}
+
+
+class MemoryBackend:
+    """In-process LRU store"""
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            operation, value, expires = entry
+            if expires < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, operation: str, value: Dict, ttl: float):
+        with self._lock:
+            self._entries[key] = (operation, value, time.time() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, operations: Iterable[str]):
+        operations = set(operations)
+        with self._lock:
+            for key in [k for k, v in self._entries.items() if v[0] in operations]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskBackend:
+    """SQLite-backed LRU store that survives between runs"""
+
+    def __init__(self, path: str, max_entries: int = 4096):
+        self.max_entries = max_entries
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    operation TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    expires REAL NOT NULL,
+                    accessed REAL NOT NULL
+                )
+                """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+            )
+
+    def get(self, key: str) -> Optional[Dict]:
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] < now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+            )
+        return json.loads(row[0])
+
+    def set(self, key: str, operation: str, value: Dict, ttl: float):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, operation, json.dumps(value), now + ttl, now),
+            )
+            self._conn.execute(
+                """
+                DELETE FROM responses WHERE key IN (
+                    SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+
+    def invalidate(self, operations: Iterable[str]):
+        operations = list(operations)
+        placeholders = ", ".join("?" for _ in operations)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"DELETE FROM responses WHERE operation IN ({placeholders})",
+                operations,
+            )
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+
+class ResponseCache:
+    """Per-operation TTL cache in front of a storage backend
+
+    Each read operation has a generation counter that mutations bump, so a
+    read which started before a write can never store its (stale) result.
+    """
+
+    def __init__(self, backend, ttls: Dict[str, float] = None, default_ttl=60.0):
+        self.backend = backend
+        self.ttls = ttls or {}
+        self.default_ttl = default_ttl
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def generation(self, operation: str) -> int:
+        """Current generation of a read operation"""
+        return self._generations.get(operation, 0)
+
+    def get(self, operation: str, key: str) -> Optional[Dict]:
+        """Return a cached response or None"""
+        if self.ttls.get(operation, self.default_ttl) <= 0:
+            return None
+        return self.backend.get(key)
+
+    def put(self, operation: str, key: str, value: Dict, generation: int):
+        """Store a response unless a mutation happened since ``generation``"""
+        ttl = self.ttls.get(operation, self.default_ttl)
+        with self._lock:
+            if ttl <= 0 or generation != self.generation(operation):
+                return
+            self.backend.set(key, operation, value, ttl)
+
+    def invalidate_for(self, mutation: str):
+        """Drop every cached read that ``mutation`` may have changed"""
+        operations = INVALIDATIONS.get(mutation, ())
+        if not operations:
+            return
+        with self._lock:
+            for operation in operations:
+                self._generations[operation] = self.generation(operation) + 1
+            self.backend.invalidate(operations)
+
+    def clear(self):
+        """Drop every cached response"""
+        self.backend.clear()
+
+
+def build_cache(
+    backend: str, path: str, ttls: Dict[str, float], max_entries: int
+) -> Optional[ResponseCache]:
+    """Create a ResponseCache for the "memory" or "disk" backend ("" disables it)"""
+    if not backend:
+        return None
+    if backend == "memory":
+        return ResponseCache(MemoryBackend(max_entries), ttls)
+    if backend == "disk":
+        return ResponseCache(DiskBackend(path, max_entries), ttls)
+    raise ValueError(f"Unknown LINEAR_CACHE backend: {backend}")
@@ -0,0 +1,122 @@
+"""
+Typed filter builder for Linear issue queries
+Compiles to Linear's GraphQL IssueFilter input so filtering happens server-side
+"""
+
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Union
+
+DateLike = Union[str, date, datetime]
+
+
+def _timestamp(value: DateLike) -> str:
+    return value.isoformat() if isinstance(value, (date, datetime)) else value
+
+
+def _range(after: DateLike = None, before: DateLike = None) -> Dict:
+    comparator = {}
+    if after is not None:
+        comparator["gte"] = _timestamp(after)
+    if before is not None:
+        comparator["lte"] = _timestamp(before)
+    return comparator
+
+
+class IssueFilter:
+    """Chainable builder for ``issues(filter: ...)``
+
+    Example: all Python Advanced sub-issues that are not done::
+
+        IssueFilter().label("Python Advanced").has_parent().state_not("Done")
+
+    Conditions are combined with AND.
+    """
+
+    def __init__(self):
+        self._conditions: List[Dict] = []
+
+    def _add(self, condition: Dict) -> "IssueFilter":
+        self._conditions.append(condition)
+        return self
+
+    def label(self, name: str) -> "IssueFilter":
+        """Issues carrying the label ``name``"""
+        return self._add({"labels": {"name": {"eq": name}}})
+
+    def labels_any(self, names: Iterable[str]) -> "IssueFilter":
+        """Issues carrying at least one of ``names``"""
+        return self._add({"labels": {"name": {"in": list(names)}}})
+
+    def state(self, name: str) -> "IssueFilter":
+        """Issues in the workflow state ``name``"""
+        return self._add({"state": {"name": {"eq": name}}})
+
+    def state_not(self, name: str) -> "IssueFilter":
+        """Issues not in the workflow state ``name``"""
+        return self._add({"state": {"name": {"neq": name}}})
+
+    def state_type(self, state_type: str) -> "IssueFilter":
+        """Issues whose state is of ``state_type`` (e.g. "completed", "started")"""
+        return self._add({"state": {"type": {"eq": state_type}}})
+
+    def parent(self, issue_id: str) -> "IssueFilter":
+        """Direct children of ``issue_id``"""
+        return self._add({"parent": {"id": {"eq": issue_id}}})
+
+    def ids(self, issue_ids: Iterable[str]) -> "IssueFilter":
+        """Issues with one of the given IDs"""
+        return self._add({"id": {"in": list(issue_ids)}})
+
+    def numbers(self, numbers: Iterable[int]) -> "IssueFilter":
+        """Issues with one of the given team-scoped numbers (ENG-123 -> 123)"""
+        return self._add({"number": {"in": list(numbers)}})
+
+    def any_of(self, *filters: "IssueFilter") -> "IssueFilter":
+        """Issues matching at least one of ``filters``"""
+        return self._add({"or": [f.build() for f in filters if f]})
+
+    def has_parent(self, value: bool = True) -> "IssueFilter":
+        """Sub-issues only (or top-level issues only with ``value=False``)"""
+        return self._add({"parent": {"null": not value}})
+
+    def priority(
+        self, eq: int = None, lte: int = None, gte: int = None
+    ) -> "IssueFilter":
+        """Issues matching a priority (0 none, 1 urgent ... 4 low)"""
+        comparator = {
+            key: value
+            for key, value in (("eq", eq), ("lte", lte), ("gte", gte))
+            if value is not None
+        }
+        return self._add({"priority": comparator})
+
+    def title_contains(self, text: str) -> "IssueFilter":
+        """Issues whose title contains ``text`` (case-insensitive)"""
+        return self._add({"title": {"containsIgnoreCase": text}})
+
+    def created(self, after: DateLike = None, before: DateLike = None) -> "IssueFilter":
+        """Issues created within the (inclusive) range"""
+        return self._add({"createdAt": _range(after, before)})
+
+    def updated(self, after: DateLike = None, before: DateLike = None) -> "IssueFilter":
+        """Issues updated within the (inclusive) range"""
+        return self._add({"updatedAt": _range(after, before)})
+
+    def build(self) -> Dict:
+        """Compile to a GraphQL ``IssueFilter`` input value"""
+        if len(self._conditions) == 1:
+            return self._conditions[0]
+        fields = [next(iter(condition)) for condition in self._conditions]
+        if len(set(fields)) == len(fields):
+            # No field used twice: a single object is an implicit AND
+            merged = {}
+            for condition in self._conditions:
+                merged.update(condition)
+            return merged
+        return {"and": list(self._conditions)}
+
+    def __bool__(self) -> bool:
+        return bool(self._conditions)
+
+    def __repr__(self) -> str:
+        return f"IssueFilter({self.build()!r})"
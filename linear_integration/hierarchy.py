@@ -0,0 +1,109 @@
+"""
+In-memory issue hierarchy index
+Built from flat issue lists (parent.id only) for O(1) parent/children lookups
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from models import Issue
+
+
+class IssueIndex:
+    """Parent/children index over a flat list of issues
+
+    Accepts ``Issue`` models or raw GraphQL issue nodes. Issues whose parent
+    is not part of the index are treated as roots (modules).
+    """
+
+    def __init__(self, issues: Iterable = ()):
+        self._issues: Dict[str, Issue] = {}
+        self._parent: Dict[str, str] = {}
+        self._children: Dict[str, List[str]] = {}
+        for issue in issues:
+            self.add(issue)
+
+    def add(self, issue) -> Issue:
+        """Add or replace an issue in the index"""
+        if not isinstance(issue, Issue):
+            issue = Issue.from_node(issue)
+        if issue.id in self._issues:
+            self.remove(issue.id)
+
+        self._issues[issue.id] = issue
+        if issue.parent is not None:
+            self._parent[issue.id] = issue.parent.id
+            self._children.setdefault(issue.parent.id, []).append(issue.id)
+        return issue
+
+    def remove(self, issue_id: str):
+        """Remove an issue; its children stay indexed under the same parent id"""
+        self._issues.pop(issue_id, None)
+        parent_id = self._parent.pop(issue_id, None)
+        if parent_id is not None:
+            siblings = self._children.get(parent_id, [])
+            if issue_id in siblings:
+                siblings.remove(issue_id)
+
+    def __len__(self) -> int:
+        return len(self._issues)
+
+    def __contains__(self, issue_id: str) -> bool:
+        return issue_id in self._issues
+
+    def __iter__(self) -> Iterator[Issue]:
+        return iter(self._issues.values())
+
+    def get(self, issue_id: str) -> Optional[Issue]:
+        return self._issues.get(issue_id)
+
+    def parent(self, issue_id: str) -> Optional[Issue]:
+        """The parent issue, or None for roots"""
+        return self._issues.get(self._parent.get(issue_id))
+
+    def children(self, issue_id: str) -> List[Issue]:
+        """Direct children of an issue"""
+        issues = self._issues
+        return [issues[c] for c in self._children.get(issue_id, ()) if c in issues]
+
+    def roots(self) -> List[Issue]:
+        """Issues without an indexed parent (top-level modules)"""
+        return [
+            issue
+            for issue_id, issue in self._issues.items()
+            if self._parent.get(issue_id) not in self._issues
+        ]
+
+    def root_of(self, issue_id: str) -> Optional[Issue]:
+        """The top-level ancestor of an issue"""
+        current = issue_id
+        seen = set()
+        while self._parent.get(current) in self._issues and current not in seen:
+            seen.add(current)
+            current = self._parent[current]
+        return self._issues.get(current)
+
+    def iter_subtree(self, issue_id: str, include_root: bool = True) -> Iterator[Issue]:
+        """Depth-first iteration over an issue and all its descendants"""
+        stack = [issue_id]
+        seen = set()
+        while stack:
+            current = stack.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            issue = self._issues.get(current)
+            if issue is not None and (include_root or current != issue_id):
+                yield issue
+            stack.extend(reversed(self._children.get(current, ())))
+
+    def rollup(self, issue_id: str) -> Counter:
+        """Count of descendants per state name"""
+        return Counter(
+            issue.state_name
+            for issue in self.iter_subtree(issue_id, include_root=False)
+        )
+
+    def module_rollups(self) -> Dict[str, Counter]:
+        """State counts of every root's subtree, keyed by root identifier"""
+        return {root.identifier: self.rollup(root.id) for root in self.roots()}
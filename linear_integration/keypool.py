@@ -0,0 +1,198 @@
+"""
+API-key pool for the Linear API client
+Spreads requests over several keys (each with its own rate-limit bucket) using
+client-side token buckets, least-loaded selection and cooldown of throttled keys
+"""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional
+
+from transport import TransportError
+
+# Linear allows 1,500 requests per hour per API key
+DEFAULT_REQUESTS_PER_HOUR = 1500
+
+
+class RateLimitedError(TransportError):
+    """Raised when every key in the pool is throttled for longer than allowed"""
+
+    def __init__(self, retry_in: float):
+        super().__init__(
+            f"All Linear API keys are rate limited; retry in {retry_in:.0f}s"
+        )
+        self.retry_in = retry_in
+
+
+def is_rate_limited(response) -> bool:
+    """True for HTTP 429 or a GraphQL RATELIMITED error (sent as HTTP 400)"""
+    if response.status_code == 429:
+        return True
+    if response.status_code != 400:
+        return False
+    try:
+        errors = response.json().get("errors") or []
+    except ValueError:
+        return False
+    return any(
+        (error.get("extensions") or {}).get("code") == "RATELIMITED" for error in errors
+    )
+
+
+def retry_after(headers) -> Optional[float]:
+    """Seconds until a throttled key may be used again, from response headers"""
+    value = headers.get("Retry-After")
+    if value:
+        try:
+            return float(value)
+        except ValueError:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    reset = headers.get("X-RateLimit-Requests-Reset")
+    if reset:
+        # Epoch milliseconds
+        return max(0.0, float(reset) / 1000 - time.time())
+    return None
+
+
+class PooledKey:
+    """One API key with its token bucket and usage counters"""
+
+    __slots__ = (
+        "api_key",
+        "rate",
+        "capacity",
+        "tokens",
+        "updated",
+        "cooldown_until",
+        "in_flight",
+        "requests",
+        "throttled",
+        "failures",
+        "latency_total",
+    )
+
+    def __init__(self, api_key: str, requests_per_hour: float):
+        self.api_key = api_key
+        self.rate = requests_per_hour / 3600
+        self.capacity = float(requests_per_hour)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.cooldown_until = 0.0
+        self.in_flight = 0
+        self.requests = 0
+        self.throttled = 0
+        self.failures = 0
+        self.latency_total = 0.0
+
+    @property
+    def label(self) -> str:
+        """Masked key for logs and metrics"""
+        return f"…{self.api_key[-4:]}"
+
+    def refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def available_in(self, now: float) -> float:
+        """Seconds until this key can take another request"""
+        waiting_for_tokens = max(0.0, (1 - self.tokens) / self.rate)
+        return max(self.cooldown_until - now, waiting_for_tokens)
+
+
+class KeyPool:
+    """Thread-safe pool of API keys
+
+    ``acquire`` picks the ready key with the fewest requests in flight (ties
+    go to the fullest bucket) and blocks, up to ``max_wait`` seconds, while
+    every key is empty or cooling down. Report the outcome with ``release``.
+    """
+
+    def __init__(
+        self,
+        api_keys: List[str],
+        requests_per_hour: float = DEFAULT_REQUESTS_PER_HOUR,
+        cooldown: float = 60.0,
+        max_wait: float = 60.0,
+    ):
+        if not api_keys:
+            raise ValueError("KeyPool needs at least one API key")
+        self.keys = [PooledKey(key, requests_per_hour) for key in api_keys]
+        self.cooldown = cooldown
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def acquire(self) -> PooledKey:
+        """Reserve a token on the least-loaded available key"""
+        deadline = time.monotonic() + self.max_wait
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                ready = []
+                for key in self.keys:
+                    key.refill(now)
+                    if key.cooldown_until <= now and key.tokens >= 1:
+                        ready.append(key)
+                if ready:
+                    key = min(ready, key=lambda k: (k.in_flight, -k.tokens))
+                    key.tokens -= 1
+                    key.in_flight += 1
+                    key.requests += 1
+                    return key
+                wait = min(key.available_in(now) for key in self.keys)
+            if now + wait > deadline:
+                raise RateLimitedError(wait)
+            time.sleep(wait)
+
+    def release(
+        self,
+        key: PooledKey,
+        latency: float = None,
+        throttled: bool = False,
+        failed: bool = False,
+        cooldown: float = None,
+        remaining: int = None,
+    ):
+        """Record the outcome of a request made with ``key``
+
+        A throttled key is benched for ``cooldown`` seconds (the pool default
+        when the server did not say). ``remaining`` is the server's count of
+        requests left, used to keep the local bucket honest.
+        """
+        with self._lock:
+            key.in_flight -= 1
+            if latency is not None:
+                key.latency_total += latency
+            if failed:
+                key.failures += 1
+            if throttled:
+                key.throttled += 1
+                key.tokens = 0.0
+                key.cooldown_until = time.monotonic() + (
+                    self.cooldown if cooldown is None else cooldown
+                )
+            elif remaining is not None:
+                key.tokens = min(key.tokens, float(remaining))
+
+    def metrics(self) -> List[Dict]:
+        """Per-key usage counters"""
+        with self._lock:
+            now = time.monotonic()
+            return [
+                {
+                    "key": key.label,
+                    "requests": key.requests,
+                    "throttled": key.throttled,
+                    "failures": key.failures,
+                    "in_flight": key.in_flight,
+                    "tokens": round(key.tokens, 1),
+                    "cooling_for": round(max(0.0, key.cooldown_until - now), 1),
+                    "mean_latency": (
+                        key.latency_total / key.requests if key.requests else None
+                    ),
+                }
+                for key in self.keys
+            ]
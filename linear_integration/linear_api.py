@@ -3,20 +3,228 @@ Linear API Integration Script
 A comprehensive script for managing Python learning roadmap tasks in Linear
 """
 
+import asyncio
 import os
-from dataclasses import dataclass
-from typing import Dict, List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import requests
+from cache import build_cache
 from dotenv import load_dotenv
-from rich.console import Console
+from filters import IssueFilter
+from hierarchy import IssueIndex
+from keypool import (
+    DEFAULT_REQUESTS_PER_HOUR,
+    KeyPool,
+    RateLimitedError,
+    is_rate_limited,
+    retry_after,
+)
+from loader import IssueLoader
+from models import issues_from_nodes, labels_from_nodes
+from outbox import Outbox, OutboxHandle
+from paging import (
+    AdaptivePager,
+    QueryComplexityError,
+    is_complexity_error,
+    reported_complexity,
+)
+from reporting import console, reporter
+from resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    LatencyTracker,
+    hedged_call,
+    operation_name,
+    parse_timeouts,
+)
 from rich.panel import Panel
 from rich.table import Table
+from schema import SchemaValidator
+from singleflight import AsyncSingleFlight, SingleFlight, request_key
+from transport import TransportError, transport_from_env
 
 # Load environment variables
 load_dotenv()
 
-console = Console()
+
+CREATE_LABEL_MUTATION = """
+mutation CreateLabel($name: String!, $color: String!, $description: String, $teamId: String!) {
+    issueLabelCreate(input: {
+        name: $name,
+        color: $color,
+        description: $description,
+        teamId: $teamId
+    }) {
+        success
+        issueLabel {
+            id
+            name
+            color
+        }
+    }
+}
+"""
+
+GET_LABELS_QUERY = """
+query GetLabels($teamId: String!) {
+    team(id: $teamId) {
+        labels {
+            nodes {
+                id
+                name
+                color
+                description
+            }
+        }
+    }
+}
+"""
+
+CREATE_ISSUE_MUTATION = """
+mutation CreateIssue($title: String!, $description: String!, $teamId: String!,
+                   $labelIds: [String!], $parentId: String, $priority: Int!) {
+    issueCreate(input: {
+        title: $title,
+        description: $description,
+        teamId: $teamId,
+        labelIds: $labelIds,
+        parentId: $parentId,
+        priority: $priority
+    }) {
+        success
+        issue {
+            id
+            identifier
+            title
+            url
+        }
+    }
+}
+"""
+
+UPDATE_ISSUE_MUTATION = """
+mutation UpdateIssue($id: String!, $title: String, $description: String, $stateId: String) {
+    issueUpdate(id: $id, input: {
+        title: $title,
+        description: $description,
+        stateId: $stateId
+    }) {
+        success
+    }
+}
+"""
+
+DELETE_ISSUE_MUTATION = """
+mutation DeleteIssue($id: String!) {
+    issueDelete(id: $id) {
+        success
+    }
+}
+"""
+
+ISSUES_QUERY_TEMPLATE = """
+query __NAME__($teamId: String!, $first: Int!, $after: String, $filter: IssueFilter) {
+    team(id: $teamId) {
+        issues(first: $first, after: $after, filter: $filter) {
+            nodes {
+                id
+                identifier
+                title
+                description
+                priority
+                createdAt
+                updatedAt
+                startedAt
+                completedAt
+                state {
+                    name
+                    type
+                }
+                labels {
+                    nodes {
+                        name
+                        color
+                    }
+                }
+                __HIERARCHY__
+            }
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+        }
+    }
+}
+"""
+
+# Nested: every child is shipped twice, once inside its parent
+ISSUES_QUERY = ISSUES_QUERY_TEMPLATE.replace("__NAME__", "GetIssues").replace(
+    "__HIERARCHY__",
+    """parent {
+                    id
+                    identifier
+                }
+                children {
+                    nodes {
+                        id
+                        identifier
+                        title
+                    }
+                }""",
+)
+
+# Flat: only the parent link, the hierarchy is rebuilt locally by IssueIndex
+ISSUES_QUERY_FLAT = ISSUES_QUERY_TEMPLATE.replace("__NAME__", "GetIssuesFlat").replace(
+    "__HIERARCHY__",
+    """parent {
+                    id
+                }""",
+)
+
+# Every operation the client sends; validated against the schema at startup
+OPERATIONS = (
+    CREATE_LABEL_MUTATION,
+    GET_LABELS_QUERY,
+    CREATE_ISSUE_MUTATION,
+    UPDATE_ISSUE_MUTATION,
+    DELETE_ISSUE_MUTATION,
+    ISSUES_QUERY,
+    ISSUES_QUERY_FLAT,
+)
+
+
+def _remaining_requests(headers) -> Optional[int]:
+    value = headers.get("X-RateLimit-Requests-Remaining")
+    return int(value) if value is not None else None
+
+
+def _complexity_rejection(response) -> Optional[Dict]:
+    """The GraphQL body of a 4xx response rejecting a query as too complex"""
+    if not 400 <= response.status_code < 500:
+        return None
+    try:
+        body = response.json()
+    except ValueError:
+        return None
+    if isinstance(body, dict) and is_complexity_error(body.get("errors")):
+        return body
+    return None
+
+
+def _uncounted(result: Dict) -> Dict:
+    """``result`` without the complexity ``_post`` reported for it"""
+    extensions = dict(result.get("extensions") or {})
+    extensions.pop("complexity", None)
+    result = dict(result)
+    if extensions:
+        result["extensions"] = extensions
+    else:
+        result.pop("extensions", None)
+    return result
 
 
 @dataclass
@@ -25,61 +233,326 @@ class LinearConfig:
 
     api_key: str
     team_id: str
+    api_keys: List[str] = field(default_factory=list)
+    key_requests_per_hour: float = DEFAULT_REQUESTS_PER_HOUR
     base_url: str = "https://api.linear.app/graphql"
+    timeout: float = 30.0
+    operation_timeouts: Dict[str, float] = field(default_factory=dict)
+    breaker_threshold: int = 5
+    breaker_reset: float = 30.0
+    hedge_reads: bool = False
+    hedge_delay: float = 1.0
+    hedge_workers: int = 16
+    cache_backend: str = ""
+    cache_path: str = ".cache/linear_responses.db"
+    cache_ttls: Dict[str, float] = field(default_factory=dict)
+    cache_size: int = 512
+    outbox_path: str = ""
+    schema_path: str = ".cache/linear_schema.json"
+    debug: bool = False
 
     def __post_init__(self):
+        if not self.api_key and self.api_keys:
+            self.api_key = self.api_keys[0]
         if not self.api_key or not self.team_id:
             raise ValueError(
-                "LINEAR_API_KEY and LINEAR_TEAM_ID must be set in environment variables"
+                "LINEAR_API_KEY (or LINEAR_API_KEYS) and LINEAR_TEAM_ID must be set "
+                "in environment variables"
             )
 
+    @classmethod
+    def from_env(cls, credentials: Dict[str, str] = None) -> "LinearConfig":
+        """Build the configuration from LINEAR_* environment variables
 
-class LinearAPI:
-    """Linear API client for managing issues and labels"""
-
-    def __init__(self):
-        self.config = LinearConfig(
-            api_key=os.getenv("LINEAR_API_KEY", ""),
-            team_id=os.getenv("LINEAR_TEAM_ID", ""),
+        ``credentials`` supplies fallback ``api_key``/``team_id`` values, e.g.
+        from a replay cassette, when the environment does not set them.
+        """
+        credentials = credentials or {}
+        api_keys = [
+            key.strip()
+            for key in os.getenv("LINEAR_API_KEYS", "").split(",")
+            if key.strip()
+        ]
+        return cls(
+            api_key=os.getenv("LINEAR_API_KEY") or credentials.get("api_key", ""),
+            team_id=os.getenv("LINEAR_TEAM_ID") or credentials.get("team_id", ""),
+            api_keys=api_keys,
+            key_requests_per_hour=float(
+                os.getenv("LINEAR_KEY_RATE", DEFAULT_REQUESTS_PER_HOUR)
+            ),
+            timeout=float(os.getenv("LINEAR_TIMEOUT", "30")),
+            operation_timeouts=parse_timeouts(
+                os.getenv("LINEAR_OPERATION_TIMEOUTS", "")
+            ),
+            hedge_reads=os.getenv("LINEAR_HEDGE_READS", "").lower()
+            in ("1", "true", "yes"),
+            hedge_workers=int(os.getenv("LINEAR_HEDGE_WORKERS", "16")),
+            cache_backend=os.getenv("LINEAR_CACHE", ""),
+            cache_path=os.getenv("LINEAR_CACHE_PATH", ".cache/linear_responses.db"),
+            cache_ttls=parse_timeouts(os.getenv("LINEAR_CACHE_TTLS", "")),
+            outbox_path=os.getenv("LINEAR_OUTBOX", ""),
+            schema_path=os.getenv("LINEAR_SCHEMA", ".cache/linear_schema.json"),
+            debug=os.getenv("LINEAR_DEBUG", "").lower() in ("1", "true", "yes"),
         )
-        self.headers = {
-            "Authorization": f"Bearer {self.config.api_key}",
-            "Content-Type": "application/json",
-        }
 
-    def _make_request(self, query: str, variables: Dict = None) -> Dict:
-        """Make a GraphQL request to Linear API"""
+    @property
+    def keys(self) -> List[str]:
+        """Every API key to spread requests over"""
+        if not self.api_keys:
+            return [self.api_key]
+        if self.api_key in self.api_keys:
+            return list(self.api_keys)
+        return [self.api_key] + self.api_keys
+
+    def timeout_for(self, operation: str) -> float:
+        """Get the request timeout for a GraphQL operation"""
+        return self.operation_timeouts.get(operation, self.timeout)
+
+
+class LinearAPI:
+    """Linear API client for managing issues and labels
+
+    Operations are checked against the saved schema snapshot, if any;
+    ``validate=False`` skips that, e.g. to refresh a stale snapshot.
+    """
+
+    def __init__(self, config: LinearConfig = None, transport=None, validate=True):
+        self.transport = transport or transport_from_env()
+        self.config = config or LinearConfig.from_env(self.transport.credentials())
+        self.headers = {"Content-Type": "application/json"}
+        self.keys = KeyPool(
+            self.config.keys,
+            requests_per_hour=self.config.key_requests_per_hour,
+            max_wait=self.config.timeout,
+        )
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._latencies: Dict[str, LatencyTracker] = {}
+        self._resilience_lock = threading.Lock()
+        self._hedge_executor = None
+        self._flight = SingleFlight()
+        self._async_flight = AsyncSingleFlight()
+        self.cache = build_cache(
+            self.config.cache_backend,
+            self.config.cache_path,
+            self.config.cache_ttls,
+            self.config.cache_size,
+        )
+        self.validator = None
+        if validate:
+            self.validator = SchemaValidator.load(self.config.schema_path)
+        if self.validator is not None:
+            self.validator.check_all(OPERATIONS)
+        self.outbox = None
+        if self.config.outbox_path:
+            self.enable_outbox(self.config.outbox_path)
+
+    def enable_outbox(self, path: str = ".cache/linear_outbox.db", **options) -> Outbox:
+        """Queue mutations in a durable outbox instead of sending them inline
+
+        ``create_label``, ``create_issue``, ``update_issue`` and ``delete_issue``
+        then return an ``OutboxHandle`` immediately. Handles can be passed as
+        ``parent_id``/``label_ids`` of later calls; use ``handle.result()`` or
+        ``flush()`` to wait for Linear.
+        """
+        self.outbox = Outbox(self, path, **options)
+        return self.outbox
+
+    def flush(self):
+        """Send every queued outbox mutation now"""
+        if self.outbox is not None:
+            self.outbox.flush()
+
+    def close(self):
+        """Flush the outbox and release the hedging threads and transport"""
+        if self.outbox is not None:
+            self.outbox.close()
+            self.outbox = None
+        with self._resilience_lock:
+            executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if hasattr(self.transport, "close"):
+            self.transport.close()
+
+    def _breaker(self, operation: str) -> CircuitBreaker:
+        """Get (or create) the circuit breaker for an operation"""
+        with self._resilience_lock:
+            if operation not in self._breakers:
+                self._breakers[operation] = CircuitBreaker(
+                    failure_threshold=self.config.breaker_threshold,
+                    reset_timeout=self.config.breaker_reset,
+                )
+                self._latencies[operation] = LatencyTracker()
+            return self._breakers[operation]
+
+    def _hedge_pool(self) -> ThreadPoolExecutor:
+        """The shared pool that runs hedge attempts (created once)"""
+        with self._resilience_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=self.config.hedge_workers,
+                    thread_name_prefix="linear-hedge",
+                )
+            return self._hedge_executor
+
+    def _hedge_delay(self, operation: str) -> float:
+        """Delay before firing a hedged request: the operation's p95 latency"""
+        tracker = self._latencies[operation]
+        if len(tracker) < 20:
+            return self.config.hedge_delay
+        return tracker.percentile(95)
+
+    def _post(self, operation: str, payload: Dict) -> Dict:
+        """Send one HTTP request and record its latency
+
+        The request goes out on the least-loaded pooled API key; when Linear
+        throttles that key it is benched and the request retried on another.
+        """
+        for _ in range(len(self.keys)):
+            key = self.keys.acquire()
+            headers = dict(self.headers, Authorization=f"Bearer {key.api_key}")
+            started = time.perf_counter()
+            try:
+                response = self.transport.post(
+                    self.config.base_url,
+                    headers,
+                    payload,
+                    self.config.timeout_for(operation),
+                )
+            except Exception:
+                self.keys.release(key, failed=True)
+                raise
+            latency = time.perf_counter() - started
+
+            if is_rate_limited(response):
+                self.keys.release(
+                    key, latency, throttled=True, cooldown=retry_after(response.headers)
+                )
+                reporter.warning(
+                    "request.throttled",
+                    f"Linear API key {key.label} is rate limited",
+                    operation=operation,
+                    key=key.label,
+                )
+                continue
+
+            # Linear rejects over-complex queries with HTTP 400; that is an
+            # answer (the caller shrinks the page), not a failing key or server
+            rejection = _complexity_rejection(response)
+            self.keys.release(
+                key,
+                latency,
+                failed=response.status_code >= 400 and rejection is None,
+                remaining=_remaining_requests(response.headers),
+            )
+            if rejection is not None:
+                return rejection
+            response.raise_for_status()
+            self._latencies[operation].record(latency)
+            body = response.json()
+            if isinstance(body, dict):
+                # Carried by the response itself, so concurrent and hedged
+                # requests for one operation never see each other's numbers
+                extensions = dict(body.get("extensions") or {})
+                extensions["complexity"] = reported_complexity(response.headers)
+                body = dict(body, extensions=extensions)
+            return body
+
+        raise RateLimitedError(min(key["cooling_for"] for key in self.keys.metrics()))
+
+    def key_metrics(self) -> List[Dict]:
+        """Per-key request, throttle and latency counters"""
+        return self.keys.metrics()
+
+    def _make_request(
+        self, query: str, variables: Dict = None, hedge: bool = False
+    ) -> Dict:
+        """Make a GraphQL request to Linear API
+
+        ``hedge`` marks the request as an idempotent read that may be hedged
+        when ``LinearConfig.hedge_reads`` is enabled.
+        """
         payload = {"query": query, "variables": variables or {}}
+        if self.validator is not None:
+            # Variable types are only checked in debug mode; documents are
+            # parsed once and cached, so this is cheap on the hot path
+            self.validator.check(
+                query, payload["variables"] if self.config.debug else None
+            )
+        operation = operation_name(query)
+        breaker = self._breaker(operation)
+
+        if not breaker.allow():
+            raise CircuitOpenError(operation, breaker.retry_in())
 
         try:
-            response = requests.post(
-                self.config.base_url, headers=self.headers, json=payload, timeout=30
+            if hedge and self.config.hedge_reads:
+                result = hedged_call(
+                    lambda: self._post(operation, payload),
+                    self._hedge_delay(operation),
+                    self._hedge_pool(),
+                )
+            else:
+                result = self._post(operation, payload)
+        except (requests.exceptions.RequestException, TransportError) as e:
+            breaker.record_failure()
+            if self.cache is not None:
+                # A failed mutation may still have been applied server-side
+                self.cache.invalidate_for(operation)
+            reporter.error(
+                "request.failed",
+                f"Error making request to Linear API: {e}",
+                operation=operation,
             )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            console.print(f"[red]Error making request to Linear API: {e}[/red]")
+            raise
+        except BaseException:
+            # Anything else (an unparseable body, an interrupt) must still
+            # count, or a half-open probe never ends and the circuit sticks
+            breaker.record_failure()
             raise
 
-    def create_label(self, name: str, color: str, description: str = "") -> str:
-        """Create a new label in Linear"""
-        query = """
-        mutation CreateLabel($name: String!, $color: String!, $description: String, $teamId: String!) {
-            issueLabelCreate(input: {
-                name: $name,
-                color: $color,
-                description: $description,
-                teamId: $teamId
-            }) {
-                success
-                issueLabel {
-                    id
-                    name
-                    color
-                }
-            }
-        }
+        breaker.record_success()
+        if self.cache is not None:
+            self.cache.invalidate_for(operation)
+        return result
+
+    def _read(self, query: str, variables: Dict = None, fresh: bool = False) -> Dict:
+        """Make an idempotent read request
+
+        Responses are served from the cache when one is configured (unless
+        ``fresh`` is set). Identical reads already in flight (same operation
+        and variables) share a single network call; the shared result must not
+        be mutated.
         """
+        operation = operation_name(query)
+        key = request_key(operation, variables)
+        if self.cache is None:
+            return self._flight.do(
+                key, lambda: self._make_request(query, variables, hedge=True)
+            )
+
+        cache_key = ":".join(key)
+        cached = None if fresh else self.cache.get(operation, cache_key)
+        if cached is not None:
+            return cached
+
+        generation = self.cache.generation(operation)
+
+        def fetch():
+            result = self._make_request(query, variables, hedge=True)
+            if not result.get("errors"):
+                self.cache.put(operation, cache_key, _uncounted(result), generation)
+            return result
+
+        # Flights are keyed by generation as well, so a read made after a
+        # write never joins (and returns) one that started before it
+        return self._flight.do((*key, generation), fetch)
+
+    def create_label(
+        self, name: str, color: str, description: str = ""
+    ) -> Union[str, OutboxHandle]:
+        """Create a new label in Linear"""
+        query = CREATE_LABEL_MUTATION
 
         variables = {
             "name": name,
@@ -88,37 +561,38 @@ class LinearAPI:
             "teamId": self.config.team_id,
         }
 
+        if self.outbox is not None:
+            return self.outbox.enqueue("create_label", {"input": variables})
+
         result = self._make_request(query, variables)
 
         if result.get("data", {}).get("issueLabelCreate", {}).get("success"):
             label_id = result["data"]["issueLabelCreate"]["issueLabel"]["id"]
-            console.print(f"[green]✓ Created label: {name} ({color})[/green]")
+            reporter.success(
+                "label.created",
+                f"Created label: {name} ({color})",
+                id=label_id,
+                name=name,
+            )
             return label_id
         else:
-            console.print(f"[red]✗ Failed to create label: {name}[/red]")
+            reporter.error("label.failed", f"Failed to create label: {name}", name=name)
             return ""
 
-    def get_labels(self) -> List[Dict]:
-        """Get all labels for the team"""
-        query = """
-        query GetLabels($teamId: String!) {
-            team(id: $teamId) {
-                labels {
-                    nodes {
-                        id
-                        name
-                        color
-                        description
-                    }
-                }
-            }
-        }
+    def get_labels(self, as_models: bool = False) -> List[Dict]:
+        """Get all labels for the team
+
+        With ``as_models`` the labels are returned as compact ``Label`` objects.
         """
+        query = GET_LABELS_QUERY
 
         variables = {"teamId": self.config.team_id}
-        result = self._make_request(query, variables)
+        result = self._read(query, variables)
 
-        return result.get("data", {}).get("team", {}).get("labels", {}).get("nodes", [])
+        nodes = (
+            result.get("data", {}).get("team", {}).get("labels", {}).get("nodes", [])
+        )
+        return labels_from_nodes(nodes) if as_models else nodes
 
     def create_issue(
         self,
@@ -127,29 +601,9 @@ class LinearAPI:
         label_ids: List[str] = None,
         parent_id: str = None,
         priority: int = 3,
-    ) -> str:
+    ) -> Union[str, OutboxHandle]:
         """Create a new issue in Linear"""
-        query = """
-        mutation CreateIssue($title: String!, $description: String!, $teamId: String!, 
-                           $labelIds: [String!], $parentId: String, $priority: Int!) {
-            issueCreate(input: {
-                title: $title,
-                description: $description,
-                teamId: $teamId,
-                labelIds: $labelIds,
-                parentId: $parentId,
-                priority: $priority
-            }) {
-                success
-                issue {
-                    id
-                    identifier
-                    title
-                    url
-                }
-            }
-        }
-        """
+        query = CREATE_ISSUE_MUTATION
 
         variables = {
             "title": title,
@@ -160,16 +614,29 @@ class LinearAPI:
             "priority": priority,
         }
 
+        # Leave unset optional fields out instead of sending explicit nulls
+        variables = {k: v for k, v in variables.items() if v is not None}
+
+        if self.outbox is not None:
+            return self.outbox.enqueue(
+                "create_issue", {"input": variables}, group=parent_id
+            )
+
         result = self._make_request(query, variables)
 
         if result.get("data", {}).get("issueCreate", {}).get("success"):
             issue = result["data"]["issueCreate"]["issue"]
-            console.print(
-                f"[green]✓ Created issue: {issue['identifier']} - {title}[/green]"
+            reporter.success(
+                "issue.created",
+                f"Created issue: {issue['identifier']} - {title}",
+                id=issue["id"],
+                identifier=issue["identifier"],
             )
             return issue["id"]
         else:
-            console.print(f"[red]✗ Failed to create issue: {title}[/red]")
+            reporter.error(
+                "issue.failed", f"Failed to create issue: {title}", title=title
+            )
             return ""
 
     def create_sub_issue(
@@ -183,47 +650,118 @@ class LinearAPI:
             parent_id=parent_id,
         )
 
-    def get_issues(self, limit: int = 50) -> List[Dict]:
-        """Get issues for the team"""
-        query = """
-        query GetIssues($teamId: String!, $first: Int!) {
-            team(id: $teamId) {
-                issues(first: $first) {
-                    nodes {
-                        id
-                        identifier
-                        title
-                        description
-                        state {
-                            name
-                        }
-                        labels {
-                            nodes {
-                                name
-                                color
-                            }
-                        }
-                        parent {
-                            id
-                            identifier
-                        }
-                        children {
-                            nodes {
-                                id
-                                identifier
-                                title
-                            }
-                        }
-                    }
-                }
-            }
-        }
+    def _issues_page(
+        self,
+        first: int,
+        after: str = None,
+        flat: bool = False,
+        filter: IssueFilter = None,
+        fresh: bool = False,
+    ) -> Tuple[Dict, Optional[Dict]]:
+        """Fetch one page of the team's issues connection
+
+        Also returns the response ``extensions`` (with the reported complexity)
+        when the page came from Linear, or None when it came from the cache.
         """
+        query = ISSUES_QUERY_FLAT if flat else ISSUES_QUERY
+        variables = {"teamId": self.config.team_id, "first": first}
+        if after:
+            variables["after"] = after
+        if filter:
+            variables["filter"] = filter.build()
+        result = self._read(query, variables, fresh)
+        if is_complexity_error(result.get("errors")):
+            raise QueryComplexityError(result["errors"][0].get("message", ""))
+
+        issues = result.get("data", {}).get("team", {}).get("issues", {})
+        extensions = result.get("extensions") or {}
+        return issues, extensions if "complexity" in extensions else None
+
+    def get_issues(
+        self,
+        limit: int = 50,
+        as_models: bool = False,
+        flat: bool = False,
+        filter: IssueFilter = None,
+    ) -> List[Dict]:
+        """Get issues for the team
+
+        With ``as_models`` the issues are returned as compact ``Issue`` objects,
+        which still support ``issue["labels"]["nodes"]``-style access.
+        With ``flat`` only ``parent.id`` is fetched instead of nested children;
+        build an ``IssueIndex`` to navigate the hierarchy locally.
+        ``filter`` is applied server-side by Linear.
+        """
+        page, _ = self._issues_page(limit, flat=flat, filter=filter)
+        nodes = page.get("nodes", [])
+        return issues_from_nodes(nodes) if as_models else nodes
 
-        variables = {"teamId": self.config.team_id, "first": limit}
-        result = self._make_request(query, variables)
+    def iter_issues(
+        self,
+        page_size: int = None,
+        as_models: bool = False,
+        flat: bool = True,
+        filter: IssueFilter = None,
+        fresh: bool = False,
+    ) -> Iterator[Dict]:
+        """Iterate over every (matching) issue of the team, following cursors
+
+        Without ``page_size`` pages are sized adaptively: as large as the
+        query's complexity allows, shrinking when pages get slow or rejected.
+        ``fresh`` bypasses the response cache, e.g. for polling.
+        """
+        pager = None
+        if page_size is None:
+            pager = AdaptivePager(ISSUES_QUERY_FLAT if flat else ISSUES_QUERY)
+
+        after = None
+        while True:
+            size = pager.size if pager else page_size
+            started = time.perf_counter()
+            try:
+                page, extensions = self._issues_page(size, after, flat, filter, fresh)
+            except QueryComplexityError:
+                if pager is None or not pager.record_complexity_error():
+                    raise
+                continue
+            nodes = page.get("nodes", [])
+            # A page served from the cache says nothing about the server
+            if pager and extensions is not None:
+                pager.record(
+                    time.perf_counter() - started,
+                    len(nodes),
+                    extensions["complexity"],
+                )
+            yield from issues_from_nodes(nodes) if as_models else nodes
+
+            page_info = page.get("pageInfo") or {}
+            if not page_info.get("hasNextPage"):
+                return
+            after = page_info.get("endCursor")
+
+    def get_issue_index(self, page_size: int = None) -> IssueIndex:
+        """Fetch all issues flat and index their hierarchy in memory"""
+        return IssueIndex(self.iter_issues(page_size, as_models=True, flat=True))
+
+    async def aget_labels(self, as_models: bool = False) -> List[Dict]:
+        """Get all labels for the team from asyncio code
+
+        Concurrent awaiters share one worker thread and one network call.
+        """
+        return await self._async_flight.do(
+            ("get_labels", as_models),
+            lambda: asyncio.to_thread(self.get_labels, as_models),
+        )
+
+    async def aget_issues(self, limit: int = 50, as_models: bool = False) -> List[Dict]:
+        """Get issues for the team from asyncio code
 
-        return result.get("data", {}).get("team", {}).get("issues", {}).get("nodes", [])
+        Concurrent awaiters with the same arguments share one network call.
+        """
+        return await self._async_flight.do(
+            ("get_issues", limit, as_models),
+            lambda: asyncio.to_thread(self.get_issues, limit, as_models),
+        )
 
     def update_issue(
         self,
@@ -231,44 +769,41 @@ class LinearAPI:
         title: str = None,
         description: str = None,
         state: str = None,
-    ) -> bool:
-        """Update an existing issue"""
-        query = """
-        mutation UpdateIssue($id: String!, $title: String, $description: String, $state: String) {
-            issueUpdate(id: $id, input: {
-                title: $title,
-                description: $description,
-                state: $state
-            }) {
-                success
-            }
-        }
+    ) -> Union[bool, OutboxHandle]:
+        """Update an existing issue
+
+        ``state`` is the ID of the target workflow state.
         """
+        query = UPDATE_ISSUE_MUTATION
 
         variables = {
             "id": issue_id,
             "title": title,
             "description": description,
-            "state": state,
+            "stateId": state,
         }
 
         # Remove None values
         variables = {k: v for k, v in variables.items() if v is not None}
 
+        if self.outbox is not None:
+            inputs = {k: v for k, v in variables.items() if k != "id"}
+            return self.outbox.enqueue(
+                "update_issue", {"id": issue_id, "input": inputs}, group=issue_id
+            )
+
         result = self._make_request(query, variables)
         return result.get("data", {}).get("issueUpdate", {}).get("success", False)
 
-    def delete_issue(self, issue_id: str) -> bool:
+    def delete_issue(self, issue_id: str) -> Union[bool, OutboxHandle]:
         """Delete an issue"""
-        query = """
-        mutation DeleteIssue($id: String!) {
-            issueDelete(id: $id) {
-                success
-            }
-        }
-        """
+        query = DELETE_ISSUE_MUTATION
 
         variables = {"id": issue_id}
+
+        if self.outbox is not None:
+            return self.outbox.enqueue("delete_issue", variables, group=issue_id)
+
         result = self._make_request(query, variables)
         return result.get("data", {}).get("issueDelete", {}).get("success", False)
 
@@ -276,11 +811,55 @@ class LinearAPI:
 class RoadmapManager:
     """Manager for creating and organizing the Python learning roadmap"""
 
-    def __init__(self):
-        self.api = LinearAPI()
+    def __init__(self, api: LinearAPI = None):
+        self.api = api or LinearAPI()
         self.labels = {}
         self.issues = {}
 
+    def resume_issues(self, identifiers: Dict[str, str]):
+        """Track existing issues, e.g. ``{"module_1": "ENG-12"}``, to resume provisioning
+
+        All identifiers are resolved with a single batched query.
+        """
+        loader = IssueLoader(self.api)
+        futures = {
+            key: loader.load_identifier(identifier)
+            for key, identifier in identifiers.items()
+        }
+        for key, future in futures.items():
+            issue = future.result()
+            if issue is None:
+                reporter.error(
+                    "issue.not_found",
+                    f"Issue not found: {identifiers[key]}",
+                    key=key,
+                    identifier=identifiers[key],
+                )
+            else:
+                self.issues[key] = issue.id
+
+    def reconcile_issues(self) -> List[str]:
+        """Stop tracking issues that no longer exist in Linear
+
+        Checks every tracked issue with a single batched query and returns
+        the keys that were dropped.
+        """
+        loader = IssueLoader(self.api)
+        futures = {
+            key: loader.load(issue_id)
+            for key, issue_id in self.issues.items()
+            if isinstance(issue_id, str)
+        }
+        missing = [key for key, future in futures.items() if future.result() is None]
+        for key in missing:
+            reporter.warning(
+                "issue.missing",
+                f"Tracked issue no longer exists: {key}",
+                key=key,
+                issue=self.issues.pop(key),
+            )
+        return missing
+
     def setup_labels(self):
         """Create all necessary labels for the roadmap"""
         label_configs = [
@@ -336,7 +915,7 @@ class RoadmapManager:
             },
         ]
 
-        console.print("[blue]Setting up labels...[/blue]")
+        reporter.info("labels.setup", "Setting up labels...")
 
         for config in label_configs:
             label_id = self.api.create_label(
@@ -347,7 +926,11 @@ class RoadmapManager:
             if label_id:
                 self.labels[config["name"]] = label_id
 
-        console.print(f"[green]✓ Created {len(self.labels)} labels[/green]")
+        reporter.success(
+            "labels.created",
+            f"Created {len(self.labels)} labels",
+            count=len(self.labels),
+        )
 
     def create_module_issue(
         self,
@@ -379,7 +962,11 @@ class RoadmapManager:
         """Create a sub-issue under a parent module"""
         parent_id = self.issues.get(parent_key)
         if not parent_id:
-            console.print(f"[red]Parent issue not found: {parent_key}[/red]")
+            reporter.error(
+                "issue.parent_missing",
+                f"Parent issue not found: {parent_key}",
+                parent=parent_key,
+            )
             return ""
 
         label_ids = []
@@ -395,7 +982,7 @@ class RoadmapManager:
 
     def display_roadmap(self):
         """Display the current roadmap in a formatted table"""
-        issues = self.api.get_issues(limit=100)
+        issues = self.api.get_issues(limit=100, as_models=True)
 
         table = Table(title="Python Learning Roadmap")
         table.add_column("ID", style="cyan")
@@ -405,19 +992,36 @@ class RoadmapManager:
         table.add_column("Children", style="yellow")
 
         for issue in issues:
-            labels = ", ".join([label["name"] for label in issue["labels"]["nodes"]])
-            children_count = len(issue["children"]["nodes"])
-            status = issue["state"]["name"]
+            labels = ", ".join(issue.label_names)
+            children_count = len(issue.children)
+            status = issue.state_name
 
             table.add_row(
-                issue["identifier"], issue["title"], labels, status, str(children_count)
+                issue.identifier, issue.title, labels, status, str(children_count)
             )
-
-        console.print(table)
+            if not reporter.rich:
+                reporter.info(
+                    "roadmap.issue",
+                    f"{issue.identifier} {issue.title}",
+                    identifier=issue.identifier,
+                    title=issue.title,
+                    labels=list(issue.label_names),
+                    status=status,
+                    children=children_count,
+                )
+
+        if reporter.rich:
+            console.print(table)
+
+    def watch_roadmap(self):
+        """Keep the roadmap table on screen, polling only for changed issues"""
+        from watch import RoadmapWatcher
+
+        RoadmapWatcher(self.api).run()
 
     def create_complete_roadmap(self):
         """Create the complete Python learning roadmap"""
-        console.print("[bold blue]Creating Python Learning Roadmap...[/bold blue]")
+        reporter.info("roadmap.creating", "Creating Python Learning Roadmap...")
 
         # Setup labels first
         self.setup_labels()
@@ -541,9 +1145,10 @@ class RoadmapManager:
         )
 
         # Continue with remaining modules...
-        console.print("[green]✓ Roadmap creation completed![/green]")
-        console.print(
-            "[yellow]Note: This is a partial implementation. Run the script multiple times to create all modules.[/yellow]"
+        reporter.success("roadmap.created", "Roadmap creation completed!")
+        reporter.info(
+            "roadmap.partial",
+            "Note: This is a partial implementation. Run the script multiple times to create all modules.",
         )
 
 
@@ -567,7 +1172,8 @@ def main():
             "1. Create complete roadmap\n"
             "2. Display current roadmap\n"
             "3. Setup labels only\n"
-            "Enter choice (1-3): "
+            "4. Watch roadmap live\n"
+            "Enter choice (1-4): "
         )
 
         if choice == "1":
@@ -576,6 +1182,8 @@ def main():
             manager.display_roadmap()
         elif choice == "3":
             manager.setup_labels()
+        elif choice == "4":
+            manager.watch_roadmap()
         else:
             console.print("[red]Invalid choice![/red]")
 
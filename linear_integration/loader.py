@@ -0,0 +1,193 @@
+"""
+Batched issue lookups for the Linear API client
+DataLoader-style: individual lookups by ID or identifier made within a short
+window are resolved together by one filtered issues query, and memoized
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future, InvalidStateError
+from typing import Dict, Iterable, List, Optional
+
+from filters import IssueFilter
+from models import Issue
+
+
+class _LoaderFuture(Future):
+    """Future that dispatches its pending batch as soon as someone waits on it"""
+
+    def __init__(self, loader: "IssueLoader"):
+        super().__init__()
+        self._loader = loader
+
+    def result(self, timeout: float = None):
+        if not self.done():
+            self._loader.dispatch()
+        return super().result(timeout)
+
+
+def _settle(future: Future, result=None, error: BaseException = None):
+    """Set a future's outcome unless someone (e.g. ``prime``) already has"""
+    try:
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        pass
+
+
+class IssueLoader:
+    """Coalesces ``load``/``load_identifier`` calls into batched queries
+
+    Lookups return futures. The pending batch is sent when the first of them
+    is waited on, after ``window`` seconds, or once ``max_batch`` keys are
+    queued, whichever comes first. In asyncio code, ``aload`` batches every
+    lookup made within the same event-loop tick. Results (including misses,
+    which resolve to None) are memoized for the loader's lifetime, so use one
+    loader per unit of work and ``clear`` entries known to be stale.
+    """
+
+    def __init__(self, api, window: float = 0.01, max_batch: int = 100):
+        self.api = api
+        self.window = window
+        self.max_batch = max_batch
+        self._futures: Dict[tuple, _LoaderFuture] = {}
+        self._pending: Dict[tuple, _LoaderFuture] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def load(self, issue_id: str) -> Future:
+        """Future for the issue with ``issue_id`` (None if it does not exist)"""
+        return self._enqueue(("id", issue_id))
+
+    def load_identifier(self, identifier: str) -> Future:
+        """Future for the issue with a human identifier such as ``"ENG-123"``"""
+        team, _, number = identifier.rpartition("-")
+        if not team or not number.isdigit():
+            raise ValueError(f"Not an issue identifier: {identifier!r}")
+        return self._enqueue(("identifier", identifier.upper()))
+
+    def load_many(self, issue_ids: Iterable[str]) -> List[Optional[Issue]]:
+        """Resolve several IDs with a single round trip"""
+        futures = [self.load(issue_id) for issue_id in issue_ids]
+        return [future.result() for future in futures]
+
+    def load_many_identifiers(
+        self, identifiers: Iterable[str]
+    ) -> List[Optional[Issue]]:
+        """Resolve several identifiers with a single round trip"""
+        futures = [self.load_identifier(identifier) for identifier in identifiers]
+        return [future.result() for future in futures]
+
+    async def aload(self, issue_id: str) -> Optional[Issue]:
+        """Await an issue by ID; lookups from the same tick share one query"""
+        return await self._await(self.load(issue_id))
+
+    async def aload_identifier(self, identifier: str) -> Optional[Issue]:
+        """Await an issue by identifier; lookups from the same tick share one query"""
+        return await self._await(self.load_identifier(identifier))
+
+    def prime(self, issue: Issue):
+        """Seed the memo with an issue that is already known"""
+        for key in (("id", issue.id), ("identifier", issue.identifier)):
+            with self._lock:
+                future = self._futures.get(key)
+                if future is None or future.done():
+                    future = _LoaderFuture(self)
+                    self._futures[key] = future
+                self._pending.pop(key, None)
+            # A batch already in flight may hold the same future
+            _settle(future, issue)
+
+    def clear(self, issue_id: str = None, identifier: str = None):
+        """Forget memoized results (everything when called without arguments)"""
+        with self._lock:
+            if issue_id is None and identifier is None:
+                self._futures = dict(self._pending)
+                return
+            if issue_id is not None:
+                self._futures.pop(("id", issue_id), None)
+            if identifier is not None:
+                self._futures.pop(("identifier", identifier.upper()), None)
+
+    def dispatch(self):
+        """Send the pending batch now"""
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if batch:
+            self._resolve(batch)
+
+    def _enqueue(self, key: tuple) -> Future:
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None:
+                return future
+            future = _LoaderFuture(self)
+            self._futures[key] = future
+            self._pending[key] = future
+            full = len(self._pending) >= self.max_batch
+            if not full and self._timer is None:
+                self._timer = threading.Timer(self.window, self.dispatch)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.dispatch()
+        return future
+
+    async def _await(self, future: Future) -> Optional[Issue]:
+        if not future.done():
+            # Let the rest of this tick queue its lookups, then send the batch
+            # from a worker thread
+            loop = asyncio.get_running_loop()
+            await asyncio.sleep(0)
+            await loop.run_in_executor(None, self.dispatch)
+        return await asyncio.wrap_future(future)
+
+    def _resolve(self, batch: Dict[tuple, _LoaderFuture]):
+        """Fetch every key of a batch with one query and settle the futures"""
+        ids = [value for kind, value in batch if kind == "id"]
+        numbers = [
+            int(value.rpartition("-")[2])
+            for kind, value in batch
+            if kind == "identifier"
+        ]
+        issue_filter = IssueFilter().any_of(
+            IssueFilter().ids(ids) if ids else IssueFilter(),
+            IssueFilter().numbers(numbers) if numbers else IssueFilter(),
+        )
+        try:
+            issues = list(
+                self.api.iter_issues(
+                    page_size=min(len(batch), 250),
+                    as_models=True,
+                    filter=issue_filter,
+                )
+            )
+        except Exception as e:
+            with self._lock:
+                for key in batch:
+                    # Failures are not memoized; the next lookup retries
+                    self._futures.pop(key, None)
+            for future in batch.values():
+                _settle(future, error=e)
+            return
+
+        found = {}
+        for issue in issues:
+            found[("id", issue.id)] = issue
+            found[("identifier", issue.identifier)] = issue
+        for key, future in batch.items():
+            _settle(future, found.get(key))
+        # Make the other key of every fetched issue a memo hit as well
+        for key, issue in found.items():
+            if key not in batch:
+                with self._lock:
+                    if key in self._futures:
+                        continue
+                    future = _LoaderFuture(self)
+                    self._futures[key] = future
+                future.set_result(issue)
@@ -0,0 +1,232 @@
+"""
+Compact data models for Linear issues and labels
+Slotted classes with interned names, built straight from GraphQL nodes
+"""
+
+import sys
+from typing import Dict, Iterable, Optional, Tuple
+from weakref import WeakValueDictionary
+
+# Shared instances: thousands of issues point at a handful of labels/states.
+# Weak values, so labels and states nobody holds any more drop out
+_LABELS: "WeakValueDictionary[Tuple, Label]" = WeakValueDictionary()
+_STATES: "WeakValueDictionary[Tuple, WorkflowState]" = WeakValueDictionary()
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
+
+
+def _export(value):
+    """A model attribute in its GraphQL node shape"""
+    if isinstance(value, _DictCompat):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return {"nodes": [item.to_dict() for item in value]}
+    return value
+
+
+class _DictCompat:
+    """Read-only dict-style access mirroring the GraphQL node shape
+
+    ``_FIELDS`` maps each node key to the attribute holding it, so a lookup
+    reads one attribute instead of building the whole dict.
+    """
+
+    __slots__ = ()
+    _FIELDS: Dict[str, str] = {}
+
+    def __getitem__(self, key: str):
+        return _export(getattr(self, self._FIELDS[key]))
+
+    def get(self, key: str, default=None):
+        name = self._FIELDS.get(key)
+        return default if name is None else _export(getattr(self, name))
+
+    def to_dict(self) -> Dict:
+        return {key: _export(getattr(self, name)) for key, name in self._FIELDS.items()}
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self._FIELDS.values()
+        )
+        return f"{type(self).__name__}({fields})"
+
+
+class Label(_DictCompat):
+    """An issue label"""
+
+    __slots__ = ("id", "name", "color", "description", "__weakref__")
+    _FIELDS = {
+        "id": "id",
+        "name": "name",
+        "color": "color",
+        "description": "description",
+    }
+
+    def __init__(self, id: str, name: str, color: str = "", description: str = ""):
+        self.id = id
+        self.name = _intern(name)
+        self.color = _intern(color)
+        self.description = description
+
+    @classmethod
+    def from_node(cls, node: Dict) -> "Label":
+        """Build (or reuse) a Label from a GraphQL label node"""
+        key = (node.get("id"), node.get("name"), node.get("color"))
+        label = _LABELS.get(key)
+        if label is None:
+            label = _LABELS[key] = cls(
+                node.get("id"),
+                node.get("name"),
+                node.get("color", ""),
+                node.get("description") or "",
+            )
+        return label
+
+
+class WorkflowState(_DictCompat):
+    """An issue workflow state (Todo, In Progress, Done...)"""
+
+    __slots__ = ("id", "name", "type", "__weakref__")
+    _FIELDS = {"id": "id", "name": "name", "type": "type"}
+
+    def __init__(self, name: str, id: str = None, type: str = None):
+        self.id = id
+        self.name = _intern(name)
+        self.type = _intern(type)
+
+    @classmethod
+    def from_node(cls, node: Optional[Dict]) -> Optional["WorkflowState"]:
+        """Build (or reuse) a WorkflowState from a GraphQL state node"""
+        if not node:
+            return None
+        key = (node.get("id"), node.get("name"), node.get("type"))
+        state = _STATES.get(key)
+        if state is None:
+            state = _STATES[key] = cls(
+                node.get("name"), node.get("id"), node.get("type")
+            )
+        return state
+
+
+class IssueRef(_DictCompat):
+    """A lightweight reference to another issue (parent or child)"""
+
+    __slots__ = ("id", "identifier", "title")
+    _FIELDS = {"id": "id", "identifier": "identifier", "title": "title"}
+
+    def __init__(self, id: str, identifier: str = None, title: str = None):
+        self.id = id
+        self.identifier = identifier
+        self.title = title
+
+    @classmethod
+    def from_node(cls, node: Optional[Dict]) -> Optional["IssueRef"]:
+        if not node:
+            return None
+        return cls(node.get("id"), node.get("identifier"), node.get("title"))
+
+
+class Issue(_DictCompat):
+    """A Linear issue"""
+
+    __slots__ = (
+        "id",
+        "identifier",
+        "title",
+        "description",
+        "priority",
+        "state",
+        "labels",
+        "parent",
+        "children",
+        "created_at",
+        "updated_at",
+        "started_at",
+        "completed_at",
+    )
+    _FIELDS = {
+        "id": "id",
+        "identifier": "identifier",
+        "title": "title",
+        "description": "description",
+        "priority": "priority",
+        "state": "state",
+        "labels": "labels",
+        "parent": "parent",
+        "children": "children",
+        "createdAt": "created_at",
+        "updatedAt": "updated_at",
+        "startedAt": "started_at",
+        "completedAt": "completed_at",
+    }
+
+    def __init__(
+        self,
+        id: str,
+        identifier: str,
+        title: str,
+        description: str = "",
+        priority: int = None,
+        state: WorkflowState = None,
+        labels: Tuple[Label, ...] = (),
+        parent: IssueRef = None,
+        children: Tuple[IssueRef, ...] = (),
+        created_at: str = None,
+        updated_at: str = None,
+        started_at: str = None,
+        completed_at: str = None,
+    ):
+        self.id = id
+        self.identifier = identifier
+        self.title = title
+        self.description = description
+        self.priority = priority
+        self.state = state
+        self.labels = labels
+        self.parent = parent
+        self.children = children
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.started_at = started_at
+        self.completed_at = completed_at
+
+    @classmethod
+    def from_node(cls, node: Dict) -> "Issue":
+        """Build an Issue from a GraphQL issue node"""
+        labels = node.get("labels") or {}
+        children = node.get("children") or {}
+        return cls(
+            node["id"],
+            node.get("identifier"),
+            node.get("title"),
+            node.get("description") or "",
+            node.get("priority"),
+            WorkflowState.from_node(node.get("state")),
+            tuple(Label.from_node(label) for label in labels.get("nodes", ())),
+            IssueRef.from_node(node.get("parent")),
+            tuple(IssueRef.from_node(child) for child in children.get("nodes", ())),
+            node.get("createdAt"),
+            node.get("updatedAt"),
+            node.get("startedAt"),
+            node.get("completedAt"),
+        )
+
+    @property
+    def label_names(self) -> Tuple[str, ...]:
+        return tuple(label.name for label in self.labels)
+
+    @property
+    def state_name(self) -> Optional[str]:
+        return self.state.name if self.state else None
+
+
+def issues_from_nodes(nodes: Iterable[Dict]) -> list:
+    """Convert GraphQL issue nodes into Issue models"""
+    return [Issue.from_node(node) for node in nodes]
+
+
+def labels_from_nodes(nodes: Iterable[Dict]) -> list:
+    """Convert GraphQL label nodes into Label models"""
+    return [Label.from_node(node) for node in nodes]
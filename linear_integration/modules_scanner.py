@@ -0,0 +1,261 @@
+"""
+Roadmap scanner for the curriculum notebooks
+Builds modules, topics and their explanation/exercise/solution notebooks from
+the modules/ tree, re-reading only directories whose notebooks changed
+"""
+
+import json
+import os
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Resolved against the repository, not the working directory
+REPO_ROOT = Path(__file__).resolve().parent.parent
+MODULES_ROOT = str(REPO_ROOT / "modules")
+SCAN_CACHE_PATH = str(REPO_ROOT / ".cache" / "modules_scan.json")
+SCAN_CACHE_VERSION = 1
+
+NOTEBOOK_KINDS = ("explanation", "exercise", "solution")
+
+MODULE_PATTERN = re.compile(r"^module_(\d+)_(\w+)$")
+TOPIC_PATTERN = re.compile(r"^topic_(\d+)_(\w+)$")
+TITLE_PREFIX = re.compile(r"^(?:Module \d+|Exercise|Solution)\s*:\s*", re.IGNORECASE)
+
+# Words that title-casing a directory name would get wrong
+SPELLINGS = {
+    "apis": "APIs",
+    "fastapi": "FastAPI",
+    "io": "I/O",
+    "orm": "ORM",
+    "sql": "SQL",
+    "sqlalchemy": "SQLAlchemy",
+}
+
+
+@dataclass
+class Topic:
+    """One topic directory and its notebooks (keyed by kind)"""
+
+    number: int
+    slug: str
+    title: str
+    path: str
+    notebooks: Dict[str, str] = field(default_factory=dict)
+    objectives: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Module:
+    """One module directory, its overview notebooks and its topics"""
+
+    number: int
+    slug: str
+    title: str
+    path: str
+    notebooks: List[str] = field(default_factory=list)
+    objectives: List[str] = field(default_factory=list)
+    topics: List[Topic] = field(default_factory=list)
+
+
+def humanize(slug: str) -> str:
+    """``"fastapi_apis"`` -> ``"FastAPI APIs"``"""
+    return " ".join(
+        SPELLINGS.get(word, word.capitalize()) for word in slug.split("_") if word
+    )
+
+
+def notebook_heading(path: Path) -> Tuple[Optional[str], List[str]]:
+    """Title (first H1, prefix stripped) and learning objectives of a notebook"""
+    try:
+        cells = json.loads(path.read_text(encoding="utf-8")).get("cells", [])
+    except (OSError, ValueError):
+        return None, []
+
+    title, objectives = None, []
+    for cell in cells:
+        if cell.get("cell_type") != "markdown":
+            continue
+        source = cell.get("source", "")
+        if isinstance(source, list):
+            source = "".join(source)
+        section = None
+        for line in source.splitlines():
+            line = line.strip()
+            if line.startswith("# ") and title is None:
+                title = TITLE_PREFIX.sub("", line[2:].strip())
+            elif line.startswith("#"):
+                section = line.lstrip("#").strip().lower()
+            elif section == "learning objectives" and line.startswith(("-", "*")):
+                objectives.append(line[1:].strip())
+        if title is not None:
+            break
+    return title, objectives
+
+
+class ModulesScanner:
+    """Scans ``root`` into ``Module``/``Topic`` objects
+
+    Each directory's entry in the scan cache is keyed by the names, mtimes
+    and sizes of its notebooks, so a rescan only stats the tree and parses
+    the notebooks of directories that changed.
+    """
+
+    def __init__(self, root: str = MODULES_ROOT, cache_path: str = SCAN_CACHE_PATH):
+        self.root = Path(root)
+        self.cache_path = Path(cache_path)
+        self.cache: Dict[str, Dict] = self._load_cache()
+        self.stats = {"read": 0, "cached": 0}
+
+    def scan(self) -> List[Module]:
+        """Modules in curriculum order, each with its topics in order"""
+        self.stats = {"read": 0, "cached": 0}
+        seen = set()
+        modules = []
+        for entry in self._subdirectories(self.root, MODULE_PATTERN):
+            number, slug, path = entry
+            info = self._directory(path, seen)
+            module = Module(
+                number=number,
+                slug=slug,
+                title=info["title"] or humanize(slug),
+                path=str(path),
+                notebooks=sorted(info["notebooks"].values()),
+                objectives=info["objectives"],
+            )
+            for topic_number, topic_slug, topic_path in self._subdirectories(
+                path, TOPIC_PATTERN
+            ):
+                topic = self._directory(topic_path, seen)
+                module.topics.append(
+                    Topic(
+                        number=topic_number,
+                        slug=topic_slug,
+                        title=topic["title"] or humanize(topic_slug),
+                        path=str(topic_path),
+                        notebooks=topic["notebooks"],
+                        objectives=topic["objectives"],
+                    )
+                )
+            modules.append(module)
+
+        stale = set(self.cache) - seen
+        for key in stale:
+            del self.cache[key]
+        if self.stats["read"] or stale:
+            self._save_cache()
+        return modules
+
+    def _subdirectories(self, path: Path, pattern) -> List[Tuple[int, str, Path]]:
+        entries = []
+        with os.scandir(path) as it:
+            for entry in it:
+                match = pattern.match(entry.name)
+                if match and entry.is_dir():
+                    entries.append(
+                        (int(match.group(1)), match.group(2), Path(entry.path))
+                    )
+        return sorted(entries)
+
+    def _directory(self, path: Path, seen: set) -> Dict:
+        """Title, objectives and notebooks of one directory (cached by signature)"""
+        key = str(path)
+        seen.add(key)
+        signature = []
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.name.endswith(".ipynb") and entry.is_file():
+                    stat = entry.stat()
+                    signature.append([entry.name, stat.st_mtime_ns, stat.st_size])
+        signature.sort()
+
+        cached = self.cache.get(key)
+        if cached and cached["signature"] == signature:
+            self.stats["cached"] += 1
+            return cached
+        self.stats["read"] += 1
+
+        names = [name for name, _, _ in signature]
+        notebooks = {
+            Path(name).stem: str(path / name)
+            for name in names
+            if Path(name).stem in NOTEBOOK_KINDS
+        }
+        if not notebooks:
+            # Module overview notebooks are named after the module
+            notebooks = {Path(name).stem: str(path / name) for name in names}
+
+        # The explanation (or the first overview notebook) names the directory
+        primary = notebooks.get("explanation") or next(
+            iter(sorted(notebooks.values())), None
+        )
+        title, objectives = notebook_heading(Path(primary)) if primary else (None, [])
+        info = {
+            "signature": signature,
+            "title": title,
+            "objectives": objectives,
+            "notebooks": notebooks,
+        }
+        self.cache[key] = info
+        return info
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        try:
+            state = json.loads(self.cache_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if state.get("version") != SCAN_CACHE_VERSION:
+            return {}
+        return state.get("directories", {})
+
+    def _save_cache(self):
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path.write_text(
+            json.dumps(
+                {"version": SCAN_CACHE_VERSION, "directories": self.cache}, indent=2
+            )
+        )
+
+
+def scan_modules(root: str = MODULES_ROOT, cache_path: str = SCAN_CACHE_PATH):
+    """Shortcut for ``ModulesScanner(root, cache_path).scan()``"""
+    return ModulesScanner(root, cache_path).scan()
+
+
+def main():
+    """Print the roadmap as scanned from the modules/ tree"""
+    import argparse
+
+    from rich.console import Console
+    from rich.tree import Tree
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--root", default=MODULES_ROOT)
+    parser.add_argument("--json", action="store_true", help="print JSON instead")
+    args = parser.parse_args()
+
+    scanner = ModulesScanner(args.root)
+    modules = scanner.scan()
+    if args.json:
+        print(json.dumps([asdict(module) for module in modules], indent=2))
+        return
+
+    console = Console()
+    tree = Tree(f"[bold]{args.root}[/bold]")
+    for module in modules:
+        branch = tree.add(f"[blue]Module {module.number}: {module.title}[/blue]")
+        for topic in module.topics:
+            kinds = ", ".join(
+                kind for kind in NOTEBOOK_KINDS if kind in topic.notebooks
+            )
+            branch.add(f"{topic.title} [dim]({kinds})[/dim]")
+    console.print(tree)
+    console.print(
+        f"[dim]{scanner.stats['read']} directories read, "
+        f"{scanner.stats['cached']} from the scan cache[/dim]"
+    )
+
+
+if __name__ == "__main__":
+    main()
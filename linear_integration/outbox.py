@@ -0,0 +1,384 @@
+"""
+Durable outbox for Linear mutations
+Mutations are appended to a local SQLite (WAL) queue and drained in coalesced
+batches by a background worker, so producers never wait on Linear
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from reporting import reporter
+
+
+@dataclass(frozen=True)
+class MutationSpec:
+    """How a queued mutation is rendered inside a batched GraphQL document"""
+
+    field: str
+    variables: Dict[str, str]  # variable name -> GraphQL type
+    selection: str
+    # Object whose ``id`` is the handle result; set for creates, whose id is
+    # generated at enqueue time so a resent batch cannot create duplicates
+    result_key: Optional[str] = None
+
+
+MUTATIONS = {
+    "create_issue": MutationSpec(
+        "issueCreate",
+        {"input": "IssueCreateInput!"},
+        "success issue { id identifier }",
+        "issue",
+    ),
+    "update_issue": MutationSpec(
+        "issueUpdate", {"id": "String!", "input": "IssueUpdateInput!"}, "success"
+    ),
+    "delete_issue": MutationSpec("issueDelete", {"id": "String!"}, "success"),
+    "create_label": MutationSpec(
+        "issueLabelCreate",
+        {"input": "IssueLabelCreateInput!"},
+        "success issueLabel { id }",
+        "issueLabel",
+    ),
+}
+
+
+class OutboxError(RuntimeError):
+    """Raised when a queued mutation failed permanently"""
+
+
+class OutboxHandle:
+    """Handle for a queued mutation
+
+    Pass it wherever an issue or label id is expected (``parent_id``,
+    ``label_ids``) to reference the result before it exists; the outbox
+    sends dependent mutations only after the referenced one succeeded.
+    """
+
+    def __init__(self, outbox: "Outbox", entry_id: int):
+        self.outbox = outbox
+        self.entry_id = entry_id
+        self._done = threading.Event()
+        self._result: Optional[str] = None
+        self._error: Optional[str] = None
+
+    def _resolve(self, result: Optional[str], error: Optional[str] = None):
+        self._result = result
+        self._error = error
+        self._done.set()
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def result(self, timeout: float = None) -> Optional[str]:
+        """Wait for the mutation and return the created id (if any)"""
+        if not self._done.wait(timeout):
+            raise TimeoutError(f"Outbox entry {self.entry_id} is still pending")
+        if self._error is not None:
+            raise OutboxError(self._error)
+        return self._result
+
+    def __repr__(self) -> str:
+        return f"OutboxHandle({self.entry_id})"
+
+
+def _encode(value):
+    """Replace handles by ``{"$outbox": entry_id}`` references"""
+    if isinstance(value, OutboxHandle):
+        return {"$outbox": value.entry_id}
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _references(value) -> List[int]:
+    if isinstance(value, dict):
+        if "$outbox" in value:
+            return [value["$outbox"]]
+        return [ref for item in value.values() for ref in _references(item)]
+    if isinstance(value, list):
+        return [ref for item in value for ref in _references(item)]
+    return []
+
+
+def _resolve_refs(value, results: Dict[int, str]):
+    if isinstance(value, dict):
+        if "$outbox" in value:
+            return results[value["$outbox"]]
+        return {key: _resolve_refs(item, results) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_resolve_refs(item, results) for item in value]
+    return value
+
+
+class Outbox:
+    """SQLite-backed mutation queue with a background flusher
+
+    Entries sharing a ``group`` (e.g. children of one parent) are sent in
+    enqueue order: a batch carries at most one entry per group, and a group
+    stalls while its head entry waits on a retry.
+    """
+
+    def __init__(
+        self,
+        api,
+        path: str = ".cache/linear_outbox.db",
+        batch_size: int = 25,
+        max_attempts: int = 5,
+        flush_interval: float = 1.0,
+    ):
+        self.api = api
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.flush_interval = flush_interval
+        self._handles: Dict[int, OutboxHandle] = {}
+        self._db_lock = threading.Lock()
+        self._drain_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._db_lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS outbox (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kind TEXT NOT NULL,
+                    variables TEXT NOT NULL,
+                    grp TEXT,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt REAL NOT NULL DEFAULT 0,
+                    result TEXT,
+                    error TEXT
+                )
+                """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS outbox_status ON outbox (status, id)"
+            )
+
+        self._worker = threading.Thread(
+            target=self._run, name="linear-outbox", daemon=True
+        )
+        self._worker.start()
+
+    def enqueue(self, kind: str, variables: Dict, group: str = None) -> OutboxHandle:
+        """Append a mutation to the queue and return immediately"""
+        if kind not in MUTATIONS:
+            raise ValueError(f"Unknown outbox mutation: {kind}")
+        if isinstance(group, OutboxHandle):
+            group = f"outbox:{group.entry_id}"
+        if MUTATIONS[kind].result_key:
+            variables = {**variables, "input": dict(variables["input"])}
+            variables["input"].setdefault("id", str(uuid.uuid4()))
+
+        with self._db_lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO outbox (kind, variables, grp) VALUES (?, ?, ?)",
+                (kind, json.dumps(_encode(variables)), group),
+            )
+            handle = OutboxHandle(self, cursor.lastrowid)
+            self._handles[handle.entry_id] = handle
+
+        self._wake.set()
+        return handle
+
+    def pending(self) -> int:
+        """Number of entries not yet sent successfully or failed permanently"""
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM outbox WHERE status = 'pending'"
+            ).fetchone()
+        return row[0]
+
+    def flush(self):
+        """Send everything that can be sent now, ignoring retry backoff"""
+        while self._drain(force=True):
+            pass
+
+    def close(self, flush: bool = True):
+        """Stop the background worker (optionally flushing first)"""
+        if flush:
+            self.flush()
+        self._stopped.set()
+        self._wake.set()
+        self._worker.join()
+        self._conn.close()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                while not self._stopped.is_set() and self._drain():
+                    pass
+            except Exception as e:  # keep the worker alive, entries stay queued
+                reporter.error("outbox.flush_failed", f"Outbox flush failed: {e}")
+
+    def _ready_batch(self, force: bool) -> List[tuple]:
+        """Pick up to ``batch_size`` entries whose dependencies are resolved"""
+        with self._db_lock:
+            rows = self._conn.execute(
+                "SELECT id, kind, variables, grp, attempts, next_attempt "
+                "FROM outbox WHERE status = 'pending' ORDER BY id"
+            ).fetchall()
+
+        entries = []
+        for entry_id, kind, variables, group, attempts, next_attempt in rows:
+            variables = json.loads(variables)
+            refs = _references(variables)
+            if group and group.startswith("outbox:"):
+                refs.append(int(group.split(":", 1)[1]))
+            entries.append(
+                (entry_id, kind, variables, group, attempts, next_attempt, refs)
+            )
+
+        # Status of every referenced entry, in one query
+        referenced = sorted({ref for entry in entries for ref in entry[-1]})
+        statuses = {}
+        with self._db_lock:
+            for start in range(0, len(referenced), 500):
+                chunk = referenced[start : start + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                statuses.update(
+                    (entry_id, (status, result))
+                    for entry_id, status, result in self._conn.execute(
+                        f"SELECT id, status, result FROM outbox WHERE id IN ({placeholders})",
+                        chunk,
+                    )
+                )
+        results = {
+            entry_id: result
+            for entry_id, (status, result) in statuses.items()
+            if status == "done"
+        }
+
+        now = time.time()
+        blocked_groups = set()
+        batch = []
+        for entry_id, kind, variables, group, attempts, next_attempt, refs in entries:
+            if group is not None and group in blocked_groups:
+                continue
+            failed = [
+                ref for ref in refs if statuses.get(ref, ("failed",))[0] == "failed"
+            ]
+            if failed:
+                self._record_failure(
+                    entry_id, self.max_attempts, f"dependency {failed[0]} failed"
+                )
+                continue
+            ready = all(ref in results for ref in refs) and (
+                force or next_attempt <= now
+            )
+            if not ready:
+                # Later entries of the group wait behind this one
+                if group is not None:
+                    blocked_groups.add(group)
+                continue
+            batch.append((entry_id, kind, _resolve_refs(variables, results), attempts))
+            # The next entry of the group goes out once this one succeeded
+            if group is not None:
+                blocked_groups.add(group)
+            if len(batch) >= self.batch_size:
+                break
+        return batch
+
+    def _drain(self, force: bool = False) -> bool:
+        """Send one batch; returns True if anything was sent"""
+        with self._drain_lock:
+            batch = self._ready_batch(force)
+            if not batch:
+                return False
+
+            document, variables = self._render(batch)
+            try:
+                response = self.api._make_request(document, variables)
+            except Exception as e:
+                for entry_id, _, _, attempts in batch:
+                    self._record_failure(entry_id, attempts, str(e))
+                return False
+
+            data = response.get("data") or {}
+            errors = "; ".join(
+                error.get("message", "") for error in response.get("errors", [])
+            )
+            sent = 0
+            for entry_id, kind, _, attempts in batch:
+                payload = data.get(f"m{entry_id}") or {}
+                if payload.get("success"):
+                    spec = MUTATIONS[kind]
+                    result = None
+                    if spec.result_key:
+                        result = (payload.get(spec.result_key) or {}).get("id")
+                    self._record_success(entry_id, result)
+                    sent += 1
+                else:
+                    self._record_failure(entry_id, attempts, errors or "not successful")
+            if sent:
+                reporter.success(
+                    "outbox.flushed",
+                    f"Flushed {sent} queued Linear mutations",
+                    count=sent,
+                )
+            return True
+
+    def _render(self, batch: List[tuple]):
+        """Build one aliased mutation document for a batch of entries"""
+        declarations = []
+        fields = []
+        variables = {}
+        for entry_id, kind, entry_variables, _ in batch:
+            spec = MUTATIONS[kind]
+            arguments = []
+            for name, graphql_type in spec.variables.items():
+                variable = f"{name}{entry_id}"
+                declarations.append(f"${variable}: {graphql_type}")
+                arguments.append(f"{name}: ${variable}")
+                variables[variable] = entry_variables[name]
+            fields.append(
+                f"m{entry_id}: {spec.field}({', '.join(arguments)}) {{ {spec.selection} }}"
+            )
+        document = "mutation OutboxBatch({}) {{\n{}\n}}".format(
+            ", ".join(declarations), "\n".join(fields)
+        )
+        return document, variables
+
+    def _record_success(self, entry_id: int, result: Optional[str]):
+        with self._db_lock, self._conn:
+            self._conn.execute(
+                "UPDATE outbox SET status = 'done', result = ?, error = NULL "
+                "WHERE id = ?",
+                (result, entry_id),
+            )
+        handle = self._handles.pop(entry_id, None)
+        if handle is not None:
+            handle._resolve(result)
+
+    def _record_failure(self, entry_id: int, attempts: int, error: str):
+        attempts += 1
+        status = "failed" if attempts >= self.max_attempts else "pending"
+        backoff = min(60.0, 2.0**attempts)
+        with self._db_lock, self._conn:
+            self._conn.execute(
+                "UPDATE outbox SET status = ?, attempts = ?, next_attempt = ?, "
+                "error = ? WHERE id = ?",
+                (status, attempts, time.time() + backoff, error, entry_id),
+            )
+        if status == "failed":
+            reporter.error(
+                "outbox.failed",
+                f"Outbox entry {entry_id} failed: {error}",
+                entry=entry_id,
+            )
+            handle = self._handles.pop(entry_id, None)
+            if handle is not None:
+                handle._resolve(None, error)
@@ -0,0 +1,150 @@
+"""
+Adaptive page sizing for paginated Linear queries
+Picks the largest page the server accepts from estimated and reported query
+complexity, shrinking on slow pages or complexity errors and growing with headroom
+"""
+
+import re
+from typing import Dict, Optional
+
+# Linear rejects single queries above this complexity
+MAX_QUERY_COMPLEXITY = 10000
+
+# Connections without an explicit ``first`` are paged by 50
+DEFAULT_CONNECTION_SIZE = 50
+
+TOKEN_PATTERN = re.compile(r"[A-Za-z_]\w*|[{}()]")
+
+
+class QueryComplexityError(RuntimeError):
+    """Raised when Linear rejects a query as too complex"""
+
+
+def is_complexity_error(errors) -> bool:
+    """True if a GraphQL ``errors`` list reports an over-complex query"""
+    for error in errors or ():
+        code = str((error.get("extensions") or {}).get("code", ""))
+        message = str(error.get("message", ""))
+        if "complex" in code.lower() or "complex" in message.lower():
+            return True
+    return False
+
+
+def estimate_complexity(query: str, page_size: int) -> float:
+    """Estimate Linear's complexity score for a paginated query
+
+    Follows Linear's published rules: each scalar field costs 0.1, each object
+    costs 1, and connection nodes are multiplied by the page size (``page_size``
+    for the outermost connection, 50 for nested ones).
+    """
+    header_end = query.index("{")
+    tokens = TOKEN_PATTERN.findall(query[header_end + 1 :])
+    cost, _ = _block_cost(tokens, 0, [page_size])
+    return cost
+
+
+def _block_cost(tokens, index, outer_pages):
+    cost = 0.0
+    while index < len(tokens):
+        token = tokens[index]
+        if token == "}":
+            return cost, index + 1
+        if token == "(":
+            # Skip arguments
+            depth = 1
+            index += 1
+            while depth:
+                depth += {"(": 1, ")": -1}.get(tokens[index], 0)
+                index += 1
+            continue
+        if index + 1 < len(tokens) and tokens[index + 1] == "(":
+            # Field with arguments: look past them for a selection set
+            depth, probe = 0, index + 1
+            while True:
+                depth += {"(": 1, ")": -1}.get(tokens[probe], 0)
+                probe += 1
+                if depth == 0:
+                    break
+            next_token = tokens[probe] if probe < len(tokens) else None
+        else:
+            probe = index + 1
+            next_token = tokens[probe] if probe < len(tokens) else None
+
+        if next_token == "{":
+            size = None
+            if token == "nodes":
+                # The outermost connection gets the requested page size
+                size = outer_pages.pop() if outer_pages else DEFAULT_CONNECTION_SIZE
+            inner, index = _block_cost(tokens, probe + 1, outer_pages)
+            cost += size * (1 + inner) if size else 1 + inner
+        else:
+            cost += 0.1
+            index = probe
+    return cost, index
+
+
+class AdaptivePager:
+    """Page size controller for one paginated query
+
+    Starts at the largest page whose estimated complexity fits within
+    ``headroom`` of the server limit, then adjusts per page: halve on slow
+    pages or complexity errors, grow by 25% (or bisect towards the last
+    rejected size) while latency and complexity leave room.
+    """
+
+    def __init__(
+        self,
+        query: str,
+        min_size: int = 10,
+        max_size: int = 250,
+        target_latency: float = 1.5,
+        headroom: float = 0.8,
+    ):
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_latency = target_latency
+        self.headroom = headroom
+        self.node_cost = estimate_complexity(query, 1)
+        self.rejected_size = None
+        self.size = self.complexity_cap()
+
+    def complexity_cap(self) -> int:
+        """Largest page size that stays within the complexity budget"""
+        budget = MAX_QUERY_COMPLEXITY * self.headroom
+        cap = int(budget // max(self.node_cost, 0.1))
+        if self.rejected_size is not None:
+            cap = min(cap, self.rejected_size - 1)
+        return max(self.min_size, min(self.max_size, cap))
+
+    def record(self, latency: float, returned: int, complexity: Optional[float] = None):
+        """Adjust the page size after a successful page"""
+        if complexity and returned:
+            # Server-reported complexity beats the static estimate
+            self.node_cost = complexity / self.size
+        cap = self.complexity_cap()
+        if latency > self.target_latency:
+            self.size = max(self.min_size, self.size // 2)
+        elif latency < self.target_latency / 2:
+            if self.rejected_size is not None:
+                # Bisect towards the smallest size the server rejected
+                self.size = (self.size + self.rejected_size) // 2
+            else:
+                self.size = int(self.size * 1.25) + 1
+        self.size = min(self.size, cap)
+
+    def record_complexity_error(self) -> bool:
+        """Shrink after a rejected page; False once already at the minimum"""
+        if self.size <= self.min_size:
+            return False
+        self.rejected_size = self.size
+        self.size = max(self.min_size, self.size // 2)
+        return True
+
+
+def reported_complexity(headers: Dict) -> Optional[float]:
+    """Complexity Linear reports for the last query, if any"""
+    value = headers.get("x-complexity") if headers else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
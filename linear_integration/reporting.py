@@ -0,0 +1,152 @@
+"""
+Output modes for Linear provisioning
+rich (styled console output), quiet (errors only) or json (JSON lines written
+by a buffered background thread), selected with LINEAR_LOG_MODE
+"""
+
+import atexit
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Optional, TextIO
+
+from rich.console import Console
+
+console = Console()
+
+MODES = ("rich", "quiet", "json")
+
+STYLES = {"success": "green", "error": "red", "warning": "yellow", "info": "blue"}
+SYMBOLS = {"success": "✓ ", "error": "✗ "}
+
+
+class JsonLinesSink:
+    """Buffered JSON-lines writer running on its own thread
+
+    Producers only enqueue; the writer thread serializes and writes records
+    in batches so callers never pay for formatting or terminal I/O.
+    """
+
+    def __init__(
+        self, stream: TextIO, flush_interval: float = 0.5, owns_stream: bool = False
+    ):
+        self.stream = stream
+        self.flush_interval = flush_interval
+        self.owns_stream = owns_stream
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._run, name="linear-log-sink", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, record: dict):
+        self._queue.put(record)
+
+    def close(self):
+        """Write everything still queued and stop the writer thread
+
+        A stream the sink opened itself (``owns_stream``) is closed too.
+        """
+        self._queue.put(None)
+        self._thread.join()
+        if self.owns_stream:
+            self.stream.close()
+
+    def _run(self):
+        while True:
+            try:
+                record = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            lines = []
+            while record is not None:
+                lines.append(json.dumps(record, default=str))
+                try:
+                    record = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if lines:
+                self.stream.write("\n".join(lines) + "\n")
+                self.stream.flush()
+            if record is None:
+                return
+
+
+class Reporter:
+    """Routes provisioning events to the active output mode"""
+
+    def __init__(self, mode: Optional[str] = None):
+        self._mode = mode
+        self._sink: Optional[JsonLinesSink] = None
+
+    @property
+    def mode(self) -> str:
+        if self._mode is None:
+            self.set_mode(os.getenv("LINEAR_LOG_MODE", "rich"))
+        return self._mode
+
+    @property
+    def rich(self) -> bool:
+        """True when live rich output (progress spinners, tables) is wanted"""
+        return self.mode == "rich"
+
+    def set_mode(self, mode: str, stream: TextIO = None):
+        """Switch output mode; json output goes to ``stream`` (default stdout)"""
+        if mode not in MODES:
+            raise ValueError(f"LINEAR_LOG_MODE must be one of {', '.join(MODES)}")
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
+        if mode == "json":
+            if stream is None and os.getenv("LINEAR_LOG_FILE"):
+                self._sink = JsonLinesSink(
+                    open(os.environ["LINEAR_LOG_FILE"], "a"), owns_stream=True
+                )
+            else:
+                self._sink = JsonLinesSink(stream or sys.stdout)
+        self._mode = mode
+
+    def emit(self, level: str, event: str, message: str, **fields):
+        """Report an event, e.g. ``emit("success", "label.created", "...")``"""
+        mode = self.mode
+        if mode == "json":
+            record = {"ts": time.time(), "level": level, "event": event}
+            record.update(fields)
+            record["message"] = message
+            if self._sink is not None:
+                self._sink.write(record)
+            else:
+                # Closed (e.g. by the exit hook): write synchronously instead
+                sys.stdout.write(json.dumps(record, default=str) + "\n")
+                sys.stdout.flush()
+        elif mode == "rich" or level in ("error", "warning"):
+            style = STYLES.get(level, "white")
+            console.print(f"[{style}]{SYMBOLS.get(level, '')}{message}[/{style}]")
+
+    def success(self, event: str, message: str, **fields):
+        self.emit("success", event, message, **fields)
+
+    def error(self, event: str, message: str, **fields):
+        self.emit("error", event, message, **fields)
+
+    def warning(self, event: str, message: str, **fields):
+        self.emit("warning", event, message, **fields)
+
+    def info(self, event: str, message: str, **fields):
+        self.emit("info", event, message, **fields)
+
+    def close(self):
+        """Flush buffered output
+
+        Events reported afterwards in json mode are written to stdout directly.
+        """
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
+
+
+reporter = Reporter()
+atexit.register(reporter.close)
@@ -0,0 +1,161 @@
+"""
+Resilience helpers for the Linear API client
+Circuit breakers, latency tracking and hedged requests for tail-latency control
+"""
+
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor
+from typing import Callable, Dict, Optional
+
+OPERATION_PATTERN = re.compile(r"\b(?:query|mutation)\s+(\w+)")
+
+
+def operation_name(query: str) -> str:
+    """Return the GraphQL operation name of a query ("anonymous" if unnamed)"""
+    match = OPERATION_PATTERN.search(query)
+    return match.group(1) if match else "anonymous"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because its circuit is open"""
+
+    def __init__(self, operation: str, retry_in: float):
+        super().__init__(f"Circuit for {operation} is open; retry in {retry_in:.1f}s")
+        self.operation = operation
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Per-operation circuit breaker
+
+    Closed: calls pass through and failures are counted.
+    Open: calls fail fast until ``reset_timeout`` seconds have passed.
+    Half-open: a single probe call is let through; success closes the
+    circuit, failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed right now"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probing = False
+            # Half-open: only one probe in flight at a time
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def retry_in(self) -> float:
+        """Seconds until the circuit will allow a probe"""
+        remaining = self.reset_timeout - (time.monotonic() - self.opened_at)
+        return max(0.0, remaining)
+
+    def record_success(self):
+        """Record a successful call"""
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        """Record a failed call, opening the circuit if needed"""
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+class LatencyTracker:
+    """Rolling window of request latencies for one operation"""
+
+    def __init__(self, window: int = 200):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        """Add a latency sample"""
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Return the given percentile, or None without samples"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(round(pct / 100 * (len(samples) - 1))))
+        return samples[index]
+
+
+_SKIPPED = object()
+
+
+def hedged_call(fn: Callable, delay: float, executor: Executor):
+    """Run ``fn`` in this thread, hedged by a second attempt on ``executor``
+
+    Only use for idempotent calls. The hedge is a task that waits out
+    ``delay`` and only calls ``fn`` if the first attempt is still running,
+    so the pool holds hedges alone and first attempts never queue behind
+    them. A successful first attempt wins; if it fails, the hedge's result
+    is used when one was sent, and the first error is raised otherwise.
+    """
+    deadline = time.monotonic() + delay
+    finished = threading.Event()
+
+    def hedge():
+        if finished.wait(max(0.0, deadline - time.monotonic())):
+            return _SKIPPED
+        return fn()
+
+    future = executor.submit(hedge)
+    try:
+        return fn()
+    except Exception as error:
+        finished.set()
+        if future.cancel():
+            raise
+        try:
+            result = future.result()
+        except Exception:
+            raise error from None
+        if result is _SKIPPED:
+            raise
+        return result
+    finally:
+        finished.set()
+        future.cancel()
+
+
+def parse_timeouts(value: str) -> Dict[str, float]:
+    """Parse "GetLabels=5,GetIssues=15" into a per-operation timeout dict"""
+    timeouts = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        name, _, seconds = item.partition("=")
+        timeouts[name.strip()] = float(seconds)
+    return timeouts
@@ -0,0 +1,482 @@
+"""
+GraphQL operation validation against a cached Linear schema snapshot
+Rejects typos and type mismatches locally instead of costing a round trip
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+INTROSPECTION_QUERY = """
+query IntrospectSchema {
+    __schema {
+        queryType { name }
+        mutationType { name }
+        types {
+            kind
+            name
+            fields(includeDeprecated: true) {
+                name
+                args { name defaultValue type { ...TypeRef } }
+                type { ...TypeRef }
+            }
+            inputFields { name defaultValue type { ...TypeRef } }
+            enumValues(includeDeprecated: true) { name }
+        }
+    }
+}
+
+fragment TypeRef on __Type {
+    kind
+    name
+    ofType { kind name ofType { kind name ofType { kind name ofType { kind name } } } }
+}
+"""
+
+TOKEN_PATTERN = re.compile(
+    r'"(?:[^"\\]|\\.)*"|\.\.\.|\$?[A-Za-z_]\w*|-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?'
+    r"|[{}()\[\]:!=@]"
+)
+
+SCALAR_TYPES = {
+    "String": str,
+    "ID": str,
+    "Int": int,
+    "Float": (int, float),
+    "Boolean": bool,
+}
+
+
+class GraphQLValidationError(ValueError):
+    """Raised when an operation or its variables do not match the schema"""
+
+    def __init__(self, operation: str, errors: List[str]):
+        super().__init__(f"Invalid GraphQL operation {operation}: " + "; ".join(errors))
+        self.operation = operation
+        self.errors = errors
+
+
+def _type_string(ref: Dict) -> str:
+    if ref["kind"] == "NON_NULL":
+        return _type_string(ref["ofType"]) + "!"
+    if ref["kind"] == "LIST":
+        return "[" + _type_string(ref["ofType"]) + "]"
+    return ref["name"]
+
+
+def _named(type_string: str) -> str:
+    return type_string.strip("[]!")
+
+
+def _compatible(variable: str, expected: str) -> bool:
+    """Can a variable of type ``variable`` be used where ``expected`` is required"""
+    if expected.endswith("!"):
+        return variable.endswith("!") and _compatible(variable[:-1], expected[:-1])
+    if variable.endswith("!"):
+        return _compatible(variable[:-1], expected)
+    if expected.startswith("["):
+        return variable.startswith("[") and _compatible(variable[1:-1], expected[1:-1])
+    if variable.startswith("["):
+        return False
+    # Linear takes IDs as String arguments; treat the two as interchangeable
+    return variable == expected or {variable, expected} <= {"ID", "String"}
+
+
+def compact_schema(introspection: Dict) -> Dict:
+    """Reduce an introspection result to what validation needs"""
+    schema = introspection["data"]["__schema"]
+    types = {}
+    for item in schema["types"]:
+        entry = {"kind": item["kind"]}
+        if item.get("fields"):
+            entry["fields"] = {
+                field["name"]: {
+                    "type": _type_string(field["type"]),
+                    "args": {
+                        arg["name"]: {
+                            "type": _type_string(arg["type"]),
+                            "default": arg.get("defaultValue") is not None,
+                        }
+                        for arg in field.get("args") or []
+                    },
+                }
+                for field in item["fields"]
+            }
+        if item.get("inputFields"):
+            entry["inputFields"] = {
+                field["name"]: {
+                    "type": _type_string(field["type"]),
+                    "default": field.get("defaultValue") is not None,
+                }
+                for field in item["inputFields"]
+            }
+        if item.get("enumValues"):
+            entry["enumValues"] = [value["name"] for value in item["enumValues"]]
+        types[item["name"]] = entry
+    return {
+        "queryType": schema["queryType"]["name"],
+        "mutationType": (schema.get("mutationType") or {}).get("name"),
+        "types": types,
+    }
+
+
+class _Document:
+    """Parsed operation: name, variable definitions and validation errors"""
+
+    def __init__(self, schema: Dict, query: str):
+        self.types = schema["types"]
+        self.tokens = [token for token in TOKEN_PATTERN.findall(query)]
+        self.pos = 0
+        self.name = "anonymous"
+        self.variables: Dict[str, Dict] = {}
+        self.used = set()
+        self.errors: List[str] = []
+
+        kind = "query"
+        if self._peek() in ("query", "mutation"):
+            kind = self._next()
+            if self._peek() not in ("(", "{"):
+                self.name = self._next()
+            if self._peek() == "(":
+                self._variable_definitions()
+        root = schema["queryType"] if kind == "query" else schema["mutationType"]
+        self._selection_set(root)
+
+        for name in self.variables:
+            if name not in self.used:
+                self.errors.append(f"Variable ${name} is never used")
+
+    # Token helpers
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _next(self) -> str:
+        token = self._peek()
+        if token is None:
+            raise IndexError("Unexpected end of document")
+        self.pos += 1
+        return token
+
+    def _expect(self, token: str):
+        actual = self._next()
+        if actual != token:
+            raise SyntaxError(f"Expected {token!r}, got {actual!r}")
+
+    def _type(self) -> str:
+        if self._peek() == "[":
+            self._next()
+            inner = self._type()
+            self._expect("]")
+            result = f"[{inner}]"
+        else:
+            result = self._next()
+        if self._peek() == "!":
+            self._next()
+            result += "!"
+        return result
+
+    def _skip_block(self, opening: str, closing: str):
+        depth = 0
+        while True:
+            token = self._next()
+            depth += (token == opening) - (token == closing)
+            if depth == 0:
+                return
+
+    # Grammar
+
+    def _variable_definitions(self):
+        self._expect("(")
+        while self._peek() != ")":
+            token = self._next()
+            name = token[1:]
+            self._expect(":")
+            type_string = self._type()
+            has_default = False
+            if self._peek() == "=":
+                self._next()
+                self._value(None)
+                has_default = True
+            if _named(type_string) not in self.types:
+                self.errors.append(f"Unknown type {type_string} for ${name}")
+            elif self.types[_named(type_string)]["kind"] not in (
+                "SCALAR",
+                "ENUM",
+                "INPUT_OBJECT",
+            ):
+                self.errors.append(
+                    f"${name} must have an input type, not {type_string}"
+                )
+            self.variables[name] = {"type": type_string, "default": has_default}
+        self._expect(")")
+
+    def _selection_set(self, type_name: str):
+        type_def = self.types.get(type_name, {})
+        fields = type_def.get("fields", {})
+        self._expect("{")
+        while self._peek() != "}":
+            name = self._next()
+            if name == "...":
+                # Fragments are not used by this client; skip them
+                self._next()
+                if self._peek() == "{":
+                    self._skip_block("{", "}")
+                continue
+            if self._peek() == ":":
+                self._next()
+                name = self._next()
+
+            field = fields.get(name)
+            if field is None and not name.startswith("__"):
+                # __typename, __schema and __type are introspection meta-fields
+                self.errors.append(f"Unknown field {name} on {type_name}")
+            if field is not None:
+                self._arguments(field["args"], f"{type_name}.{name}")
+            elif self._peek() == "(":
+                self._skip_block("(", ")")
+            if field is None:
+                if self._peek() == "{":
+                    self._skip_block("{", "}")
+                continue
+
+            named = _named(field["type"])
+            is_composite = self.types.get(named, {}).get("kind") in (
+                "OBJECT",
+                "INTERFACE",
+                "UNION",
+            )
+            if self._peek() == "{":
+                if is_composite:
+                    self._selection_set(named)
+                else:
+                    self.errors.append(
+                        f"{type_name}.{name} is {named} and has no fields"
+                    )
+                    self._skip_block("{", "}")
+            elif is_composite:
+                self.errors.append(f"{type_name}.{name} needs a selection of fields")
+        self._expect("}")
+
+    def _arguments(self, definitions: Dict, owner: str):
+        given = set()
+        if self._peek() == "(":
+            self._next()
+            while self._peek() != ")":
+                name = self._next()
+                self._expect(":")
+                given.add(name)
+                definition = definitions.get(name)
+                if definition is None:
+                    self.errors.append(f"Unknown argument {name} on {owner}")
+                    self._value(None)
+                else:
+                    self._value(definition["type"], f"{owner}({name})")
+            self._expect(")")
+        for name, definition in definitions.items():
+            required = definition["type"].endswith("!") and not definition["default"]
+            if required and name not in given:
+                self.errors.append(f"Missing required argument {name} on {owner}")
+
+    def _value(self, expected: Optional[str], where: str = ""):
+        token = self._next()
+        if token.startswith("$"):
+            name = token[1:]
+            self.used.add(name)
+            declared = self.variables.get(name)
+            if declared is None:
+                self.errors.append(f"Variable ${name} is not declared")
+            elif expected and not _compatible(declared["type"], expected):
+                if not (
+                    declared["default"]
+                    and _compatible(declared["type"] + "!", expected)
+                ):
+                    self.errors.append(
+                        f"${name} is {declared['type']} but {where} expects {expected}"
+                    )
+        elif token == "{":
+            input_type = self.types.get(_named(expected or ""), {})
+            fields = input_type.get("inputFields")
+            if expected and fields is None:
+                self.errors.append(f"{where} expects {expected}, not an object")
+            given = set()
+            while self._peek() != "}":
+                name = self._next()
+                self._expect(":")
+                given.add(name)
+                field = (fields or {}).get(name)
+                if fields is not None and field is None:
+                    self.errors.append(f"Unknown field {name} in {_named(expected)}")
+                self._value(
+                    field["type"] if field else None, f"{_named(expected or '')}.{name}"
+                )
+            self._expect("}")
+            for name, field in (fields or {}).items():
+                if (
+                    field["type"].endswith("!")
+                    and not field["default"]
+                    and name not in given
+                ):
+                    self.errors.append(
+                        f"Missing required field {name} in {_named(expected)}"
+                    )
+        elif token == "[":
+            inner = expected.rstrip("!")[1:-1] if expected and "[" in expected else None
+            while self._peek() != "]":
+                self._value(inner, where)
+            self._expect("]")
+        elif token == "null" and expected and expected.endswith("!"):
+            self.errors.append(f"{where} expects {expected}, got null")
+
+
+class SchemaValidator:
+    """Validates operations (and optionally variables) against a schema snapshot"""
+
+    def __init__(self, schema: Dict, cache_size: int = 256):
+        self.schema = schema
+        self.cache_size = cache_size
+        self._documents: Dict[str, _Document] = {}
+
+    @classmethod
+    def load(cls, path: str) -> Optional["SchemaValidator"]:
+        """Load a cached snapshot; None if it has not been fetched yet"""
+        path = Path(path)
+        if not path.exists():
+            return None
+        return cls(json.loads(path.read_text()))
+
+    def document(self, query: str) -> _Document:
+        """Parse and validate an operation once; results are cached by content"""
+        key = hashlib.sha1(query.encode()).hexdigest()
+        document = self._documents.get(key)
+        if document is None:
+            try:
+                document = _Document(self.schema, query)
+            except (SyntaxError, IndexError) as e:
+                raise GraphQLValidationError("anonymous", [f"Syntax error: {e}"])
+            if len(self._documents) >= self.cache_size:
+                self._documents.pop(next(iter(self._documents)))
+            self._documents[key] = document
+        return document
+
+    def variable_errors(self, document: _Document, variables: Dict) -> List[str]:
+        """Check variable values against their declared types"""
+        errors = []
+        for name in variables:
+            if name not in document.variables:
+                errors.append(f"Unknown variable ${name}")
+        for name, declared in document.variables.items():
+            value = variables.get(name)
+            if value is None:
+                if declared["type"].endswith("!") and not declared["default"]:
+                    errors.append(
+                        f"Variable ${name} of type {declared['type']} is required"
+                    )
+                continue
+            errors.extend(self._value_errors(value, declared["type"], f"${name}"))
+        return errors
+
+    def _value_errors(self, value, type_string: str, path: str) -> List[str]:
+        if value is None:
+            if type_string.endswith("!"):
+                return [f"{path} must not be null"]
+            return []
+        type_string = type_string.rstrip("!")
+        if type_string.startswith("["):
+            if not isinstance(value, (list, tuple)):
+                return [f"{path} must be a list"]
+            inner = type_string[1:-1]
+            return [
+                error
+                for index, item in enumerate(value)
+                for error in self._value_errors(item, inner, f"{path}[{index}]")
+            ]
+
+        type_def = self.schema["types"].get(type_string, {})
+        kind = type_def.get("kind")
+        if type_string in SCALAR_TYPES:
+            expected = SCALAR_TYPES[type_string]
+            if isinstance(value, bool) and type_string != "Boolean":
+                return [f"{path} must be {type_string}, got bool"]
+            if not isinstance(value, expected):
+                return [f"{path} must be {type_string}, got {type(value).__name__}"]
+        elif kind == "ENUM":
+            if value not in type_def.get("enumValues", []):
+                return [f"{path} has invalid {type_string} value {value!r}"]
+        elif kind == "INPUT_OBJECT":
+            if not isinstance(value, dict):
+                return [f"{path} must be an object ({type_string})"]
+            fields = type_def.get("inputFields", {})
+            errors = [
+                f"Unknown field {path}.{name} in {type_string}"
+                for name in value
+                if name not in fields
+            ]
+            for name, field in fields.items():
+                if name in value:
+                    errors.extend(
+                        self._value_errors(value[name], field["type"], f"{path}.{name}")
+                    )
+                elif field["type"].endswith("!") and not field["default"]:
+                    errors.append(f"{path}.{name} is required in {type_string}")
+            return errors
+        return []
+
+    def check(self, query: str, variables: Dict = None):
+        """Raise GraphQLValidationError if the operation (or variables) is invalid"""
+        document = self.document(query)
+        errors = list(document.errors)
+        if variables is not None:
+            errors.extend(self.variable_errors(document, variables))
+        if errors:
+            raise GraphQLValidationError(document.name, errors)
+
+    def check_all(self, queries: Iterable[str]):
+        """Validate a set of operations up front, reporting every failure"""
+        errors = []
+        for query in queries:
+            document = self.document(query)
+            errors.extend(f"{document.name}: {error}" for error in document.errors)
+        if errors:
+            raise GraphQLValidationError("startup", errors)
+
+
+def fetch_schema(api, path: str) -> SchemaValidator:
+    """Introspect Linear's schema and save a compact snapshot to ``path``"""
+    result = api._make_request(INTROSPECTION_QUERY)
+    schema = compact_schema(result)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(schema))
+    return SchemaValidator(schema)
+
+
+def main():
+    """Fetch (or refresh) the schema snapshot and validate the client's operations"""
+    from linear_api import OPERATIONS, LinearAPI
+    from reporting import console
+
+    try:
+        # The saved snapshot may be the stale one being refreshed, so the
+        # client must not validate its operations against it
+        api = LinearAPI(validate=False)
+        validator = fetch_schema(api, api.config.schema_path)
+        console.print(
+            f"[green]✓ Saved schema snapshot to {api.config.schema_path}[/green]"
+        )
+        validator.check_all(OPERATIONS)
+        console.print(f"[green]✓ All {len(OPERATIONS)} operations are valid[/green]")
+    except GraphQLValidationError as e:
+        for error in e.errors:
+            console.print(f"[red]✗ {error}[/red]")
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        console.print(
+            "[yellow]Make sure your Linear API credentials are correctly set in the .env file.[/yellow]"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Single-flight request coalescing
+Concurrent identical calls share one execution and fan the result out to every waiter
+"""
+
+import asyncio
+import json
+import threading
+from typing import Awaitable, Callable, Dict, Hashable
+
+
+def request_key(operation: str, variables: Dict = None) -> tuple:
+    """Build a coalescing key from an operation name and its variables"""
+    return operation, json.dumps(variables or {}, sort_keys=True, default=str)
+
+
+class _Call:
+    """An in-flight call that followers wait on"""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Thread-based single-flight group
+
+    The first caller for a key runs ``fn``; callers arriving while it is in
+    flight block until it finishes and receive the same result (or exception).
+    Shared results must be treated as read-only.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable):
+        """Run ``fn`` once for all concurrent callers with the same key"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+
+class AsyncSingleFlight:
+    """asyncio single-flight group
+
+    The first coroutine for a key starts ``factory()`` as a task; others
+    await the same task. Cancelling one waiter does not cancel the shared task.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable]):
+        """Await ``factory()`` once for all concurrent callers with the same key"""
+        loop_key = (id(asyncio.get_running_loop()), key)
+        task = self._tasks.get(loop_key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._tasks[loop_key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(loop_key, None))
+        return await asyncio.shield(task)
@@ -0,0 +1,243 @@
+"""
+Pluggable HTTP transports for the Linear API client
+Live transports (requests over HTTP/1.1, httpx over HTTP/2) plus record/replay
+transports backed by cassette files, so tests and benchmarks can run without
+credentials or network
+"""
+
+import asyncio
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import requests
+from resilience import operation_name
+
+
+class TransportError(Exception):
+    """Raised by transports for failures that are not requests exceptions"""
+
+
+class CassetteMissError(TransportError):
+    """Raised in replay mode when no recorded interaction matches a request"""
+
+
+class TransportResponse:
+    """Minimal response object mirroring the parts of requests.Response we use"""
+
+    def __init__(self, status_code: int, headers: Dict, payload: Dict):
+        self.status_code = status_code
+        self.headers = requests.structures.CaseInsensitiveDict(headers or {})
+        self._payload = payload
+
+    def json(self) -> Dict:
+        return self._payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise TransportError(f"HTTP {self.status_code}")
+
+
+class RequestsTransport:
+    """Live transport using a pooled requests.Session"""
+
+    def __init__(self):
+        self.session = requests.Session()
+
+    def post(self, url: str, headers: Dict, payload: Dict, timeout: float):
+        return self.session.post(url, headers=headers, json=payload, timeout=timeout)
+
+    def credentials(self) -> Dict[str, str]:
+        """Fallback credentials when the environment has none"""
+        return {}
+
+
+class HttpxTransport:
+    """Live transport multiplexing concurrent requests over one HTTP/2 connection
+
+    Requires ``httpx[http2]``. Safe to share between threads: every request
+    becomes a stream on the same connection, with HPACK-compressed headers.
+    Requests run on an ``AsyncClient`` owned by a private event-loop thread,
+    because httpcore's sync HTTP/2 connection can send stream IDs out of order
+    when several threads open streams at once. ``prior_knowledge`` speaks
+    HTTP/2 without TLS/ALPN (local stand-in servers).
+    """
+
+    def __init__(
+        self,
+        http2: bool = True,
+        max_connections: int = 10,
+        prior_knowledge: bool = False,
+    ):
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "LINEAR_HTTP2 needs httpx with HTTP/2 support: "
+                "pip install 'httpx[http2]'"
+            ) from e
+
+        self._httpx = httpx
+        # Protocol of the most recent response, e.g. "HTTP/2"
+        self.http_version = None
+        self.client = httpx.AsyncClient(
+            http1=not prior_knowledge,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(
+            target=self._loop.run_forever, name="linear-http2", daemon=True
+        ).start()
+
+    def post(self, url: str, headers: Dict, payload: Dict, timeout: float):
+        request = self.client.post(url, headers=headers, json=payload, timeout=timeout)
+        try:
+            response = asyncio.run_coroutine_threadsafe(request, self._loop).result()
+        except self._httpx.HTTPError as e:
+            raise TransportError(str(e)) from e
+        self.http_version = response.http_version
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+        return TransportResponse(response.status_code, response.headers, body)
+
+    def close(self):
+        """Close the connection and stop the event-loop thread"""
+        asyncio.run_coroutine_threadsafe(self.client.aclose(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+    def credentials(self) -> Dict[str, str]:
+        return {}
+
+
+def live_transport():
+    """The live transport selected by LINEAR_HTTP2"""
+    if os.getenv("LINEAR_HTTP2", "").lower() in ("1", "true", "yes"):
+        return HttpxTransport()
+    return RequestsTransport()
+
+
+def _match_key(payload: Dict) -> Tuple[str, str]:
+    variables = json.dumps(payload.get("variables") or {}, sort_keys=True)
+    return operation_name(payload["query"]), variables
+
+
+def read_cassette(path: str) -> Tuple[str, List[Dict]]:
+    """Team id and interactions of a cassette
+
+    Cassettes are JSON Lines: a ``{"team_id": ...}`` header, then one
+    interaction per line. Older single-document cassettes still load.
+    """
+    text = Path(path).read_text()
+    try:
+        cassette = json.loads(text)
+    except ValueError:
+        lines = [json.loads(line) for line in text.splitlines() if line.strip()]
+        header = lines[0] if lines else {}
+        return header.get("team_id", ""), lines[1:]
+    return cassette.get("team_id", ""), cassette.get("interactions", [])
+
+
+class RecordingTransport:
+    """Forwards to a live transport and appends every exchange to a cassette
+
+    Each interaction is written as one JSON line as it happens, so recording
+    costs the same per request however long the session runs.
+    """
+
+    def __init__(self, path: str, inner=None, team_id: str = ""):
+        self.path = Path(path)
+        self.inner = inner or live_transport()
+        self.team_id = team_id or os.getenv("LINEAR_TEAM_ID", "")
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("w")
+        self._write({"team_id": self.team_id})
+
+    def post(self, url: str, headers: Dict, payload: Dict, timeout: float):
+        response = self.inner.post(url, headers, payload, timeout)
+        operation, _ = _match_key(payload)
+        interaction = {
+            "operation": operation,
+            "variables": payload.get("variables") or {},
+            "status": response.status_code,
+            "headers": {
+                key: value
+                for key, value in response.headers.items()
+                if key.lower().startswith("x-")
+            },
+            "response": response.json(),
+        }
+        with self._lock:
+            self._write(interaction)
+        return response
+
+    def _write(self, record: Dict):
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    def close(self):
+        """Close the cassette and the live transport"""
+        with self._lock:
+            self._file.close()
+        if hasattr(self.inner, "close"):
+            self.inner.close()
+
+    def credentials(self) -> Dict[str, str]:
+        return self.inner.credentials()
+
+
+class ReplayTransport:
+    """Serves recorded responses instantly, matched on operation and variables
+
+    Repeated identical requests are answered with the recorded responses in
+    order; once exhausted the last one is served again.
+    """
+
+    def __init__(self, path: str):
+        self.team_id, interactions = read_cassette(path)
+        self._responses: Dict[Tuple[str, str], List[Dict]] = {}
+        self._served: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        for interaction in interactions:
+            key = (
+                interaction["operation"],
+                json.dumps(interaction.get("variables") or {}, sort_keys=True),
+            )
+            self._responses.setdefault(key, []).append(interaction)
+
+    def post(self, url: str, headers: Dict, payload: Dict, timeout: float):
+        key = _match_key(payload)
+        recorded = self._responses.get(key)
+        if not recorded:
+            raise CassetteMissError(
+                f"No recorded response for {key[0]} with variables {key[1]}"
+            )
+        with self._lock:
+            index = self._served.get(key, 0)
+            self._served[key] = index + 1
+        interaction = recorded[min(index, len(recorded) - 1)]
+        return TransportResponse(
+            interaction.get("status", 200),
+            interaction.get("headers"),
+            interaction["response"],
+        )
+
+    def credentials(self) -> Dict[str, str]:
+        return {"api_key": "replay", "team_id": self.team_id}
+
+
+def transport_from_env():
+    """Pick a transport from LINEAR_RECORD / LINEAR_REPLAY / LINEAR_HTTP2"""
+    if os.getenv("LINEAR_REPLAY"):
+        return ReplayTransport(os.environ["LINEAR_REPLAY"])
+    if os.getenv("LINEAR_RECORD"):
+        return RecordingTransport(os.environ["LINEAR_RECORD"])
+    return live_transport()
@@ -0,0 +1,144 @@
+"""
+Live roadmap dashboard
+Keeps a rich.Live table on screen and polls Linear only for issues updated
+since the last tick, backing off while nothing changes
+"""
+
+import time
+from datetime import datetime
+from typing import List, Tuple
+
+from filters import IssueFilter
+from hierarchy import IssueIndex
+from linear_api import LinearAPI, console
+from models import Issue
+from rich.live import Live
+from rich.table import Table
+
+
+class RoadmapWatcher:
+    """Incrementally refreshed roadmap table
+
+    The first tick fetches every issue; later ticks only ask for issues whose
+    ``updatedAt`` is at or after the newest one seen (the watermark). The poll
+    interval halves after a tick with changes and grows by ``backoff`` after
+    a quiet one, within ``[min_interval, max_interval]``.
+    """
+
+    def __init__(
+        self,
+        api: LinearAPI = None,
+        min_interval: float = 5.0,
+        max_interval: float = 120.0,
+        backoff: float = 1.5,
+    ):
+        self.api = api or LinearAPI()
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = min_interval
+        self.index = IssueIndex()
+        self.watermark = None
+        self.changed: List[str] = []
+        self.last_poll = None
+        self.error = None
+
+    def poll(self) -> List[Issue]:
+        """Fetch issues changed since the watermark and patch them into the index"""
+        issue_filter = None
+        if self.watermark is not None:
+            issue_filter = IssueFilter().updated(after=self.watermark)
+
+        changed = []
+        for issue in self.api.iter_issues(
+            as_models=True, filter=issue_filter, fresh=True
+        ):
+            known = self.index.get(issue.id)
+            # The watermark is inclusive, so the newest issue comes back every
+            # tick; only count it when it actually changed
+            if known is None or known.updated_at != issue.updated_at:
+                self.index.add(issue)
+                changed.append(issue)
+            if issue.updated_at and (
+                self.watermark is None or issue.updated_at > self.watermark
+            ):
+                self.watermark = issue.updated_at
+        return changed
+
+    def tick(self):
+        """Poll once and adapt the interval to the change rate"""
+        first = self.watermark is None
+        try:
+            changed = self.poll()
+        except Exception as e:
+            self.error = str(e)
+            self.interval = self.max_interval
+            return
+        self.error = None
+        self.last_poll = datetime.now()
+        self.changed = [] if first else [issue.id for issue in changed]
+        if changed and not first:
+            self.interval = max(self.min_interval, self.interval / 2)
+        else:
+            self.interval = min(self.max_interval, self.interval * self.backoff)
+
+    def render(self) -> Table:
+        """Build the roadmap table from the in-memory index"""
+        table = Table(title="Python Learning Roadmap (live)")
+        table.add_column("ID", style="cyan")
+        table.add_column("Title", style="white")
+        table.add_column("Labels", style="magenta")
+        table.add_column("Status", style="green")
+        table.add_column("Children", style="yellow")
+
+        recent = set(self.changed)
+        for issue in sorted(self.index, key=_sort_key):
+            table.add_row(
+                issue.identifier,
+                issue.title,
+                ", ".join(issue.label_names),
+                issue.state_name,
+                str(len(self.index.children(issue.id))),
+                style="bold" if issue.id in recent else None,
+            )
+
+        if self.error:
+            table.caption = f"[red]Poll failed: {self.error}[/red]"
+        elif self.last_poll:
+            table.caption = (
+                f"Updated {self.last_poll:%H:%M:%S} · {len(self.changed)} changed · "
+                f"next poll in {self.interval:.0f}s · Ctrl+C to stop"
+            )
+        return table
+
+    def run(self):
+        """Show the dashboard until interrupted"""
+        self.tick()
+        with Live(self.render(), console=console, refresh_per_second=1) as live:
+            try:
+                while True:
+                    time.sleep(self.interval)
+                    self.tick()
+                    live.update(self.render())
+            except KeyboardInterrupt:
+                pass
+
+
+def _sort_key(issue: Issue) -> Tuple[str, int]:
+    team, _, number = (issue.identifier or "").rpartition("-")
+    return (team, int(number) if number.isdigit() else 0)
+
+
+def main():
+    """Watch the roadmap live"""
+    try:
+        RoadmapWatcher().run()
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        console.print(
+            "[yellow]Make sure your Linear API credentials are correctly set in the .env file.[/yellow]"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,856 @@
+"""
+Module 6 Learning API as a database-backed service
+The users/posts API from fastapi_apis.ipynb, stored with async SQLAlchemy in
+the database configured by DATABASE_URL (or the SQLite file at SQLITE_DB_PATH)
+
+Run it with:
+    uvicorn modules.module_6_fastapi_apis.fastapi_apis:app
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from itertools import count
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from dotenv import load_dotenv
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, EmailStr, ValidationError
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Index,
+    Select,
+    String,
+    Text,
+    event,
+    insert,
+    or_,
+    select,
+    tuple_,
+)
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.pool import StaticPool
+
+try:
+    import orjson
+except ImportError:  # Only the fast JSON path needs it; exports fall back to json
+    orjson = None
+
+# Async drivers for the sync URLs people usually put in DATABASE_URL
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+# List endpoints return pages of at most MAX_PAGE_SIZE rows
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Serialized GET responses kept by ResponseCache (env: RESPONSE_CACHE_SIZE)
+RESPONSE_CACHE_SIZE = 1024
+
+# Rows per server-side cursor fetch in the NDJSON exports
+EXPORT_BATCH_SIZE = 1000
+
+# Rows validated and inserted per transaction by the bulk endpoints
+BULK_CHUNK_SIZE = 1000
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def database_url() -> str:
+    """DATABASE_URL, or the SQLite file at SQLITE_DB_PATH"""
+    url = os.getenv("DATABASE_URL")
+    if not url:
+        url = f"sqlite:///{os.getenv('SQLITE_DB_PATH', './data/learning.db')}"
+    return url
+
+
+def async_url(url: str) -> str:
+    """``url`` with its sync driver swapped for the async one"""
+    scheme, _, rest = url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}://{rest}"
+
+
+def create_engine(url: str) -> AsyncEngine:
+    """Async engine with a pool sized for the backend
+
+    Postgres gets a bounded, pre-pinged pool (DB_POOL_SIZE/DB_MAX_OVERFLOW).
+    SQLite runs in WAL mode so reads don't wait on the writer; an in-memory
+    database shares one connection, since each connection would otherwise
+    see its own empty database.
+    """
+    url = async_url(url)
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite":
+        return create_async_engine(
+            url,
+            pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+            pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+            pool_recycle=1800,
+            pool_pre_ping=True,
+        )
+
+    if parsed.database in (None, "", ":memory:"):
+        return create_async_engine(
+            url,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+
+    Path(parsed.database).parent.mkdir(parents=True, exist_ok=True)
+    engine = create_async_engine(
+        url,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+        max_overflow=0,
+        connect_args={"timeout": 30},
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _configure(connection, _record):
+        cursor = connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    return engine
+
+
+# Database tables
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class UserRecord(Base):
+    __tablename__ = "users"
+    __table_args__ = (Index("ix_users_created_at_id", "created_at", "id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    username: Mapped[str] = mapped_column(String(50), unique=True)
+    email: Mapped[str] = mapped_column(String(255), unique=True)
+    first_name: Mapped[str] = mapped_column(String(100))
+    last_name: Mapped[str] = mapped_column(String(100))
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=_utcnow)
+    # Bumped by every ORM update; ETags are built from it
+    version: Mapped[int] = mapped_column(default=1)
+
+    __mapper_args__ = {"version_id_col": version}
+
+
+class PostRecord(Base):
+    __tablename__ = "posts"
+    __table_args__ = (
+        Index("ix_posts_created_at_id", "created_at", "id"),
+        Index("ix_posts_author_id_created_at_id", "author_id", "created_at", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str] = mapped_column(String(200))
+    content: Mapped[str] = mapped_column(Text)
+    author_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=_utcnow)
+    version: Mapped[int] = mapped_column(default=1)
+
+    __mapper_args__ = {"version_id_col": version}
+
+
+# Pydantic models for request/response validation
+
+
+class UserBase(BaseModel):
+    username: str
+    email: EmailStr
+    first_name: str
+    last_name: str
+
+
+class UserCreate(UserBase):
+    pass
+
+
+class UserResponse(UserBase):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    created_at: datetime
+
+
+class PostBase(BaseModel):
+    title: str
+    content: str
+
+
+class PostCreate(PostBase):
+    author_id: int
+
+
+class PostResponse(PostBase):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    author_id: int
+    created_at: datetime
+
+
+Item = TypeVar("Item")
+
+
+class Page(BaseModel, Generic[Item]):
+    """One page of a list endpoint; follow ``next`` until it is null"""
+
+    items: List[Item]
+    next_cursor: Optional[str] = None
+    next: Optional[str] = None
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Opaque cursor pointing just after the row (created_at, id)"""
+    data = json.dumps([created_at.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """(created_at, id) of a cursor from ``encode_cursor``"""
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = json.loads(data)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def paginate(
+    session: AsyncSession,
+    statement: Select,
+    record,
+    request: Request,
+    cursor: Optional[str],
+    limit: int,
+) -> dict:
+    """Keyset page of ``statement`` ordered by (created_at, id)
+
+    Seeks past the cursor's row through the (created_at, id) index instead
+    of using OFFSET, so every page costs the same however deep it is.
+    """
+    key = tuple_(record.created_at, record.id)
+    if cursor:
+        statement = statement.where(key > tuple_(*decode_cursor(cursor)))
+    statement = statement.order_by(record.created_at, record.id).limit(limit + 1)
+    rows = (await session.scalars(statement)).all()
+
+    page = {"items": rows[:limit], "next_cursor": None, "next": None}
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        page["next_cursor"] = encode_cursor(last.created_at, last.id)
+        page["next"] = str(
+            request.url.include_query_params(cursor=page["next_cursor"], limit=limit)
+        )
+    return page
+
+
+class ResponseCache:
+    """Bounded LRU of serialized GET responses (ETag and body) keyed by URL
+
+    Each entry is tagged with the rows it was built from, and the write
+    routes ``invalidate`` those tags. Readers snapshot ``generation(tags)``
+    before loading and hand it to ``put``, which drops the body if one of
+    the tags was invalidated meanwhile. The cache lives in the process, so
+    with several workers a write only invalidates the worker that handled it.
+    """
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[str, bytes, Tuple]]" = OrderedDict()
+        self._tags: Dict[Tuple, Set[str]] = {}
+        # Tag -> clock at its last invalidation, oldest first. Forgotten tags
+        # read as the newest forgotten value, so a snapshot never matches again
+        self._generations: "OrderedDict[Tuple, int]" = OrderedDict()
+        self._clock = count(1)
+        self._floor = 0
+
+    def get(self, key: str) -> Optional[Tuple[str, bytes]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0], entry[1]
+
+    def generation(self, tags: Tuple) -> Tuple[int, ...]:
+        """Snapshot of the invalidations of ``tags``, to pass to ``put``"""
+        return tuple(self._generations.get(tag, self._floor) for tag in tags)
+
+    def put(self, key: str, etag: str, body: bytes, tags: Tuple, generation: Tuple):
+        if generation != self.generation(tags):
+            # Built from rows that were written while it loaded
+            return
+        if key in self._entries:
+            self._discard(key)
+        self._entries[key] = (etag, body, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._discard(next(iter(self._entries)))
+
+    def invalidate(self, *tag):
+        """Drop every entry built from the rows named by ``tag``"""
+        self._generations.pop(tag, None)
+        self._generations[tag] = next(self._clock)
+        while len(self._generations) > self.max_entries:
+            _, self._floor = self._generations.popitem(last=False)
+        for key in list(self._tags.get(tag, ())):
+            self._discard(key)
+
+    def _discard(self, key: str):
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags[tag]
+            keys.discard(key)
+            if not keys:
+                del self._tags[tag]
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches ``etag`` (weak comparison)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (
+        candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")
+    )
+
+
+def rows_etag(kind: str, rows, *extra) -> str:
+    """ETag over the (id, version) of ``rows`` plus anything else in the body"""
+    digest = hashlib.sha1(kind.encode())
+    for row in rows:
+        digest.update(f"|{row.id}:{row.version}".encode())
+    for value in extra:
+        digest.update(f"|{value}".encode())
+    return f'"{kind}-{digest.hexdigest()[:20]}"'
+
+
+def to_dict(row, model) -> dict:
+    """The response fields of an ORM row, without Pydantic validation"""
+    return {name: getattr(row, name) for name in model.model_fields}
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def dumps(value) -> bytes:
+    """Compact JSON, through orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":"), default=_json_default).encode()
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded by ``dumps`` (fastapi's ORJSONResponse is deprecated)"""
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+def export_statement(record, model) -> Select:
+    """Core select of a table's response columns in id order"""
+    table = record.__table__
+    return select(*(table.c[name] for name in model.model_fields)).order_by(table.c.id)
+
+
+async def stream_ndjson(engine: AsyncEngine, statement: Select) -> AsyncIterator[bytes]:
+    """Rows of ``statement`` as NDJSON, read through a server-side cursor
+
+    Rows arrive EXPORT_BATCH_SIZE at a time and each batch is written out
+    before the next is fetched, so memory stays flat however many rows match.
+    """
+    async with engine.connect() as connection:
+        result = await connection.stream(
+            statement.execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        async for rows in result.partitions():
+            yield b"".join(dumps(dict(row._mapping)) + b"\n" for row in rows)
+
+
+class BulkError(BaseModel):
+    """Why one row of a bulk request was rejected (``index`` is 0-based)"""
+
+    index: int
+    errors: List[Dict[str, Any]]
+
+
+class BulkResult(BaseModel):
+    received: int
+    created: int
+    errors: List[BulkError]
+
+
+def row_error(field: Optional[str], message: str, kind: str) -> Dict[str, Any]:
+    """One error entry shaped like Pydantic's"""
+    return {"type": kind, "loc": [field] if field else [], "msg": message}
+
+
+async def bulk_payloads(request: Request) -> AsyncIterator[Tuple[int, Any]]:
+    """Rows of a bulk request body with their positions
+
+    NDJSON bodies (``application/x-ndjson``) are read as they arrive and
+    yield each line undecoded; anything else must be one JSON array.
+    """
+    content_type = request.headers.get("content-type", "")
+    if "ndjson" not in content_type and "jsonlines" not in content_type:
+        try:
+            items = (orjson.loads if orjson else json.loads)(await request.body())
+        except ValueError:
+            items = None
+        if not isinstance(items, list):
+            raise HTTPException(
+                status_code=400, detail="Body must be a JSON array or NDJSON"
+            )
+        for index, item in enumerate(items):
+            yield index, item
+        return
+
+    index = 0
+    buffer = b""
+    async for data in request.stream():
+        *lines, buffer = (buffer + data).split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield index, line
+                index += 1
+    if buffer.strip():
+        yield index, buffer
+
+
+def validate(model, payload: Union[bytes, Any]):
+    if isinstance(payload, bytes):
+        return model.model_validate_json(payload)
+    return model.model_validate(payload)
+
+
+async def get_session(request: Request) -> AsyncIterator[AsyncSession]:
+    """One session per request, from the app's session factory"""
+    async with request.app.state.sessionmaker() as session:
+        yield session
+
+
+def create_app(url: str = None, fast_json: bool = None) -> FastAPI:
+    """Build the API against ``url`` (default: ``database_url()``)
+
+    With ``fast_json`` (default: the API_FAST_JSON env var) responses are
+    encoded by orjson straight from the rows, skipping Pydantic validation
+    of the response models.
+    """
+    load_dotenv()
+    if fast_json is None:
+        fast_json = os.getenv("API_FAST_JSON", "false").lower() == "true"
+    if fast_json and orjson is None:
+        raise ImportError("API_FAST_JSON needs orjson: pip install orjson")
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        async with app.state.engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        yield
+        await app.state.engine.dispose()
+
+    app = FastAPI(
+        title="Learning API",
+        description="A simple API for learning FastAPI concepts",
+        version="1.0.0",
+        lifespan=lifespan,
+        **({"default_response_class": FastJSONResponse} if fast_json else {}),
+    )
+    app.state.engine = create_engine(url or database_url())
+    app.state.sessionmaker = async_sessionmaker(
+        app.state.engine, expire_on_commit=False
+    )
+    app.state.response_cache = cache = ResponseCache(
+        int(os.getenv("RESPONSE_CACHE_SIZE", RESPONSE_CACHE_SIZE))
+    )
+
+    def render(model, row) -> bytes:
+        if fast_json:
+            return dumps(to_dict(row, model))
+        return model.model_validate(row).model_dump_json().encode()
+
+    def render_page(model, page: dict) -> bytes:
+        if fast_json:
+            return dumps(
+                dict(page, items=[to_dict(row, model) for row in page["items"]])
+            )
+        return Page[model](**page).model_dump_json().encode()
+
+    def page_response(model, page: dict):
+        """A list endpoint's page, encoded directly on the fast JSON path"""
+        if fast_json:
+            return Response(render_page(model, page), media_type="application/json")
+        return page
+
+    async def conditional_get(request: Request, tags: Tuple, load) -> Response:
+        """Answer a GET from the response cache, or build and cache it
+
+        ``load`` is awaited on a miss and returns the ETag and a function
+        that serializes the body, which only runs when a body is needed.
+        """
+        key = request.url.path + "?" + request.url.query
+        if_none_match = request.headers.get("if-none-match")
+        entry = cache.get(key)
+        if entry is None:
+            generation = cache.generation(tags)
+            etag, serialize = await load()
+            body = None
+            if not etag_matches(if_none_match, etag):
+                body = serialize()
+                cache.put(key, etag, body, tags, generation)
+        else:
+            etag, body = entry
+
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
+
+    # Basic routes
+    @app.get("/")
+    async def root():
+        """Root endpoint"""
+        return {"message": "Welcome to the Learning API!", "version": "1.0.0"}
+
+    @app.get("/health")
+    async def health_check():
+        """Health check endpoint"""
+        return {"status": "healthy", "timestamp": datetime.now(timezone.utc)}
+
+    # User routes
+    @app.post("/users/", response_model=UserResponse)
+    async def create_user(
+        user: UserCreate, session: AsyncSession = Depends(get_session)
+    ):
+        """Create a new user"""
+        # Check if username or email already exists
+        existing = await session.scalar(
+            select(UserRecord).where(
+                or_(
+                    UserRecord.username == user.username, UserRecord.email == user.email
+                )
+            )
+        )
+        if existing is not None:
+            field = "Username" if existing.username == user.username else "Email"
+            raise HTTPException(status_code=400, detail=f"{field} already registered")
+
+        new_user = UserRecord(**user.model_dump())
+        session.add(new_user)
+        try:
+            await session.commit()
+        except IntegrityError:
+            # Lost a race with a concurrent request for the same name/email
+            await session.rollback()
+            raise HTTPException(status_code=400, detail="User already registered")
+        return new_user
+
+    @app.get("/users/", response_model=Page[UserResponse])
+    async def get_users(
+        request: Request,
+        cursor: Optional[str] = None,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        session: AsyncSession = Depends(get_session),
+    ):
+        """Get users, one page at a time"""
+        page = await paginate(
+            session, select(UserRecord), UserRecord, request, cursor, limit
+        )
+        return page_response(UserResponse, page)
+
+    @app.get("/users/export")
+    async def export_users():
+        """Stream every user as newline-delimited JSON"""
+        return StreamingResponse(
+            stream_ndjson(app.state.engine, export_statement(UserRecord, UserResponse)),
+            media_type="application/x-ndjson",
+        )
+
+    @app.get("/users/{user_id}", response_model=UserResponse)
+    async def get_user(user_id: int, request: Request):
+        """Get a specific user by ID"""
+
+        async def load():
+            async with app.state.sessionmaker() as session:
+                user = await session.get(UserRecord, user_id)
+            if user is None:
+                raise HTTPException(status_code=404, detail="User not found")
+            return (
+                rows_etag("user", [user]),
+                lambda: render(UserResponse, user),
+            )
+
+        return await conditional_get(request, (("user", user_id),), load)
+
+    async def bulk_create(
+        request: Request, model, record, check, on_insert=None
+    ) -> dict:
+        """Validate and insert a bulk body BULK_CHUNK_SIZE rows at a time
+
+        ``check(connection, rows)`` returns per-row errors for valid rows that
+        would still fail (duplicates, missing references). Each chunk's
+        accepted rows go in with one executemany in one transaction, then
+        ``on_insert(rows)`` runs.
+        """
+        result = {"received": 0, "created": 0, "errors": []}
+        chunk: List[Tuple[int, dict]] = []
+
+        async def flush():
+            rejected = {}
+            try:
+                async with app.state.engine.begin() as connection:
+                    rejected = await check(connection, chunk)
+                    rows = [(i, row) for i, row in chunk if i not in rejected]
+                    if rows:
+                        await connection.execute(
+                            insert(record), [row for _, row in rows]
+                        )
+            except IntegrityError:
+                rows = None
+            if rows is None:
+                # Raced with another writer; insert one by one to find the rows
+                rows = []
+                for i, row in chunk:
+                    if i in rejected:
+                        continue
+                    try:
+                        async with app.state.engine.begin() as connection:
+                            await connection.execute(insert(record), [row])
+                        rows.append((i, row))
+                    except IntegrityError:
+                        rejected[i] = [
+                            row_error(
+                                None, "Conflicts with an existing row", "conflict"
+                            )
+                        ]
+            result["created"] += len(rows)
+            result["errors"].extend(
+                {"index": i, "errors": errors} for i, errors in sorted(rejected.items())
+            )
+            chunk.clear()
+            if on_insert and rows:
+                on_insert([row for _, row in rows])
+
+        async for index, payload in bulk_payloads(request):
+            result["received"] += 1
+            try:
+                chunk.append((index, validate(model, payload).model_dump()))
+            except ValidationError as e:
+                errors = json.loads(e.json(include_url=False, include_context=False))
+                result["errors"].append({"index": index, "errors": errors})
+                continue
+            if len(chunk) >= BULK_CHUNK_SIZE:
+                await flush()
+        if chunk:
+            await flush()
+        result["errors"].sort(key=lambda error: error["index"])
+        return result
+
+    async def check_users(connection, rows) -> Dict[int, list]:
+        """Usernames and emails already taken, in the database or the chunk"""
+        users = UserRecord.__table__
+        usernames = {row["username"] for _, row in rows}
+        emails = {row["email"] for _, row in rows}
+        existing = await connection.execute(
+            select(users.c.username, users.c.email).where(
+                or_(users.c.username.in_(usernames), users.c.email.in_(emails))
+            )
+        )
+        taken = {"username": set(), "email": set()}
+        for username, email in existing:
+            taken["username"].add(username)
+            taken["email"].add(email)
+
+        rejected = {}
+        for index, row in rows:
+            errors = [
+                row_error(field, f"{field.capitalize()} already registered", "conflict")
+                for field in ("username", "email")
+                if row[field] in taken[field]
+            ]
+            if errors:
+                rejected[index] = errors
+            else:
+                taken["username"].add(row["username"])
+                taken["email"].add(row["email"])
+        return rejected
+
+    async def check_posts(connection, rows) -> Dict[int, list]:
+        """Posts whose author does not exist"""
+        users = UserRecord.__table__
+        authors = {row["author_id"] for _, row in rows}
+        found = set(
+            (
+                await connection.scalars(
+                    select(users.c.id).where(users.c.id.in_(authors))
+                )
+            ).all()
+        )
+        return {
+            index: [row_error("author_id", "Author not found", "not_found")]
+            for index, row in rows
+            if row["author_id"] not in found
+        }
+
+    @app.post("/users/bulk", response_model=BulkResult)
+    async def create_users_bulk(request: Request):
+        """Create many users from a JSON array or an NDJSON stream"""
+        return await bulk_create(request, UserCreate, UserRecord, check_users)
+
+    # Post routes
+    @app.post("/posts/", response_model=PostResponse)
+    async def create_post(
+        post: PostCreate, session: AsyncSession = Depends(get_session)
+    ):
+        """Create a new post"""
+        # Check if author exists
+        if await session.get(UserRecord, post.author_id) is None:
+            raise HTTPException(status_code=404, detail="Author not found")
+
+        new_post = PostRecord(**post.model_dump())
+        session.add(new_post)
+        await session.commit()
+        cache.invalidate("user_posts", new_post.author_id)
+        return new_post
+
+    def invalidate_authors(rows: List[dict]):
+        for author_id in {row["author_id"] for row in rows}:
+            cache.invalidate("user_posts", author_id)
+
+    @app.post("/posts/bulk", response_model=BulkResult)
+    async def create_posts_bulk(request: Request):
+        """Create many posts from a JSON array or an NDJSON stream"""
+        return await bulk_create(
+            request, PostCreate, PostRecord, check_posts, invalidate_authors
+        )
+
+    @app.get("/posts/", response_model=Page[PostResponse])
+    async def get_posts(
+        request: Request,
+        cursor: Optional[str] = None,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        session: AsyncSession = Depends(get_session),
+    ):
+        """Get posts, one page at a time"""
+        page = await paginate(
+            session, select(PostRecord), PostRecord, request, cursor, limit
+        )
+        return page_response(PostResponse, page)
+
+    @app.get("/posts/export")
+    async def export_posts(author_id: Optional[int] = None):
+        """Stream every post (optionally one author's) as newline-delimited JSON"""
+        statement = export_statement(PostRecord, PostResponse)
+        if author_id is not None:
+            statement = statement.where(PostRecord.author_id == author_id)
+        return StreamingResponse(
+            stream_ndjson(app.state.engine, statement),
+            media_type="application/x-ndjson",
+        )
+
+    @app.get("/posts/{post_id}", response_model=PostResponse)
+    async def get_post(post_id: int, request: Request):
+        """Get a specific post by ID"""
+
+        async def load():
+            async with app.state.sessionmaker() as session:
+                post = await session.get(PostRecord, post_id)
+            if post is None:
+                raise HTTPException(status_code=404, detail="Post not found")
+            return (
+                rows_etag("post", [post]),
+                lambda: render(PostResponse, post),
+            )
+
+        return await conditional_get(request, (("post", post_id),), load)
+
+    @app.get("/users/{user_id}/posts", response_model=Page[PostResponse])
+    async def get_user_posts(
+        user_id: int,
+        request: Request,
+        cursor: Optional[str] = None,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    ):
+        """Get posts by a specific user, one page at a time"""
+
+        async def load():
+            async with app.state.sessionmaker() as session:
+                # Check if user exists
+                if await session.get(UserRecord, user_id) is None:
+                    raise HTTPException(status_code=404, detail="User not found")
+                statement = select(PostRecord).where(PostRecord.author_id == user_id)
+                page = await paginate(
+                    session, statement, PostRecord, request, cursor, limit
+                )
+            etag = rows_etag("posts", page["items"], page["next_cursor"])
+            return etag, lambda: render_page(PostResponse, page)
+
+        return await conditional_get(request, (("user_posts", user_id),), load)
+
+    return app
+
+
+def __getattr__(name: str):
+    # ``uvicorn ...fastapi_apis:app`` builds the app on first lookup, so merely
+    # importing the module (e.g. for create_app) touches no database or disk
+    if name == "app":
+        app = globals()["app"] = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        create_app(),
+        host=os.getenv("API_HOST", "0.0.0.0"),
+        port=int(os.getenv("API_PORT", "8000")),
+    )
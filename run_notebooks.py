@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Execute the curriculum notebooks in parallel to check that they still run
+Results are cached by a hash of each notebook's code cells plus the Python
+environment, so unchanged notebooks are skipped on the next run
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from importlib import metadata
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+CACHE_PATH = ROOT / ".cache" / "notebook_runs.json"
+
+
+def notebook_name(path: Path) -> str:
+    """Cache key and display name: the path relative to the repository root"""
+    path = path.resolve()
+    try:
+        return str(path.relative_to(ROOT))
+    except ValueError:
+        return str(path)
+
+
+def environment_fingerprint() -> str:
+    """Hash of the interpreter version and every installed distribution"""
+    packages = sorted(
+        f"{dist.metadata['Name']}=={dist.version}".lower()
+        for dist in metadata.distributions()
+        if dist.metadata["Name"]
+    )
+    digest = hashlib.sha256(sys.version.encode())
+    digest.update("\n".join(packages).encode())
+    return digest.hexdigest()
+
+
+def notebook_key(path: Path, environment: str) -> str:
+    """Hash of a notebook's code cells, kernel and the environment"""
+    import nbformat
+
+    notebook = nbformat.read(path, as_version=4)
+    digest = hashlib.sha256(environment.encode())
+    digest.update(_kernel_name(notebook).encode())
+    for cell in notebook.cells:
+        if cell.cell_type == "code":
+            digest.update(b"\0" + cell.source.encode())
+    return digest.hexdigest()
+
+
+def _kernel_name(notebook) -> str:
+    return notebook.metadata.get("kernelspec", {}).get("name", "python3")
+
+
+def execute_notebook(path: str, timeout: float) -> dict:
+    """Run every cell of one notebook (in a worker process)
+
+    ``timeout`` bounds the whole notebook, not each cell. The notebook runs
+    in a scratch copy of its directory, so files it writes don't end up in
+    the repository, and is never written back.
+    """
+    import nbformat
+    from nbclient import NotebookClient
+    from nbclient.exceptions import CellExecutionError, CellTimeoutError
+
+    started = time.perf_counter()
+    notebook = nbformat.read(path, as_version=4)
+    workdir = tempfile.mkdtemp(prefix="notebook-")
+    shutil.copytree(Path(path).parent, workdir, dirs_exist_ok=True)
+    client = NotebookClient(
+        notebook,
+        timeout=int(timeout),
+        kernel_name=_kernel_name(notebook),
+        resources={"metadata": {"path": workdir}},
+    )
+    deadline = time.monotonic() + timeout
+    status, error = "passed", None
+    try:
+        with client.setup_kernel():
+            for index, cell in enumerate(notebook.cells):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise CellTimeoutError(f"Notebook exceeded {timeout:.0f}s")
+                client.timeout = max(1, int(remaining))
+                client.execute_cell(cell, index)
+    except CellTimeoutError as e:
+        status, error = "timeout", str(e).strip().splitlines()[-1]
+    except CellExecutionError as e:
+        status, error = "failed", f"{e.ename}: {e.evalue}"
+    except Exception as e:
+        status = "error"
+        error = "".join(traceback.format_exception_only(type(e), e)).strip()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return {
+        "status": status,
+        "error": error,
+        "duration": time.perf_counter() - started,
+    }
+
+
+def load_cache() -> dict:
+    if CACHE_PATH.exists():
+        return json.loads(CACHE_PATH.read_text())
+    return {}
+
+
+def save_cache(cache: dict):
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    CACHE_PATH.write_text(json.dumps(cache, indent=2, sort_keys=True))
+
+
+def main():
+    """Run (changed) notebooks and report the results"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        default=[str(ROOT / "modules")],
+        help="notebooks or directories (default: the repository's modules/)",
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "--timeout", type=float, default=600, help="seconds per notebook"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="ignore cached passing results"
+    )
+    args = parser.parse_args()
+
+    try:
+        import nbclient  # noqa: F401
+        from rich.console import Console
+        from rich.table import Table
+    except ImportError as e:
+        print(f"❌ {e.name} is required: pip install -r requirements.txt")
+        return 1
+
+    console = Console()
+    notebooks = []
+    for root in map(Path, args.paths):
+        if root.suffix == ".ipynb":
+            notebooks.append(root)
+        else:
+            notebooks.extend(
+                path
+                for path in sorted(root.rglob("*.ipynb"))
+                if ".ipynb_checkpoints" not in path.parts
+            )
+
+    environment = environment_fingerprint()
+    cache = load_cache()
+    paths = {notebook_name(path): path for path in notebooks}
+    keys = {name: notebook_key(path, environment) for name, path in paths.items()}
+    results = {}
+    queued = []
+    for path, key in keys.items():
+        cached = cache.get(path)
+        # Only passes are cached; failing notebooks are what you're fixing
+        if not args.force and cached and cached["key"] == key:
+            results[path] = dict(cached, cached=True)
+        else:
+            queued.append(path)
+
+    console.print(
+        f"[blue]{len(notebooks)} notebooks: {len(notebooks) - len(queued)} "
+        f"unchanged, running {len(queued)} with {args.jobs} workers[/blue]"
+    )
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = {
+            executor.submit(execute_notebook, str(paths[name]), args.timeout): name
+            for name in queued
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            result = future.result()
+            results[path] = result
+            style = "green" if result["status"] == "passed" else "red"
+            console.print(
+                f"[{style}]{result['status']:>7}[/{style}] {path} "
+                f"({result['duration']:.1f}s)"
+            )
+            if result["status"] == "passed":
+                cache[path] = dict(result, key=keys[path])
+            else:
+                cache.pop(path, None)
+            save_cache(cache)
+
+    table = Table(title="Notebook Results")
+    table.add_column("Notebook", style="cyan")
+    table.add_column("Status")
+    table.add_column("Time", justify="right")
+    table.add_column("Error", style="red")
+    for path in sorted(results):
+        result = results[path]
+        status = result["status"] + (" (cached)" if result.get("cached") else "")
+        style = "green" if result["status"] == "passed" else "red"
+        table.add_row(
+            path,
+            f"[{style}]{status}[/{style}]",
+            f"{result['duration']:.1f}s",
+            result.get("error") or "",
+        )
+    console.print(table)
+
+    failed = sum(result["status"] != "passed" for result in results.values())
+    console.print(
+        f"\n{len(results) - failed} passed, {failed} failed "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
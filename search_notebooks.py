@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Full-text search over the curriculum notebooks
+Keeps an inverted index of markdown and code cells on disk, refreshed
+incrementally (by file mtime, then content hash) before every query
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent
+INDEX_PATH = ROOT / ".cache" / "notebook_index.json"
+INDEX_VERSION = 2
+
+TOKEN_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*|\d+")
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased identifiers and words; snake_case names also yield their parts"""
+    tokens = []
+    for token in TOKEN_PATTERN.findall(text):
+        token = token.lower()
+        tokens.append(token)
+        if "_" in token.strip("_"):
+            tokens.extend(part for part in token.split("_") if part)
+    return tokens
+
+
+def _relative(path: Path) -> str:
+    """Index key of a notebook: its path relative to the repository root"""
+    path = path.resolve()
+    try:
+        return str(path.relative_to(ROOT))
+    except ValueError:
+        return str(path)
+
+
+def _location(path: Path) -> Tuple[Optional[str], Optional[str]]:
+    module = next((p for p in path.parts if p.startswith("module_")), None)
+    topic = next((p for p in path.parts if p.startswith("topic_")), None)
+    return module, topic
+
+
+class NotebookIndex:
+    """Inverted index from terms to notebook cells
+
+    ``postings`` maps each term to ``{cell_id: term_frequency}``; ``cells``
+    holds each cell's location, source and length. Per-file bookkeeping
+    (mtime, size, hash, cell ids) lets ``update`` re-index only notebooks
+    that actually changed.
+    """
+
+    def __init__(self):
+        self.version = INDEX_VERSION
+        self.files: Dict[str, Dict] = {}
+        self.cells: Dict[int, Dict] = {}
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.total_length = 0
+        self._next_id = 0
+
+    @classmethod
+    def load(cls, path: Path = INDEX_PATH) -> "NotebookIndex":
+        """Load a saved index (an empty one if missing or outdated)"""
+        index = cls()
+        if not path.exists():
+            return index
+        try:
+            state = json.loads(path.read_text())
+        except ValueError:
+            return index
+        if state.get("version") != INDEX_VERSION:
+            return index
+
+        index.files = state["files"]
+        index.total_length = state["total_length"]
+        index._next_id = state["next_id"]
+        # JSON object keys are strings; postings are rebuilt from the cells
+        for cell_id, cell in state["cells"].items():
+            cell_id = int(cell_id)
+            index.cells[cell_id] = cell
+            for term, count in cell["terms"].items():
+                index.postings.setdefault(term, {})[cell_id] = count
+        return index
+
+    def save(self, path: Path = INDEX_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            "version": self.version,
+            "files": self.files,
+            "cells": self.cells,
+            "total_length": self.total_length,
+            "next_id": self._next_id,
+        }
+        path.write_text(json.dumps(state))
+
+    def update(self, root: Path) -> Dict[str, int]:
+        """Bring the index in line with the notebooks under ``root``"""
+        stats = Counter()
+        seen = set()
+        for path in sorted(root.rglob("*.ipynb")):
+            if ".ipynb_checkpoints" in path.parts:
+                continue
+            key = _relative(path)
+            seen.add(key)
+            stat = path.stat()
+            entry = self.files.get(key)
+            if entry and (entry["mtime"], entry["size"]) == (
+                stat.st_mtime_ns,
+                stat.st_size,
+            ):
+                continue
+
+            data = path.read_bytes()
+            digest = hashlib.sha256(data).hexdigest()
+            if entry and entry["hash"] == digest:
+                # Touched but unchanged
+                entry["mtime"], entry["size"] = stat.st_mtime_ns, stat.st_size
+                stats["touched"] += 1
+                continue
+
+            if entry:
+                self._remove_file(key)
+            self._add_file(key, path, data)
+            self.files[key].update(
+                mtime=stat.st_mtime_ns, size=stat.st_size, hash=digest
+            )
+            stats["updated" if entry else "added"] += 1
+
+        for key in [key for key in self.files if key not in seen]:
+            self._remove_file(key)
+            stats["removed"] += 1
+        return stats
+
+    def _add_file(self, key: str, path: Path, data: bytes):
+        module, topic = _location(Path(key))
+        try:
+            notebook = json.loads(data)
+        except ValueError:
+            notebook = {"cells": []}
+
+        cell_ids = []
+        for position, cell in enumerate(notebook.get("cells", [])):
+            source = cell.get("source", "")
+            if isinstance(source, list):
+                source = "".join(source)
+            terms = Counter(tokenize(source))
+            if not terms:
+                continue
+            cell_id = self._next_id
+            self._next_id += 1
+            length = sum(terms.values())
+            self.cells[cell_id] = {
+                "path": key,
+                "module": module,
+                "topic": topic,
+                "position": position,
+                "type": cell.get("cell_type", "code"),
+                "source": source,
+                "length": length,
+                "terms": terms,
+            }
+            self.total_length += length
+            for term, count in terms.items():
+                self.postings.setdefault(term, {})[cell_id] = count
+            cell_ids.append(cell_id)
+        self.files[key] = {"cells": cell_ids}
+
+    def _remove_file(self, key: str):
+        for cell_id in self.files.pop(key)["cells"]:
+            cell = self.cells.pop(cell_id)
+            self.total_length -= cell["length"]
+            for term in cell["terms"]:
+                postings = self.postings[term]
+                del postings[cell_id]
+                if not postings:
+                    del self.postings[term]
+
+    def search(
+        self, query: str, limit: int = 10, cell_type: str = None
+    ) -> List[Tuple[float, Dict]]:
+        """Cells ranked by BM25 relevance to ``query``"""
+        terms = set(tokenize(query))
+        if not terms or not self.cells:
+            return []
+        count = len(self.cells)
+        average = self.total_length / count
+        scores: Dict[int, float] = {}
+        for term in terms:
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for cell_id, frequency in postings.items():
+                length = self.cells[cell_id]["length"]
+                norm = frequency + K1 * (1 - B + B * length / average)
+                scores[cell_id] = (
+                    scores.get(cell_id, 0.0) + idf * frequency * (K1 + 1) / norm
+                )
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        hits = []
+        for cell_id, score in ranked:
+            cell = self.cells[cell_id]
+            if cell_type and cell["type"] != cell_type:
+                continue
+            hits.append((score, cell))
+            if len(hits) == limit:
+                break
+        return hits
+
+
+def snippet(source: str, query: str, width: int = 80) -> str:
+    """The first source line mentioning a query term"""
+    terms = set(tokenize(query))
+    lines = [line.strip() for line in source.splitlines() if line.strip()]
+    for line in lines:
+        if terms & set(tokenize(line)):
+            return line[:width]
+    return lines[0][:width] if lines else ""
+
+
+def main():
+    """Refresh the index and print ranked cell hits"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("query", nargs="+")
+    parser.add_argument("-n", "--limit", type=int, default=10)
+    parser.add_argument("--type", choices=["code", "markdown"], dest="cell_type")
+    parser.add_argument(
+        "--root",
+        default=str(ROOT / "modules"),
+        help="default: the repository's modules/",
+    )
+    parser.add_argument(
+        "--rebuild", action="store_true", help="discard the index first"
+    )
+    args = parser.parse_args()
+
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console()
+    query = " ".join(args.query)
+
+    started = time.perf_counter()
+    index = NotebookIndex() if args.rebuild else NotebookIndex.load()
+    stats = index.update(Path(args.root))
+    if stats:
+        index.save()
+    indexed = time.perf_counter()
+    hits = index.search(query, args.limit, args.cell_type)
+    searched = time.perf_counter()
+
+    table = Table(title=f"Results for {query!r}")
+    table.add_column("Score", justify="right", style="magenta")
+    table.add_column("Location", style="cyan")
+    table.add_column("Match", style="white")
+    for score, cell in hits:
+        location = " / ".join(
+            part
+            for part in (cell["module"], cell["topic"], Path(cell["path"]).name)
+            if part
+        )
+        table.add_row(
+            f"{score:.2f}",
+            f"{location} #{cell['position'] + 1} ({cell['type']})",
+            snippet(cell["source"], query),
+        )
+    console.print(table)
+
+    changes = ", ".join(f"{count} {kind}" for kind, count in stats.items())
+    console.print(
+        f"[dim]{len(index.files)} notebooks, {len(index.cells)} cells"
+        f"{f' ({changes})' if changes else ''}; "
+        f"index refresh {(indexed - started) * 1000:.1f} ms, "
+        f"search {(searched - indexed) * 1000:.1f} ms[/dim]"
+    )
+    return 0 if hits else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
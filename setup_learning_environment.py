@@ -122,6 +122,8 @@ def display_next_steps():
         "- Run FastAPI: uvicorn modules.module_6_fastapi_apis.fastapi_apis:app --reload"
     )
     print("- Create Linear roadmap: python create_roadmap.py")
+    print("- Check that every notebook runs: python run_notebooks.py")
+    print("- Find where a concept is taught: python search_notebooks.py selectinload")
 
     print("\n📖 Learning Path:")
     print(
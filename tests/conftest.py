@@ -0,0 +1,67 @@
+"""
+Shared test setup
+Puts the repository root and linear_integration/ (whose modules import each
+other flat) on sys.path, and builds LinearAPI clients over a fake transport
+"""
+
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "linear_integration"))
+os.environ.setdefault("LINEAR_LOG_MODE", "quiet")
+
+from linear_api import LinearAPI, LinearConfig  # noqa: E402
+from resilience import operation_name  # noqa: E402
+from transport import TransportResponse  # noqa: E402
+
+
+class FakeTransport:
+    """Answers every request with ``respond(operation, variables)``
+
+    ``respond`` returns a GraphQL body or a ready ``TransportResponse``, or
+    raises. Each request's (operation, variables) is recorded in ``calls``.
+    """
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def post(self, url, headers, payload, timeout):
+        operation = operation_name(payload["query"])
+        variables = payload.get("variables") or {}
+        with self._lock:
+            self.calls.append((operation, variables))
+        response = self.respond(operation, variables)
+        if isinstance(response, TransportResponse):
+            return response
+        return TransportResponse(200, {}, response)
+
+    def credentials(self):
+        return {}
+
+
+@pytest.fixture
+def make_api(tmp_path):
+    """``make_api(respond, **config)``: a LinearAPI over a FakeTransport"""
+    apis = []
+
+    def make(respond, transport=None, **config):
+        config.setdefault("cache_path", str(tmp_path / "responses.db"))
+        config.setdefault("schema_path", str(tmp_path / "schema.json"))
+        api = LinearAPI(
+            LinearConfig(api_key="key", team_id="team", **config),
+            transport=transport or FakeTransport(respond),
+        )
+        apis.append(api)
+        return api
+
+    yield make
+    for api in apis:
+        api.close()
@@ -0,0 +1,99 @@
+"""
+Tests for the incrementally maintained roadmap analytics
+"""
+
+import json
+
+import pandas as pd
+import pytest
+from analytics import RoadmapAnalytics, issues_frame
+
+
+def issue(id, state="unstarted", parent=None, labels=("Python",), updated="01-10"):
+    return {
+        "id": id,
+        "identifier": id.upper(),
+        "title": id,
+        "state": {"name": state.title(), "type": state},
+        "labels": {"nodes": [{"name": name} for name in labels]},
+        "parent": {"id": parent} if parent else None,
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": f"2024-{updated}T00:00:00Z",
+        "startedAt": "2024-01-02T00:00:00Z" if state != "unstarted" else None,
+        "completedAt": "2024-01-04T00:00:00Z" if state == "completed" else None,
+    }
+
+
+ROADMAP = [
+    issue("m1", "started"),
+    issue("a", "completed", parent="m1"),
+    issue("b", parent="m1"),
+    issue("c", "completed", parent="a", labels=()),
+]
+
+
+class Issues:
+    """Stands in for LinearAPI.iter_issues, recording the filters used"""
+
+    def __init__(self, nodes):
+        self.nodes = nodes
+        self.filters = []
+
+    def iter_issues(self, as_models=False, filter=None):
+        self.filters.append(filter)
+        return iter(self.nodes)
+
+
+@pytest.fixture
+def analytics(tmp_path):
+    analytics = RoadmapAnalytics(str(tmp_path / "analytics.json"))
+    analytics.apply(issues_frame(ROADMAP))
+    return analytics
+
+
+def test_module_rollup_excludes_the_module_issue(analytics):
+    report = analytics.module_report()
+    assert report.loc["M1", "total"] == 3
+    assert report.loc["M1", "done"] == 2
+    assert report.loc["M1", "mean_cycle_days"] == 2.0
+
+
+def test_changed_issue_replaces_its_contribution(analytics):
+    analytics.apply(issues_frame([issue("b", "completed", parent="m1")]))
+    report = analytics.module_report()
+    assert (report.loc["M1", "total"], report.loc["M1", "done"]) == (3, 3)
+    assert analytics.label_report().loc["Python", "done"] == 2  # c has no label
+
+
+def test_full_sync_drops_deleted_issues(analytics):
+    analytics.refresh(Issues([node for node in ROADMAP if node["id"] != "c"]), True)
+    assert "c" not in analytics.frame.index
+    assert analytics.module_report().loc["M1", "total"] == 2
+
+
+def test_incremental_refresh_filters_on_the_watermark(analytics):
+    api = Issues([])
+    analytics.refresh(api)
+    assert api.filters[0].build() == {"updatedAt": {"gte": "2024-01-10T00:00:00+00:00"}}
+
+
+def test_store_round_trips_through_json(analytics):
+    analytics.save()
+    restored = RoadmapAnalytics(str(analytics.store_path))
+    pd.testing.assert_frame_equal(restored.module_report(), analytics.module_report())
+    pd.testing.assert_frame_equal(restored.label_report(), analytics.label_report())
+    assert restored.watermark == analytics.watermark
+    assert restored.frame.loc["a", "labels"] == ("Python",)
+
+    # Deltas keep applying on top of the restored state
+    restored.apply(issues_frame([issue("b", "completed", parent="m1")]))
+    assert restored.module_report().loc["M1", "done"] == 3
+
+
+def test_store_of_another_version_is_ignored(analytics):
+    analytics.save()
+    state = json.loads(analytics.store_path.read_text())
+    state["version"] = 0
+    analytics.store_path.write_text(json.dumps(state))
+    restored = RoadmapAnalytics(str(analytics.store_path))
+    assert restored.frame.empty and restored.watermark is None
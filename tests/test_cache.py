@@ -0,0 +1,126 @@
+"""
+Tests for the read-through response cache and its mutation invalidation
+"""
+
+import threading
+import time
+
+import pytest
+from cache import DiskBackend, MemoryBackend, ResponseCache
+from linear_api import GET_LABELS_QUERY
+
+LABEL_CREATED = {
+    "data": {"issueLabelCreate": {"success": True, "issueLabel": {"id": "new"}}}
+}
+
+
+def labels(*names):
+    nodes = [{"id": name.lower(), "name": name} for name in names]
+    return {"data": {"team": {"labels": {"nodes": nodes}}}}
+
+
+@pytest.fixture(params=["memory", "disk"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryBackend(max_entries=2)
+    return DiskBackend(str(tmp_path / "responses.db"), max_entries=2)
+
+
+def test_backend_evicts_least_recently_used(backend):
+    backend.set("a", "GetLabels", {"n": 1}, 60)
+    backend.set("b", "GetLabels", {"n": 2}, 60)
+    assert backend.get("a") == {"n": 1}
+    backend.set("c", "GetLabels", {"n": 3}, 60)
+    assert backend.get("b") is None
+    assert backend.get("a") == {"n": 1}
+
+
+def test_backend_expires_entries(backend):
+    backend.set("a", "GetLabels", {"n": 1}, -1)
+    assert backend.get("a") is None
+
+
+def test_backend_invalidates_by_operation(backend):
+    backend.set("a", "GetLabels", {"n": 1}, 60)
+    backend.set("b", "GetIssues", {"n": 2}, 60)
+    backend.invalidate(["GetLabels"])
+    assert backend.get("a") is None
+    assert backend.get("b") == {"n": 2}
+
+
+def test_disk_backend_survives_restarts(tmp_path):
+    path = str(tmp_path / "responses.db")
+    DiskBackend(path).set("a", "GetLabels", {"n": 1}, 60)
+    assert DiskBackend(path).get("a") == {"n": 1}
+
+
+def test_put_after_a_mutation_is_dropped():
+    cache = ResponseCache(MemoryBackend())
+    generation = cache.generation("GetLabels")
+    cache.invalidate_for("CreateLabel")
+    cache.put("GetLabels", "key", {"stale": True}, generation)
+    assert cache.get("GetLabels", "key") is None
+
+    cache.put("GetLabels", "key", {"fresh": True}, cache.generation("GetLabels"))
+    assert cache.get("GetLabels", "key") == {"fresh": True}
+
+
+def test_zero_ttl_is_never_cached():
+    cache = ResponseCache(MemoryBackend(), ttls={"GetIssues": 0})
+    cache.put("GetIssues", "key", {}, cache.generation("GetIssues"))
+    assert cache.get("GetIssues", "key") is None
+
+
+def test_reads_are_cached_until_a_mutation(make_api):
+    responses = {"GetLabels": [labels("Bug"), labels("Bug", "Docs")]}
+
+    def respond(operation, variables):
+        if operation == "CreateLabel":
+            return LABEL_CREATED
+        return responses[operation].pop(0)
+
+    api = make_api(respond, cache_backend="memory")
+    assert api.get_labels() == api.get_labels()
+    assert len(api.transport.calls) == 1
+
+    api.create_label("Docs", "#00f")
+    assert [label["name"] for label in api.get_labels()] == ["Bug", "Docs"]
+    assert len(api.transport.calls) == 3
+
+
+def test_fresh_read_bypasses_the_cache(make_api):
+    api = make_api(lambda *_: labels("Bug"), cache_backend="memory")
+    api._read(GET_LABELS_QUERY, {"teamId": "team"})
+    api._read(GET_LABELS_QUERY, {"teamId": "team"}, fresh=True)
+    assert len(api.transport.calls) == 2
+
+
+def test_read_after_a_write_does_not_join_an_older_flight(make_api):
+    release = threading.Event()
+    responses = [labels("Bug"), labels("Bug", "Docs")]
+
+    def respond(operation, variables):
+        if operation == "CreateLabel":
+            return LABEL_CREATED
+        response = responses.pop(0)
+        if len(responses) == 1:
+            release.wait(2)  # the first read is slow
+        return response
+
+    api = make_api(respond, cache_backend="memory")
+    before = []
+    slow = threading.Thread(target=lambda: before.append(api.get_labels()))
+    slow.start()
+    while not api.transport.calls:
+        time.sleep(0.005)
+
+    api.create_label("Docs", "#00f")
+    after = api.get_labels()
+    release.set()
+    slow.join()
+
+    assert [label["name"] for label in before[0]] == ["Bug"]
+    assert [label["name"] for label in after] == ["Bug", "Docs"]
+    # The slow, pre-write result was not cached over the fresh one
+    assert api.get_labels() == after
+    assert len(api.transport.calls) == 3
@@ -0,0 +1,237 @@
+"""
+Tests for the module 6 Learning API
+Each test drives a fresh app over a temporary SQLite file in-process through
+httpx's ASGI transport
+"""
+
+import asyncio
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from modules.module_6_fastapi_apis import fastapi_apis  # noqa: E402
+from modules.module_6_fastapi_apis.fastapi_apis import (  # noqa: E402
+    ResponseCache,
+    create_app,
+)
+
+
+@pytest.fixture
+def app(tmp_path):
+    return create_app(f"sqlite:///{tmp_path / 'api.db'}")
+
+
+def serve(app, scenario):
+    """Run ``scenario(client)`` against ``app`` with its lifespan running"""
+
+    async def main():
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                return await scenario(client)
+
+    return asyncio.run(main())
+
+
+def user(n, **fields):
+    return dict(
+        {
+            "username": f"user{n}",
+            "email": f"user{n}@example.com",
+            "first_name": "Test",
+            "last_name": str(n),
+        },
+        **fields,
+    )
+
+
+async def add_users(client, count):
+    response = await client.post("/users/bulk", json=[user(n) for n in range(count)])
+    assert response.json()["created"] == count
+
+
+def test_pages_follow_cursors(app):
+    async def scenario(client):
+        await add_users(client, 25)
+        usernames, pages = [], 0
+        url = "/users/?limit=10"
+        while url:
+            page = (await client.get(url)).json()
+            usernames.extend(item["username"] for item in page["items"])
+            pages += 1
+            url = page["next"]
+        assert pages == 3
+        assert usernames == [f"user{n}" for n in range(25)]
+
+    serve(app, scenario)
+
+
+def test_invalid_paging_is_rejected(app):
+    async def scenario(client):
+        assert (await client.get("/users/?cursor=not-a-cursor")).status_code == 400
+        assert (await client.get("/users/?limit=201")).status_code == 422
+        assert (await client.get("/posts/?limit=0")).status_code == 422
+
+    serve(app, scenario)
+
+
+def test_bulk_reports_errors_per_row(app):
+    async def scenario(client):
+        await client.post("/users/", json=user(0))
+        response = await client.post(
+            "/users/bulk",
+            json=[
+                user(1),
+                user(0, email="other@example.com"),  # username taken
+                user(2, email="not-an-email"),
+                user(3),
+                user(3, username="user4"),  # email used earlier in the body
+            ],
+        )
+        result = response.json()
+        assert (result["received"], result["created"]) == (5, 2)
+        assert [error["index"] for error in result["errors"]] == [1, 2, 4]
+        assert result["errors"][0]["errors"][0]["loc"] == ["username"]
+        assert result["errors"][1]["errors"][0]["loc"] == ["email"]
+
+        lines = [
+            {"title": "Kept", "content": "x", "author_id": 1},
+            {"title": "Orphan", "content": "x", "author_id": 99},
+        ]
+        response = await client.post(
+            "/posts/bulk",
+            content="\n".join(map(json.dumps, lines)) + "\nnot json\n",
+            headers={"content-type": "application/x-ndjson"},
+        )
+        result = response.json()
+        assert (result["received"], result["created"]) == (3, 1)
+        assert [error["index"] for error in result["errors"]] == [1, 2]
+        assert result["errors"][0]["errors"][0]["type"] == "not_found"
+
+    serve(app, scenario)
+
+
+def test_conditional_get(app):
+    async def scenario(client):
+        await client.post("/users/", json=user(0))
+        first = await client.get("/users/1")
+        etag = first.headers["etag"]
+        again = await client.get("/users/1", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.headers["etag"] == etag
+        assert app.state.response_cache.hits == 1
+
+    serve(app, scenario)
+
+
+def test_new_post_invalidates_user_posts(app):
+    async def scenario(client):
+        await client.post("/users/", json=user(0))
+        assert (await client.get("/users/1/posts")).json()["items"] == []
+        await client.post(
+            "/posts/", json={"title": "New", "content": "x", "author_id": 1}
+        )
+        items = (await client.get("/users/1/posts")).json()["items"]
+        assert [item["title"] for item in items] == ["New"]
+
+    serve(app, scenario)
+
+
+def test_write_during_load_is_not_cached(app, monkeypatch):
+    """A page read before a write must not be cached after the write"""
+    paginate = fastapi_apis.paginate
+    loaded, written = asyncio.Event(), asyncio.Event()
+
+    async def slow_paginate(*args):
+        page = await paginate(*args)
+        loaded.set()
+        await written.wait()
+        return page
+
+    async def scenario(client):
+        await client.post("/users/", json=user(0))
+        monkeypatch.setattr(fastapi_apis, "paginate", slow_paginate)
+        stale = asyncio.create_task(client.get("/users/1/posts"))
+        await loaded.wait()
+        await client.post(
+            "/posts/", json={"title": "New", "content": "x", "author_id": 1}
+        )
+        written.set()
+        assert (await stale).json()["items"] == []
+        monkeypatch.setattr(fastapi_apis, "paginate", paginate)
+
+        items = (await client.get("/users/1/posts")).json()["items"]
+        assert [item["title"] for item in items] == ["New"]
+
+    serve(app, scenario)
+
+
+def test_put_after_forgotten_invalidation_is_dropped():
+    cache = ResponseCache(max_entries=1)
+    generation = cache.generation((("post", 1),))
+    cache.invalidate("post", 1)
+    cache.invalidate("post", 2)  # pushes ("post", 1) out of the generations
+    cache.put("/posts/1?", '"etag"', b"{}", (("post", 1),), generation)
+    assert cache.get("/posts/1?") is None
+
+
+def test_fast_json_matches_default_encoder(tmp_path):
+    url = f"sqlite:///{tmp_path / 'api.db'}"
+    default, fast = create_app(url), create_app(url, fast_json=True)
+    paths = ["/users/1", "/users/?limit=2", "/posts/1", "/posts/", "/users/1/posts"]
+
+    async def seed(client):
+        await add_users(client, 3)
+        for n in range(3):
+            await client.post(
+                "/posts/", json={"title": f"Post {n}", "content": "x", "author_id": 1}
+            )
+        return [(await client.get(path)) for path in paths]
+
+    async def read(client):
+        return [(await client.get(path)) for path in paths]
+
+    expected = serve(default, seed)
+    for response, wanted in zip(serve(fast, read), expected):
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == wanted.json()
+
+
+def test_dumps_without_orjson_matches(monkeypatch):
+    value = {"id": 1, "created_at": datetime(2024, 5, 1, 12, 30, 0, 250)}
+    encoded = fastapi_apis.dumps(value)
+    monkeypatch.setattr(fastapi_apis, "orjson", None)
+    assert json.loads(fastapi_apis.dumps(value)) == json.loads(encoded)
+
+
+def test_exports_stream_every_row(app, monkeypatch):
+    monkeypatch.setattr(fastapi_apis, "EXPORT_BATCH_SIZE", 4)
+
+    async def scenario(client):
+        await add_users(client, 10)
+        for n in range(6):
+            await client.post(
+                "/posts/",
+                json={"title": f"Post {n}", "content": "x", "author_id": 1 + n % 2},
+            )
+
+        response = await client.get("/users/export")
+        assert response.headers["content-type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["id"] for row in rows] == list(range(1, 11))
+        assert rows[0] == (await client.get("/users/1")).json()
+
+        response = await client.get("/posts/export?author_id=2")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["id"] for row in rows] == [2, 4, 6]
+        assert rows[1] == (await client.get("/posts/4")).json()
+
+    serve(app, scenario)
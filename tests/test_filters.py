@@ -0,0 +1,52 @@
+"""
+Tests for the server-side IssueFilter builder
+"""
+
+from datetime import date
+
+from filters import IssueFilter
+
+ISSUES = {"data": {"team": {"issues": {"nodes": [], "pageInfo": {}}}}}
+
+
+def test_single_condition_is_the_filter():
+    assert IssueFilter().label("Bug").build() == {"labels": {"name": {"eq": "Bug"}}}
+
+
+def test_distinct_fields_merge_into_one_object():
+    built = IssueFilter().label("Bug").has_parent().priority(lte=2).build()
+    assert built == {
+        "labels": {"name": {"eq": "Bug"}},
+        "parent": {"null": False},
+        "priority": {"lte": 2},
+    }
+
+
+def test_repeated_field_falls_back_to_and():
+    built = IssueFilter().state_not("Done").state_not("Canceled").build()
+    assert built == {
+        "and": [
+            {"state": {"name": {"neq": "Done"}}},
+            {"state": {"name": {"neq": "Canceled"}}},
+        ]
+    }
+
+
+def test_date_ranges_are_inclusive_iso_strings():
+    built = IssueFilter().created(after=date(2024, 1, 1), before="2024-02-01").build()
+    assert built == {"createdAt": {"gte": "2024-01-01", "lte": "2024-02-01"}}
+
+
+def test_any_of_skips_empty_filters():
+    built = IssueFilter().any_of(IssueFilter().ids(["a"]), IssueFilter()).build()
+    assert built == {"or": [{"id": {"in": ["a"]}}]}
+    assert not IssueFilter()
+
+
+def test_get_issues_sends_the_filter_to_linear(make_api):
+    api = make_api(lambda *_: ISSUES)
+    api.get_issues(10, filter=IssueFilter().state_type("started"))
+    api.get_issues(10)
+    (_, filtered), (_, unfiltered) = api.transport.calls
+    assert filtered["filter"] == {"state": {"type": {"eq": "started"}}}
+    assert "filter" not in unfiltered
@@ -0,0 +1,91 @@
+"""
+Tests for API-key rotation and rate-limit handling
+"""
+
+import time
+from email.utils import formatdate
+
+import pytest
+from keypool import KeyPool, RateLimitedError, is_rate_limited, retry_after
+from transport import TransportResponse
+
+LABELS = {"data": {"team": {"labels": {"nodes": []}}}}
+
+# Refills a throttled (emptied) bucket within milliseconds
+FAST = 3600 * 1000
+
+
+def test_requests_spread_over_idle_keys():
+    pool = KeyPool(["key-a", "key-b"])
+    first, second = pool.acquire(), pool.acquire()
+    assert first is not second
+    pool.release(first)
+    assert pool.acquire() is first
+
+
+def test_throttled_key_cools_down():
+    pool = KeyPool(["key-a", "key-b"], requests_per_hour=FAST)
+    throttled = pool.acquire()
+    pool.release(throttled, throttled=True, cooldown=0.05)
+    other = pool.acquire()
+    pool.release(other)
+    assert pool.acquire() is other
+
+    time.sleep(0.06)
+    assert pool.acquire() is throttled  # fewer in flight and refilled
+
+
+def test_waits_for_a_key_up_to_max_wait():
+    pool = KeyPool(["key-a"], requests_per_hour=FAST, max_wait=0.5)
+    pool.release(pool.acquire(), throttled=True, cooldown=0.05)
+    started = time.monotonic()
+    pool.acquire()
+    assert time.monotonic() - started >= 0.04
+
+    pool.release(pool.acquire(), throttled=True, cooldown=30)
+    with pytest.raises(RateLimitedError) as raised:
+        pool.acquire()
+    assert 29 < raised.value.retry_in <= 30
+
+
+def test_server_count_caps_the_local_bucket():
+    pool = KeyPool(["key-a"], requests_per_hour=100)
+    key = pool.acquire()
+    pool.release(key, remaining=3)
+    assert key.tokens == 3
+
+
+def test_retry_after_forms():
+    assert retry_after({"Retry-After": "12"}) == 12
+    assert 25 < retry_after({"Retry-After": formatdate(time.time() + 30)}) <= 30
+    reset = str(int((time.time() + 20) * 1000))
+    assert 19 < retry_after({"X-RateLimit-Requests-Reset": reset}) <= 20
+    assert retry_after({}) is None
+
+
+def test_rate_limit_responses():
+    limited = {"errors": [{"extensions": {"code": "RATELIMITED"}}]}
+    assert is_rate_limited(TransportResponse(429, {}, {}))
+    assert is_rate_limited(TransportResponse(400, {}, limited))
+    assert not is_rate_limited(TransportResponse(400, {}, {"errors": []}))
+    assert not is_rate_limited(TransportResponse(200, {}, limited))
+
+
+def test_throttled_request_retries_on_another_key(make_api):
+    responses = [TransportResponse(429, {"Retry-After": "30"}, {}), LABELS]
+    api = make_api(lambda *_: responses.pop(0), api_keys=["key", "key-2222"])
+    assert api.get_labels() == []
+    assert len(api.transport.calls) == 2
+
+    throttled, used = sorted(api.key_metrics(), key=lambda key: -key["throttled"])
+    assert (throttled["throttled"], used["throttled"]) == (1, 0)
+    assert 29 < throttled["cooling_for"] <= 30
+    assert used["requests"] == 1 and used["failures"] == 0
+
+
+def test_every_key_throttled_raises(make_api):
+    throttled = TransportResponse(429, {"Retry-After": "120"}, {})
+    api = make_api(lambda *_: throttled, api_keys=["key", "key-2222"])
+    with pytest.raises(RateLimitedError):
+        api.get_labels()
+    assert len(api.transport.calls) == 2
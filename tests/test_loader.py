@@ -0,0 +1,123 @@
+"""
+Tests for batched issue lookups
+"""
+
+import asyncio
+import threading
+
+import pytest
+from loader import IssueLoader
+from models import Issue
+from transport import TransportError
+
+ISSUES = [
+    {"id": f"i{n}", "identifier": f"ENG-{n}", "title": f"Issue {n}"}
+    for n in range(1, 6)
+]
+
+
+def matching(operation, variables):
+    """Answer an issues query with the ISSUES its id/number filter selects"""
+    ids, numbers = [], []
+    for condition in variables["filter"]["or"]:
+        ids += condition.get("id", {}).get("in", [])
+        numbers += condition.get("number", {}).get("in", [])
+    nodes = [
+        issue
+        for issue in ISSUES
+        if issue["id"] in ids or int(issue["identifier"][4:]) in numbers
+    ]
+    return {"data": {"team": {"issues": {"nodes": nodes, "pageInfo": {}}}}}
+
+
+@pytest.fixture
+def loader(make_api):
+    return IssueLoader(make_api(matching), window=60)
+
+
+def test_loads_are_batched_into_one_query(loader):
+    futures = [loader.load(f"i{n}") for n in range(1, 5)]
+    assert [future.result().identifier for future in futures] == [
+        "ENG-1",
+        "ENG-2",
+        "ENG-3",
+        "ENG-4",
+    ]
+    assert len(loader.api.transport.calls) == 1
+
+
+def test_ids_and_identifiers_share_a_batch(loader):
+    by_id = loader.load("i1")
+    by_identifier = loader.load_identifier("eng-2")
+    missing = loader.load("nope")
+    assert by_id.result().title == "Issue 1"
+    assert by_identifier.result().id == "i2"
+    assert missing.result() is None
+    ((_, variables),) = loader.api.transport.calls
+    assert variables["filter"] == {
+        "or": [{"id": {"in": ["i1", "nope"]}}, {"number": {"in": [2]}}]
+    }
+
+
+def test_results_are_memoized_under_both_keys(loader):
+    loader.load("i1").result()
+    assert loader.load("i1").result().identifier == "ENG-1"
+    assert loader.load_identifier("ENG-1").result().id == "i1"
+    assert len(loader.api.transport.calls) == 1
+
+    loader.clear(issue_id="i1")
+    loader.load("i1").result()
+    assert len(loader.api.transport.calls) == 2
+
+
+def test_full_batch_is_sent_without_waiting(make_api):
+    loader = IssueLoader(make_api(matching), window=60, max_batch=2)
+    first, second = loader.load("i1"), loader.load("i2")
+    assert first.done() and second.done()
+
+
+def test_failures_are_not_memoized(make_api):
+    failures = [TransportError("down")]
+
+    def respond(operation, variables):
+        if failures:
+            raise failures.pop()
+        return matching(operation, variables)
+
+    loader = IssueLoader(make_api(respond), window=60)
+    with pytest.raises(TransportError):
+        loader.load("i1").result()
+    assert loader.load("i1").result().id == "i1"
+
+
+def test_prime_while_the_batch_is_in_flight(make_api):
+    sent, release = threading.Event(), threading.Event()
+
+    def respond(operation, variables):
+        sent.set()
+        release.wait(2)
+        return matching(operation, variables)
+
+    loader = IssueLoader(make_api(respond), window=60)
+    future = loader.load("i1")
+    dispatch = threading.Thread(target=loader.dispatch)
+    dispatch.start()
+    sent.wait(2)
+    primed = Issue("i1", "ENG-1", "Primed")
+    loader.prime(primed)
+    release.set()
+    dispatch.join()
+
+    assert future.result() is primed
+    assert loader.load_identifier("ENG-1").result() is primed
+
+
+def test_async_lookups_in_one_tick_share_a_query(loader):
+    async def main():
+        return await asyncio.gather(
+            loader.aload("i1"), loader.aload_identifier("ENG-3"), loader.aload("i5")
+        )
+
+    issues = asyncio.run(main())
+    assert [issue.id for issue in issues] == ["i1", "i3", "i5"]
+    assert len(loader.api.transport.calls) == 1
@@ -0,0 +1,74 @@
+"""
+Tests for the durable mutation outbox
+"""
+
+import pytest
+from transport import TransportError
+
+
+def batch_response(variables):
+    """Answer every aliased mutation of an OutboxBatch successfully"""
+    data = {}
+    for name, value in variables.items():
+        entry = name.lstrip("abcdefghijklmnopqrstuvwxyz")
+        if name.startswith("input") and "teamId" in value:  # a create
+            data[f"m{entry}"] = {"success": True, "issue": {"id": value["id"]}}
+        elif f"m{entry}" not in data:
+            data[f"m{entry}"] = {"success": True}
+    return {"data": data}
+
+
+@pytest.fixture
+def outbox_api(make_api, tmp_path):
+    def make(respond=lambda operation, variables: batch_response(variables)):
+        api = make_api(respond)
+        api.enable_outbox(str(tmp_path / "outbox.db"), flush_interval=60)
+        return api
+
+    return make
+
+
+def test_group_entries_go_out_one_per_batch(outbox_api):
+    api = outbox_api()
+    with api.outbox._drain_lock:  # queue everything before the worker drains
+        api.update_issue("issue-1", title="First")
+        api.update_issue("issue-1", title="Second")
+        api.update_issue("issue-2", title="Other")
+    api.flush()
+
+    batches = [sorted(variables) for _, variables in api.transport.calls]
+    assert batches == [["id1", "id3", "input1", "input3"], ["id2", "input2"]]
+    assert api.outbox.pending() == 0
+
+
+def test_children_wait_for_their_parent(outbox_api):
+    api = outbox_api()
+    with api.outbox._drain_lock:
+        parent = api.create_issue("Module", "")
+        child = api.create_issue("Lesson", "", parent_id=parent)
+    api.flush()
+
+    (_, first), (_, second) = api.transport.calls
+    assert list(first) == [f"input{parent.entry_id}"]
+    assert second[f"input{child.entry_id}"]["parentId"] == parent.result(1)
+
+
+def test_resent_create_keeps_its_generated_id(outbox_api):
+    failures = [TransportError("connection reset")]
+
+    def respond(operation, variables):
+        if failures:
+            raise failures.pop()
+        return batch_response(variables)
+
+    api = outbox_api(respond)
+    with api.outbox._drain_lock:
+        handle = api.create_issue("Module", "")
+    api.flush()  # fails; the entry stays queued
+    api.flush()
+
+    sent = [
+        variables[f"input{handle.entry_id}"] for _, variables in api.transport.calls
+    ]
+    assert len(sent) == 2
+    assert sent[0]["id"] == sent[1]["id"] == handle.result(1)
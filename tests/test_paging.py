@@ -0,0 +1,120 @@
+"""
+Tests for adaptive page sizing of paginated issue queries
+"""
+
+import pytest
+from linear_api import ISSUES_QUERY_FLAT
+from paging import (
+    MAX_QUERY_COMPLEXITY,
+    AdaptivePager,
+    estimate_complexity,
+    is_complexity_error,
+)
+from transport import TransportResponse
+
+QUERY = "query Q($first: Int) { team { issues(first: $first) { nodes { id title } } } }"
+
+
+def issues(count, more=False):
+    nodes = [{"id": f"i{n}", "title": f"Issue {n}"} for n in range(count)]
+    page_info = {"hasNextPage": more, "endCursor": "cursor" if more else None}
+    return {"data": {"team": {"issues": {"nodes": nodes, "pageInfo": page_info}}}}
+
+
+def test_estimate_multiplies_nodes_by_page_size():
+    # team + issues objects, plus 0.2 per node for two scalars
+    assert estimate_complexity(QUERY, 10) == 2 + 10 * 1.2
+
+
+def test_initial_size_fits_the_complexity_budget():
+    pager = AdaptivePager(ISSUES_QUERY_FLAT, max_size=10000)
+    assert estimate_complexity(ISSUES_QUERY_FLAT, pager.size) <= (
+        MAX_QUERY_COMPLEXITY * pager.headroom
+    )
+
+
+def test_slow_pages_halve_and_fast_pages_grow():
+    pager = AdaptivePager(QUERY, max_size=100)
+    pager.size = 40
+    pager.record(latency=5.0, returned=40)
+    assert pager.size == 20
+    pager.record(latency=0.1, returned=20)
+    assert pager.size == 26
+
+
+def test_rejected_size_caps_later_growth():
+    pager = AdaptivePager(QUERY, max_size=100)
+    pager.size = 80
+    assert pager.record_complexity_error()
+    assert pager.size == 40
+    for _ in range(10):
+        pager.record(latency=0.1, returned=pager.size)
+    assert pager.size == 79
+
+    pager.size = pager.min_size
+    assert not pager.record_complexity_error()
+
+
+def test_reported_complexity_replaces_the_estimate():
+    pager = AdaptivePager(QUERY, max_size=1000)
+    pager.size = 400
+    pager.record(latency=1.0, returned=400, complexity=16000)
+    assert pager.node_cost == 40
+    assert pager.size == 200  # the budget of 8000 over 40 per node
+
+
+def test_complexity_errors_are_recognised():
+    assert is_complexity_error([{"message": "Query too complex"}])
+    assert is_complexity_error([{"extensions": {"code": "QUERY_COMPLEXITY"}}])
+    assert not is_complexity_error([{"message": "Not found"}])
+
+
+def test_rejected_page_is_retried_smaller(make_api):
+    def respond(operation, variables):
+        if variables["first"] > 100:
+            return TransportResponse(400, {}, {"errors": [{"message": "Too complex"}]})
+        return issues(3)
+
+    api = make_api(respond)
+    assert len(list(api.iter_issues())) == 3
+    sizes = [variables["first"] for _, variables in api.transport.calls]
+    assert sizes[-1] <= 100 and sizes == sorted(sizes, reverse=True)
+
+
+@pytest.fixture
+def recorded(monkeypatch):
+    """Complexity passed to every ``AdaptivePager.record`` call"""
+    calls = []
+    record = AdaptivePager.record
+
+    def spy(self, latency, returned, complexity=None):
+        calls.append(complexity)
+        record(self, latency, returned, complexity)
+
+    monkeypatch.setattr(AdaptivePager, "record", spy)
+    return calls
+
+
+def test_each_page_uses_its_own_reported_complexity(make_api, recorded):
+    pages = [(issues(2, more=True), "9000"), (issues(1), "10")]
+
+    def respond(operation, variables):
+        body, complexity = pages.pop(0)
+        return TransportResponse(200, {"x-complexity": complexity}, body)
+
+    api = make_api(respond)
+    list(api.iter_issues())
+    first, second = [variables["first"] for _, variables in api.transport.calls]
+    assert recorded == [9000, 10]
+    assert second == int(MAX_QUERY_COMPLEXITY * 0.8 // (9000 / first))
+
+
+def test_cached_pages_do_not_adjust_the_page_size(make_api, recorded):
+    api = make_api(
+        lambda *_: TransportResponse(200, {"x-complexity": "10"}, issues(2)),
+        cache_backend="memory",
+    )
+    list(api.iter_issues())
+    list(api.iter_issues())  # served from the cache, with ~0 latency
+    assert len(api.transport.calls) == 1
+    assert recorded == [10]
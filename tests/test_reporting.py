@@ -0,0 +1,42 @@
+"""
+Tests for the reporter's output modes
+"""
+
+import io
+import json
+
+from reporting import Reporter
+
+
+def lines(text):
+    return [json.loads(line) for line in text.splitlines()]
+
+
+def test_json_records_are_written_in_order():
+    stream = io.StringIO()
+    reporter = Reporter()
+    reporter.set_mode("json", stream)
+    for n in range(50):
+        reporter.info("step", f"Step {n}", n=n)
+    reporter.close()
+    records = lines(stream.getvalue())
+    assert [record["n"] for record in records] == list(range(50))
+    assert records[0]["event"] == "step" and records[0]["message"] == "Step 0"
+
+
+def test_emit_after_close_writes_to_stdout(capsys):
+    stream = io.StringIO()
+    reporter = Reporter()
+    reporter.set_mode("json", stream)
+    reporter.close()
+    reporter.error("late", "Reported at exit")
+    assert stream.getvalue() == ""
+    (record,) = lines(capsys.readouterr().out)
+    assert (record["level"], record["event"]) == ("error", "late")
+
+
+def test_quiet_mode_prints_only_problems(capsys):
+    reporter = Reporter("quiet")
+    reporter.info("step", "Step 1")
+    reporter.warning("slow", "Slow page")
+    assert capsys.readouterr().out.strip() == "Slow page"
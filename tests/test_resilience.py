@@ -0,0 +1,130 @@
+"""
+Tests for the circuit breakers and hedged reads of the Linear client
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from linear_api import GET_LABELS_QUERY
+from resilience import CircuitBreaker, CircuitOpenError, hedged_call
+from transport import TransportError, TransportResponse
+
+LABELS = {"data": {"team": {"labels": {"nodes": []}}}}
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+def test_breaker_opens_then_allows_one_probe():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert not breaker.allow()  # the probe is still in flight
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow() and breaker.allow()
+
+
+def test_failed_probe_reopens_the_circuit():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+
+def test_open_circuit_fails_fast(make_api):
+    def respond(operation, variables):
+        raise TransportError("down")
+
+    api = make_api(respond, breaker_threshold=2)
+    for _ in range(2):
+        with pytest.raises(TransportError):
+            api.get_labels()
+    with pytest.raises(CircuitOpenError):
+        api.get_labels()
+    assert len(api.transport.calls) == 2
+
+
+def test_unparseable_body_releases_the_probe(make_api):
+    class Garbled(TransportResponse):
+        def json(self):
+            raise ValueError("not JSON")
+
+    responses = [Garbled(200, {}, None), TransportResponse(200, {}, LABELS)]
+    api = make_api(lambda *_: responses.pop(0), breaker_threshold=1, breaker_reset=0)
+    with pytest.raises(ValueError):
+        api._make_request(GET_LABELS_QUERY, {"teamId": "team"})
+    result = api._make_request(GET_LABELS_QUERY, {"teamId": "team"})
+    assert result["data"] == LABELS["data"]
+
+
+def test_fast_first_attempt_sends_no_hedge(executor):
+    calls = []
+    assert hedged_call(lambda: calls.append(1) or "first", 0.02, executor) == "first"
+    time.sleep(0.05)
+    assert calls == [1]
+
+
+def test_first_attempt_runs_in_the_calling_thread(executor):
+    threads = []
+    hedged_call(lambda: threads.append(threading.get_ident()), 0.02, executor)
+    assert threads == [threading.get_ident()]
+
+
+def test_hedge_answers_when_slow_first_attempt_fails(executor):
+    attempts = iter(["first", "hedge"])
+
+    def fn():
+        if next(attempts) == "first":
+            time.sleep(0.1)
+            raise TransportError("timed out")
+        return "hedge"
+
+    assert hedged_call(fn, 0.02, executor) == "hedge"
+
+
+def test_error_raised_when_no_hedge_was_sent(executor):
+    calls = []
+
+    def fn():
+        calls.append(1)
+        raise TransportError("refused")
+
+    with pytest.raises(TransportError):
+        hedged_call(fn, 0.05, executor)
+    time.sleep(0.08)
+    assert calls == [1]
+
+
+def test_concurrent_reads_share_one_hedge_pool(make_api):
+    api = make_api(lambda *_: LABELS, hedge_reads=True, hedge_workers=3)
+    pools, labels = [], []
+    barrier = threading.Barrier(8)
+
+    def read():
+        barrier.wait()
+        pools.append(api._hedge_pool())
+        labels.append(api.get_labels())
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(map(id, pools))) == 1
+    assert pools[0]._max_workers == 3
+    assert labels == [[]] * 8
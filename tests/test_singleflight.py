@@ -0,0 +1,104 @@
+"""
+Tests for single-flight coalescing of identical concurrent reads
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from singleflight import AsyncSingleFlight, SingleFlight, request_key
+
+LABELS = {"data": {"team": {"labels": {"nodes": [{"id": "l1", "name": "Bug"}]}}}}
+
+
+def run_threads(count, target):
+    results = [None] * count
+
+    def run(index):
+        try:
+            results[index] = target()
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=run, args=(n,)) for n in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_burst_of_identical_calls_runs_once():
+    flight = SingleFlight()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"value": 1}
+
+    results = run_threads(8, lambda: flight.do("key", fn))
+    assert calls == [1]
+    assert all(result is results[0] for result in results)
+
+
+def test_error_reaches_every_waiter_and_is_not_kept():
+    flight = SingleFlight()
+    calls = []
+
+    def fail():
+        calls.append(1)
+        time.sleep(0.05)
+        raise RuntimeError("boom")
+
+    results = run_threads(4, lambda: flight.do("key", fail))
+    assert calls == [1]
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert flight.do("key", lambda: "retried") == "retried"
+
+
+def test_different_keys_run_separately():
+    flight = SingleFlight()
+    keys = iter(["a", "b"])
+    assert run_threads(2, lambda: flight.do(next(keys), lambda: 1)) == [1, 1]
+
+
+def test_request_key_ignores_variable_order():
+    assert request_key("GetIssues", {"a": 1, "b": 2}) == request_key(
+        "GetIssues", {"b": 2, "a": 1}
+    )
+    assert request_key("GetIssues") == request_key("GetIssues", {})
+
+
+def test_async_waiters_share_one_task():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return "labels"
+
+    async def main():
+        first = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()  # one waiter giving up does not cancel the others
+        results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(5)))
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return results
+
+    assert asyncio.run(main()) == ["labels"] * 5
+    assert calls == [1]
+
+
+def test_concurrent_get_labels_make_one_request(make_api):
+    def respond(operation, variables):
+        time.sleep(0.05)
+        return LABELS
+
+    api = make_api(respond)
+    results = run_threads(8, api.get_labels)
+    assert len(api.transport.calls) == 1
+    assert all(result == [{"id": "l1", "name": "Bug"}] for result in results)
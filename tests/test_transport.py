@@ -0,0 +1,96 @@
+"""
+Tests for the record/replay transports, driving the client from a cassette
+"""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+from linear_api import RoadmapManager
+from reporting import reporter
+from transport import (
+    CassetteMissError,
+    RecordingTransport,
+    ReplayTransport,
+    read_cassette,
+)
+
+CASSETTE = Path(__file__).parent / "cassettes" / "roadmap.jsonl"
+
+
+@pytest.fixture
+def cassette_api(make_api):
+    """A LinearAPI answered by ``cassettes/roadmap.jsonl``"""
+    return make_api(None, transport=ReplayTransport(str(CASSETTE)))
+
+
+@pytest.fixture
+def json_events():
+    """``json_events()``: the events reported so far, read from json output"""
+    stream = io.StringIO()
+    reporter.set_mode("json", stream)
+
+    def events():
+        reporter.set_mode("quiet")  # flushes the json writer
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    yield events
+    reporter.set_mode("quiet")
+
+
+def test_get_issues_from_cassette(cassette_api):
+    issues = cassette_api.get_issues(limit=100, as_models=True)
+    assert [issue.identifier for issue in issues] == ["ENG-1", "ENG-2", "ENG-3"]
+    assert issues[0].label_names == ("Python Fundamentals",)
+    assert [child["identifier"] for child in issues[0].children] == ["ENG-2"]
+
+
+def test_iter_issues_follows_cursors(cassette_api):
+    issues = list(cassette_api.iter_issues(page_size=2))
+    assert [issue["identifier"] for issue in issues] == ["ENG-1", "ENG-2", "ENG-3"]
+    assert issues[1]["parent"] == {"id": "i1"}
+
+
+def test_create_issue_from_cassette(cassette_api):
+    issue_id = cassette_api.create_issue(
+        "Control Structures",
+        "Master if/else statements and loops.",
+        label_ids=["l1"],
+        parent_id="i1",
+    )
+    assert issue_id == "i4"
+
+
+def test_unrecorded_request_is_a_miss(cassette_api):
+    with pytest.raises(CassetteMissError):
+        cassette_api.get_issues(limit=5)
+
+
+def test_display_roadmap_from_cassette(cassette_api, json_events):
+    RoadmapManager(cassette_api).display_roadmap()
+    rows = [event for event in json_events() if event["event"] == "roadmap.issue"]
+    assert [(row["identifier"], row["status"], row["children"]) for row in rows] == [
+        ("ENG-1", "In Progress", 1),
+        ("ENG-2", "Todo", 0),
+        ("ENG-3", "Backlog", 0),
+    ]
+
+
+def test_recorded_session_replays(make_api, tmp_path):
+    path = str(tmp_path / "session.jsonl")
+    recorder = RecordingTransport(
+        path, inner=ReplayTransport(str(CASSETTE)), team_id="team"
+    )
+    live = make_api(None, transport=recorder)
+    expected = list(live.iter_issues(page_size=2))
+    recorder.close()
+
+    team_id, interactions = read_cassette(path)
+    assert team_id == "team"
+    assert [interaction["operation"] for interaction in interactions] == [
+        "GetIssuesFlat",
+        "GetIssuesFlat",
+    ]
+    replayed = make_api(None, transport=ReplayTransport(path))
+    assert list(replayed.iter_issues(page_size=2)) == expected